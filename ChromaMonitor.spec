@@ -6,7 +6,17 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('assets', 'assets')],
-    hiddenimports=[],
+    # WGC 経路は実行時に遅延 import するため、winrt の投影モジュールを明示的に同梱する。
+    hiddenimports=[
+        'winrt.windows.foundation',
+        'winrt.windows.graphics',
+        'winrt.windows.graphics.capture',
+        'winrt.windows.graphics.capture.interop',
+        'winrt.windows.graphics.directx',
+        'winrt.windows.graphics.directx.direct3d11',
+        'winrt.windows.graphics.directx.direct3d11.interop',
+        'winrt.windows.graphics.imaging',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
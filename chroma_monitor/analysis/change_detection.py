@@ -7,43 +7,70 @@ import numpy as np
 
 from ..util.image_ops import resize_by_long_edge
 
+_HUE_DIFF_WEIGHT = 1.0
+_SAT_VAL_DIFF_WEIGHT = 0.5
+_OPENCV_HUE_PERIOD = 180
 
-def prepare_change_detection_channels(
+
+def _build_change_diff_lut() -> np.ndarray:
+    """HSV 差分の H チャネルだけ色相の周回を畳み込む 3ch LUT を作る。"""
+    diff = np.arange(256, dtype=np.int32)
+    lut = np.empty((1, 256, 3), dtype=np.uint8)
+    # H: min(d, 180 - d)。旧実装の uint8 減算と同じく 180 超は 8bit で折り返す。
+    lut[0, :, 0] = np.minimum(diff, (_OPENCV_HUE_PERIOD - diff) & 0xFF)
+    lut[0, :, 1] = diff
+    lut[0, :, 2] = diff
+    return lut
+
+
+_CHANGE_DIFF_LUT = _build_change_diff_lut()
+
+
+def prepare_change_detection_hsv(
     bgr: np.ndarray,
     *,
     detect_dim: int,
-) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
-    """差分判定用に縮小した HSV 各チャネルビューを返す。"""
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """差分判定用に縮小した HSV 画像を返す(可能なら `out` へ書き込む)。"""
     detect_bgr = resize_by_long_edge(bgr, int(detect_dim))
-    detect_hsv = cv2.cvtColor(detect_bgr, cv2.COLOR_BGR2HSV)
-    return detect_hsv[:, :, 0], detect_hsv[:, :, 1], detect_hsv[:, :, 2]
+    hsv_shape = detect_bgr.shape[:2] + (3,)
+    if out is None or out.shape != hsv_shape or out.dtype != detect_bgr.dtype:
+        return cv2.cvtColor(detect_bgr, cv2.COLOR_BGR2HSV)
+    return cv2.cvtColor(detect_bgr, cv2.COLOR_BGR2HSV, dst=out)
+
+
+def is_same_frame(curr: np.ndarray, prev: Optional[np.ndarray]) -> bool:
+    """2フレームが同一形状かつ全画素一致なら True を返す。"""
+    if prev is None or curr.shape != prev.shape or curr.dtype != prev.dtype:
+        return False
+    if curr.size == 0:
+        return True
+    # 最大差分を1パスで求める。差分画像やハッシュ用のバイト列コピーを作らない。
+    return float(cv2.norm(curr, prev, cv2.NORM_INF)) == 0.0
 
 
 def compute_change_metric(
-    dh: np.ndarray,
-    ds: np.ndarray,
-    dv: np.ndarray,
+    curr_hsv: np.ndarray,
     *,
-    prev_h: Optional[np.ndarray],
-    prev_s: Optional[np.ndarray],
-    prev_v: Optional[np.ndarray],
-    hue_wrap_buf: Optional[np.ndarray],
+    prev_hsv: Optional[np.ndarray],
+    diff_buf: Optional[np.ndarray],
 ) -> tuple[float, Optional[np.ndarray]]:
     """前回との差分量を1つのスカラー値へ集約し、再利用バッファも返す。"""
-    if prev_h is None or prev_s is None or prev_v is None:
-        return 0.0, hue_wrap_buf
-
-    hue_diff = cv2.absdiff(dh, prev_h)
-    hue_wrap = hue_wrap_buf
-    if hue_wrap is None or hue_wrap.shape != hue_diff.shape:
-        hue_wrap = np.empty_like(hue_diff)
-    np.subtract(180, hue_diff, out=hue_wrap, casting="unsafe")
-    np.minimum(hue_diff, hue_wrap, out=hue_diff)
-    sat_diff = cv2.absdiff(ds, prev_s)
-    val_diff = cv2.absdiff(dv, prev_v)
+    if prev_hsv is None:
+        return 0.0, diff_buf
+
+    pixel_count = int(curr_hsv.shape[0] * curr_hsv.shape[1])
+    if pixel_count <= 0:
+        return 0.0, diff_buf
+    if diff_buf is None or diff_buf.shape != curr_hsv.shape or diff_buf.dtype != np.uint8:
+        diff_buf = np.empty(curr_hsv.shape, dtype=np.uint8)
+    # 3ch のまま差分→色相周回補正→チャネル別総和を行い、チャネル毎の一時配列を作らない。
+    cv2.absdiff(curr_hsv, prev_hsv, dst=diff_buf)
+    cv2.LUT(diff_buf, _CHANGE_DIFF_LUT, dst=diff_buf)
+    hue_sum, sat_sum, val_sum, _ = cv2.sumElems(diff_buf)
+    # 各チャネルは整数和だけ取り、平均化と重み付けは最後に1回でまとめる。
     metric = (
-        float(cv2.mean(hue_diff)[0])
-        + float(cv2.mean(sat_diff)[0]) * 0.5
-        + float(cv2.mean(val_diff)[0]) * 0.5
-    )
-    return metric, hue_wrap
+        float(hue_sum) * _HUE_DIFF_WEIGHT + (float(sat_sum) + float(val_sum)) * _SAT_VAL_DIFF_WEIGHT
+    ) / pixel_count
+    return metric, diff_buf
@@ -11,7 +11,11 @@ from .result_payloads import AnalyzerResultPayload
 from .scatter_sampling import sample_sv_and_rgb
 from .top_color_bars import TopColorBar, compute_top_bars_from_prepared
 from ..util import constants as C
-from ..util.image_ops import resize_by_long_edge
+from ..util.image_ops import (
+    interleaved_channel_source,
+    resize_by_long_edge,
+    thread_scratch_buffer,
+)
 from ..util.value_utils import clamp_int
 
 _BGR_CHANNEL_COUNT = 3
@@ -24,6 +28,10 @@ _WARM_HUE_LOW_END = 45
 _WARM_HUE_HIGH_START = 150
 _COOL_HUE_START = 60
 _COOL_HUE_END = 135
+_HUE_CLASS_WARM = 0
+_HUE_CLASS_COOL = 1
+_HUE_CLASS_OTHER = 2
+_HUE_CLASS_COUNT = 3
 _ANALYZE_STEP_CONVERT_HSV = (15, "HSVへ変換中…")
 _ANALYZE_STEP_WHEEL_HIST = (30, "色相ヒストグラム集計中…")
 _ANALYZE_STEP_SCATTER = (45, "散布図サンプル生成中…")
@@ -33,6 +41,18 @@ ProgressCb: TypeAlias = Optional[Callable[[int, str], None]]
 CancelCb: TypeAlias = Optional[Callable[[], bool]]
 
 
+def _build_hue_class_lut() -> np.ndarray:
+    """OpenCV 色相(0..179)ごとの暖色/寒色/その他分類表を作る。"""
+    lut = np.full(_OPENCV_HUE_BINS, _HUE_CLASS_OTHER, dtype=np.intp)
+    lut[:_WARM_HUE_LOW_END] = _HUE_CLASS_WARM
+    lut[_WARM_HUE_HIGH_START:] = _HUE_CLASS_WARM
+    lut[_COOL_HUE_START:_COOL_HUE_END] = _HUE_CLASS_COOL
+    return lut
+
+
+_HUE_CLASS_LUT = _build_hue_class_lut()
+
+
 @dataclass(frozen=True, slots=True)
 class PreparedAnalysisFrame:
     """解析用に前処理済みの BGR/HSV 各チャネル。"""
@@ -96,11 +116,19 @@ def _normalize_bgr_to_float01(bgr: np.ndarray) -> np.ndarray:
 
 def prepare_hsv8_and_bgr8(
     bgr: np.ndarray,
+    *,
+    hsv_dst: np.ndarray | None = None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    """入力画像から `uint8` の BGR/H/S/V を揃えて返す。"""
+    """入力画像から `uint8` の BGR/H/S/V を揃えて返す。
+
+    `hsv_dst` を渡すと uint8 入力の HSV 変換結果をその配列へ書き込む。
+    """
     arr = np.asarray(bgr)
     if arr.dtype == np.uint8:
-        hsv = cv2.cvtColor(arr, cv2.COLOR_BGR2HSV)
+        if hsv_dst is not None and hsv_dst.shape == arr.shape and hsv_dst.dtype == np.uint8:
+            hsv = cv2.cvtColor(arr, cv2.COLOR_BGR2HSV, dst=hsv_dst)
+        else:
+            hsv = cv2.cvtColor(arr, cv2.COLOR_BGR2HSV)
         # split はチャネルごとの配列コピーが発生するため、ビュー参照で取り出す。
         h = hsv[:, :, 0]
         s = hsv[:, :, 1]
@@ -128,17 +156,25 @@ def compute_hsv_histograms(
     v: np.ndarray,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
     """H/S/V のヒストグラムを集計する。"""
+    # チャネルビュー(非連続)を calcHist へ渡すと都度コピーされるため、
+    # 親の 3ch 配列が分かる場合はチャネル番号指定で直接集計する。
+    hsv = interleaved_channel_source(h, s, v)
+    if hsv is not None:
+        sources = ((hsv, 0), (hsv, 1), (hsv, 2))
+    else:
+        sources = ((h, 0), (s, 0), (v, 0))
+    (h_src, h_ch), (s_src, s_ch), (v_src, v_ch) = sources
     # Hヒストグラムは従来どおり色相未定義(S=0)を除外する。
     h_mask = cv2.compare(s, 0, cv2.CMP_GT)
     h_hist = (
-        cv2.calcHist([h], [0], h_mask, [_OPENCV_HUE_BINS], [0, _OPENCV_HUE_BINS])
+        cv2.calcHist([h_src], [h_ch], h_mask, [_OPENCV_HUE_BINS], [0, _OPENCV_HUE_BINS])
         .reshape(_OPENCV_HUE_BINS)
         .astype(np.int64)
     )
-    s_hist = cv2.calcHist([s], [0], None, [_UINT8_BINS], [0, _UINT8_BINS]).reshape(
+    s_hist = cv2.calcHist([s_src], [s_ch], None, [_UINT8_BINS], [0, _UINT8_BINS]).reshape(
         _UINT8_BINS
     ).astype(np.int64)
-    v_hist = cv2.calcHist([v], [0], None, [_UINT8_BINS], [0, _UINT8_BINS]).reshape(
+    v_hist = cv2.calcHist([v_src], [v_ch], None, [_UINT8_BINS], [0, _UINT8_BINS]).reshape(
         _UINT8_BINS
     ).astype(np.int64)
     return h_hist, s_hist, v_hist
@@ -157,18 +193,24 @@ def compute_wheel_stats_from_hs(
     sat_th = clamp_int(sat_threshold, C.WHEEL_SAT_THRESHOLD_MIN, C.WHEEL_SAT_THRESHOLD_MAX)
     if sat_th <= C.WHEEL_SAT_THRESHOLD_MIN:
         mask = None
-        total_color = float(h.size)
     else:
-        mask = cv2.compare(s, int(sat_th) - 1, cv2.CMP_GT)
-        total_color = float(cv2.countNonZero(mask))
-        if total_color <= 0.0:
-            return np.zeros(180, dtype=np.int64), 0.0, 0.0, 0.0
+        # マスクは集計内でしか使わないため、スレッド専用の作業配列へ書き込む。
+        mask = cv2.compare(
+            s,
+            int(sat_th) - 1,
+            cv2.CMP_GT,
+            dst=thread_scratch_buffer("wheel_sat_mask", s.shape, np.uint8),
+        )
 
     hist_raw = cv2.calcHist([h], [0], mask, [180], [0, 180]).reshape(180).astype(np.int64)
-    warm_count = float(
-        hist_raw[:_WARM_HUE_LOW_END].sum() + hist_raw[_WARM_HUE_HIGH_START:180].sum()
-    )
-    cool_count = float(hist_raw[_COOL_HUE_START:_COOL_HUE_END].sum())
+    # H は 0..179 に収まるため、対象画素数はマスクを再走査せずヒストグラム総和から得る。
+    total_color = float(hist_raw.sum())
+    if total_color <= 0.0:
+        return np.zeros(180, dtype=np.int64), 0.0, 0.0, 0.0
+    # 色相ごとの分類表で 180 bin を暖色/寒色/その他へ1回で畳み込む。
+    class_counts = np.bincount(_HUE_CLASS_LUT, weights=hist_raw, minlength=_HUE_CLASS_COUNT)
+    warm_count = float(class_counts[_HUE_CLASS_WARM])
+    cool_count = float(class_counts[_HUE_CLASS_COOL])
     other_count = max(0.0, total_color - warm_count - cool_count)
     return (
         hist_raw,
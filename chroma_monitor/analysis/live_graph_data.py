@@ -1,11 +1,16 @@
 """ライブ解析ワーカーから分離した graph/result 組み立て補助。"""
 
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import Optional
 
+import cv2
 import numpy as np
 
-from .result_payloads import AnalyzerResultPayload, GraphDataPayload
+from .result_payloads import AnalyzerResult, GraphDataPayload
 from .frame_analysis import (
     compute_hsv_histograms,
     compute_wheel_stats_from_hs,
@@ -15,7 +20,26 @@ from .frame_analysis import (
     sample_sv_and_rgb,
 )
 from ..util import constants as C
-from ..util.image_ops import resize_by_long_edge
+from ..util.image_ops import (
+    interleaved_channel_source,
+    resize_by_long_edge,
+    thread_scratch_buffer,
+)
+
+# ビュー別の解析要求ビット。ループ毎の判定を整数のビット演算だけで済ませる。
+VIEW_FLAG_COLOR = 1 << 0
+VIEW_FLAG_COLOR_BAND = 1 << 1
+VIEW_FLAG_SCATTER = 1 << 2
+VIEW_FLAG_HSV_HIST = 1 << 3
+VIEW_FLAG_IMAGE = 1 << 4
+VIEW_FLAG_PREVIEW = 1 << 5
+VIEW_FLAGS_GRAPH = VIEW_FLAG_COLOR | VIEW_FLAG_COLOR_BAND | VIEW_FLAG_SCATTER | VIEW_FLAG_HSV_HIST
+VIEW_FLAGS_BGR_EMIT = VIEW_FLAG_IMAGE | VIEW_FLAG_PREVIEW
+VIEW_FLAGS_DEFAULT = VIEW_FLAGS_GRAPH | VIEW_FLAG_IMAGE
+
+_GRAPH_POOL_MAX_WORKERS = 3
+# コア数の少ない環境ではスレッド切替の負けが目立つため、4コアあたり1ワーカーに抑える。
+_GRAPH_POOL_WORKERS = min(_GRAPH_POOL_MAX_WORKERS, (os.cpu_count() or 1) // 4)
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,10 +57,24 @@ def extract_hsv_channels(
     *,
     enabled: bool,
 ) -> tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
-    """必要時のみ HSV を生成し、チャネルビューを返す。"""
+    """必要時のみ HSV を生成し、チャネルごとの連続平面を返す。"""
     if not enabled:
         return None, None, None
-    _bgr_u8, h, s, v = prepare_hsv8_and_bgr8(bgr)
+    # HSV はグラフ集計の中でだけ読み、結果へはコピー/集計値しか残らないため作業配列を使い回す。
+    hsv_dst = None
+    if bgr.ndim == 3 and bgr.shape[2] == 3:
+        hsv_dst = thread_scratch_buffer("graph_hsv", bgr.shape, np.uint8)
+    _bgr_u8, h, s, v = prepare_hsv8_and_bgr8(bgr, hsv_dst=hsv_dst)
+    hsv = interleaved_channel_source(h, s, v)
+    if hsv is None:
+        return h, s, v
+    # 3ch 間隔のチャネルビューのままだと calcHist/compare/LUT が都度コピーや非連続走査になるため、
+    # 1回の split で連続平面へ分けてから各集計へ渡す。
+    planes = [
+        thread_scratch_buffer(name, hsv.shape[:2], np.uint8)
+        for name in ("graph_h_plane", "graph_s_plane", "graph_v_plane")
+    ]
+    h, s, v = cv2.split(hsv, mv=planes)
     return h, s, v
 
 
@@ -107,46 +145,82 @@ def optional_top_colors(
     )
 
 
+@lru_cache(maxsize=1)
+def _graph_pool() -> Optional[ThreadPoolExecutor]:
+    """グラフ計算の並行実行に使うスレッドプールを返す。並列化しない環境では None。"""
+    if _GRAPH_POOL_WORKERS < 1:
+        return None
+    return ThreadPoolExecutor(
+        max_workers=_GRAPH_POOL_WORKERS,
+        thread_name_prefix="graph-data",
+    )
+
+
+def _run_graph_tasks(tasks: dict[str, Callable[[], object]]) -> dict[str, object]:
+    """互いに独立したグラフ計算を実行し、名前ごとの結果を返す。"""
+    pool = _graph_pool() if len(tasks) > 1 else None
+    if pool is None:
+        return {name: task() for name, task in tasks.items()}
+    # cv2/numpy の処理中は GIL が外れるため、最後の1件は呼び出し側で並行して進める。
+    *pooled_names, inline_name = tasks
+    futures = {name: pool.submit(tasks[name]) for name in pooled_names}
+    results: dict[str, object] = {inline_name: tasks[inline_name]()}
+    for name, future in futures.items():
+        results[name] = future.result()
+    return results
+
+
 def collect_graph_data(
     bgr: np.ndarray,
     cfg,
     *,
-    need_color: bool,
-    need_color_band: bool,
-    need_scatter: bool,
-    need_hsv_hist: bool,
+    view_flags: int,
 ) -> GraphDataPayload:
     """現在フレームから要求されたグラフ項目だけを計算する。"""
+    flags = int(view_flags)
+    need_color = bool(flags & VIEW_FLAG_COLOR)
+    need_color_band = bool(flags & VIEW_FLAG_COLOR_BAND)
+    need_scatter = bool(flags & VIEW_FLAG_SCATTER)
+    need_hsv_hist = bool(flags & VIEW_FLAG_HSV_HIST)
     bgr_small = resize_by_long_edge(bgr, cfg.max_dim)
-    need_hsv_channels = need_hsv_hist or need_color or need_scatter or need_color_band
-    h, s, v = extract_hsv_channels(bgr_small, enabled=need_hsv_channels)
-    h_hist, s_hist, v_hist = optional_hsv_histograms(
-        enabled=need_hsv_hist,
-        h=h,
-        s=s,
-        v=v,
-    )
-    hist, warm_ratio, cool_ratio, other_ratio = optional_wheel_stats(
-        enabled=need_color,
-        h=h,
-        s=s,
-        wheel_sat_threshold=int(cfg.wheel_sat_threshold),
-    )
-    sv, rgb = optional_scatter_samples(
-        enabled=need_scatter,
-        h=h,
-        s=s,
-        v=v,
-        bgr=bgr_small,
-        sample_points=int(cfg.sample_points),
-    )
-    top_colors = optional_top_colors(
-        enabled=need_color_band,
-        bgr=bgr_small,
-        h=h,
-        s=s,
-        color_band_sat_threshold=int(cfg.color_band_sat_threshold),
-    )
+    h, s, v = extract_hsv_channels(bgr_small, enabled=bool(flags & VIEW_FLAGS_GRAPH))
+    # 各ビューの集計は HSV を読むだけで互いに独立しているため、要求分をまとめて実行する。
+    # 最も重い配色比率を最後に置き、複数要求時は呼び出しスレッド側で担当させる。
+    tasks: dict[str, Callable[[], object]] = {}
+    if need_hsv_hist:
+        tasks["hsv_hist"] = partial(optional_hsv_histograms, enabled=True, h=h, s=s, v=v)
+    if need_color:
+        tasks["wheel"] = partial(
+            optional_wheel_stats,
+            enabled=True,
+            h=h,
+            s=s,
+            wheel_sat_threshold=int(cfg.wheel_sat_threshold),
+        )
+    if need_scatter:
+        tasks["scatter"] = partial(
+            optional_scatter_samples,
+            enabled=True,
+            h=h,
+            s=s,
+            v=v,
+            bgr=bgr_small,
+            sample_points=int(cfg.sample_points),
+        )
+    if need_color_band:
+        tasks["top_colors"] = partial(
+            optional_top_colors,
+            enabled=True,
+            bgr=bgr_small,
+            h=h,
+            s=s,
+            color_band_sat_threshold=int(cfg.color_band_sat_threshold),
+        )
+    results = _run_graph_tasks(tasks)
+    h_hist, s_hist, v_hist = results.get("hsv_hist", (None, None, None))
+    hist, warm_ratio, cool_ratio, other_ratio = results.get("wheel", (None, 0.0, 0.0, 0.0))
+    sv, rgb = results.get("scatter", (None, None))
+    top_colors = results.get("top_colors")
 
     return {
         "hist": hist,
@@ -162,22 +236,11 @@ def collect_graph_data(
     }
 
 
-def view_requirements(cfg) -> tuple[bool, bool, bool, bool, bool, bool]:
-    """現在設定からビュー更新要件フラグを返す。"""
-    need_color = cfg.view_color
-    need_color_band = cfg.view_color_band
-    need_scatter = cfg.view_scatter
-    need_hsv_hist = cfg.view_hsv_hist
-    need_graph_data = need_color or need_color_band or need_scatter or need_hsv_hist
-    need_bgr_emit = cfg.view_image or cfg.want_preview
-    return (
-        need_color,
-        need_color_band,
-        need_scatter,
-        need_hsv_hist,
-        need_graph_data,
-        need_bgr_emit,
-    )
+def view_requirements(view_flags: int) -> tuple[int, bool, bool]:
+    """ビュー要求ビットから graph 計算ビットと更新要件フラグを返す。"""
+    flags = int(view_flags)
+    graph_flags = flags & VIEW_FLAGS_GRAPH
+    return graph_flags, graph_flags != 0, (flags & VIEW_FLAGS_BGR_EMIT) != 0
 
 
 def build_result_payload(
@@ -188,24 +251,32 @@ def build_result_payload(
     graph_update: bool,
     need_bgr_emit: bool,
     dt_ms: float,
-) -> AnalyzerResultPayload:
-    """UI通知用ペイロードを組み立てる。"""
-    return {
-        "bgr_preview": bgr if need_bgr_emit else None,
-        "hist": graph_data["hist"] if graph_update else None,
-        "sv": graph_data["sv"] if graph_update else None,
-        "rgb": graph_data["rgb"] if graph_update else None,
-        "h_plane": None,
-        "s_plane": None,
-        "v_plane": None,
-        "h_hist": graph_data["h_hist"] if graph_update else None,
-        "s_hist": graph_data["s_hist"] if graph_update else None,
-        "v_hist": graph_data["v_hist"] if graph_update else None,
-        "top_colors": graph_data["top_colors"] if graph_update else None,
-        "warm_ratio": graph_data["warm_ratio"],
-        "cool_ratio": graph_data["cool_ratio"],
-        "other_ratio": graph_data["other_ratio"],
-        "dt_ms": float(dt_ms),
-        "cap": (cap.left(), cap.top(), cap.width(), cap.height()),
-        "graph_update": bool(graph_update),
-    }
+) -> AnalyzerResult:
+    """UI通知用の解析結果を組み立てる。"""
+    cap_rect = (cap.left(), cap.top(), cap.width(), cap.height())
+    bgr_preview = bgr if need_bgr_emit else None
+    if not graph_update:
+        return AnalyzerResult(
+            bgr_preview=bgr_preview,
+            warm_ratio=graph_data["warm_ratio"],
+            cool_ratio=graph_data["cool_ratio"],
+            other_ratio=graph_data["other_ratio"],
+            dt_ms=float(dt_ms),
+            cap=cap_rect,
+        )
+    return AnalyzerResult(
+        bgr_preview=bgr_preview,
+        hist=graph_data["hist"],
+        sv=graph_data["sv"],
+        rgb=graph_data["rgb"],
+        h_hist=graph_data["h_hist"],
+        s_hist=graph_data["s_hist"],
+        v_hist=graph_data["v_hist"],
+        top_colors=graph_data["top_colors"],
+        warm_ratio=graph_data["warm_ratio"],
+        cool_ratio=graph_data["cool_ratio"],
+        other_ratio=graph_data["other_ratio"],
+        dt_ms=float(dt_ms),
+        cap=cap_rect,
+        graph_update=True,
+    )
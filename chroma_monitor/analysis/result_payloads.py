@@ -1,6 +1,8 @@
 """解析系モジュール間で共有する payload 契約。"""
 
-from typing import Optional, TypeAlias, TypedDict
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Optional, TypeAlias, TypedDict
 
 import numpy as np
 
@@ -49,3 +51,37 @@ class ResultFramePayload(TypedDict):
 
 class AnalyzerResultPayload(ResultFramePayload):
     """UI 通知へ流す解析結果ペイロード。"""
+
+
+@dataclass(frozen=True, slots=True)
+class AnalyzerResult:
+    """UI 通知へ流す解析結果。毎フレームの辞書構築を避けるため固定スロットで保持する。"""
+
+    bgr_preview: Optional[np.ndarray] = None
+    hist: Optional[np.ndarray] = None
+    sv: Optional[np.ndarray] = None
+    rgb: Optional[np.ndarray] = None
+    h_plane: Optional[np.ndarray] = None
+    s_plane: Optional[np.ndarray] = None
+    v_plane: Optional[np.ndarray] = None
+    h_hist: Optional[np.ndarray] = None
+    s_hist: Optional[np.ndarray] = None
+    v_hist: Optional[np.ndarray] = None
+    top_colors: TopColorsPayload = None
+    warm_ratio: float = 0.0
+    cool_ratio: float = 0.0
+    other_ratio: float = 0.0
+    # None は「計測値なし」を表し、スナップショット側の前回値を保持する。
+    dt_ms: Optional[float] = None
+    cap: CaptureRectPayload = None
+    graph_update: bool = False
+
+    @classmethod
+    def from_payload(cls, payload: Mapping[str, Any], **overrides) -> "AnalyzerResult":
+        """辞書形式の解析結果から必要なキーだけ拾って生成する。"""
+        values = {name: payload[name] for name in _ANALYZER_RESULT_FIELDS if name in payload}
+        values.update(overrides)
+        return cls(**values)
+
+
+_ANALYZER_RESULT_FIELDS = tuple(field.name for field in fields(AnalyzerResult))
@@ -2,9 +2,11 @@
 
 import threading
 
+import cv2
 import numpy as np
 
-_SAMPLE_RGB_DIRECT_GATHER_THRESHOLD = 180_000
+from ..util.image_ops import interleaved_channel_source
+
 _RNG_LOCAL = threading.local()
 
 
@@ -35,28 +37,20 @@ def _gather_hsv_by_indices(
 def _gather_rgb_from_bgr_indices(bgr_flat: np.ndarray, idx: np.ndarray) -> np.ndarray:
     """平坦化済み BGR からインデックス指定で RGB サンプルを集める。"""
     k = int(idx.size)
-    rgb = np.empty((k, 3), dtype=np.uint8)
-    if k >= _SAMPLE_RGB_DIRECT_GATHER_THRESHOLD:
-        np.take(bgr_flat[:, 2], idx, out=rgb[:, 0])
-        np.take(bgr_flat[:, 1], idx, out=rgb[:, 1])
-        np.take(bgr_flat[:, 0], idx, out=rgb[:, 2])
-        return rgb
-
+    # 列ビュー(非連続)への np.take は列全体を一度コピーするため、画素単位で連続取得する。
     bgr_sel = np.empty((k, 3), dtype=np.uint8)
     np.take(bgr_flat, idx, axis=0, out=bgr_sel)
-    rgb[:, 0] = bgr_sel[:, 2]
-    rgb[:, 1] = bgr_sel[:, 1]
-    rgb[:, 2] = bgr_sel[:, 0]
-    return rgb
+    return _convert_bgr_flat_to_rgb(bgr_sel)
 
 
 def _convert_bgr_flat_to_rgb(bgr_flat: np.ndarray) -> np.ndarray:
     """平坦化済み BGR 配列を同サイズの RGB 配列へ変換する。"""
-    rgb = np.empty_like(bgr_flat)
-    rgb[:, 0] = bgr_flat[:, 2]
-    rgb[:, 1] = bgr_flat[:, 1]
-    rgb[:, 2] = bgr_flat[:, 0]
-    return rgb
+    if bgr_flat.size == 0:
+        # 空 ROI では cvtColor が入力検証で例外を投げるため、空配列をそのまま返す。
+        return np.empty((0, 3), dtype=np.uint8)
+    # チャネル入れ替えは OpenCV の1パスで行い、列ごとの strided 代入を避ける。
+    rgb = cv2.cvtColor(bgr_flat.reshape(-1, 1, 3), cv2.COLOR_BGR2RGB)
+    return rgb.reshape(-1, 3)
 
 
 def sample_sv_and_rgb(
@@ -67,6 +61,8 @@ def sample_sv_and_rgb(
     sample_points: int,
 ) -> tuple[np.ndarray, np.ndarray]:
     """散布図表示用に HSV/RGB のサンプル点列を生成する。"""
+    # H/S/V が同一 HSV 画像のチャネルビューなら、画素単位の1回の take で3ch をまとめて集める。
+    hsv_src = interleaved_channel_source(h, s, v)
     flat_h = h.reshape(-1)
     flat_s = s.reshape(-1)
     flat_v = v.reshape(-1)
@@ -76,10 +72,15 @@ def sample_sv_and_rgb(
     bgr_flat = bgr.reshape(-1, 3)
     if k < n:
         idx = _thread_local_rng().integers(0, n, size=k, dtype=np.int32)
-        hsv = _gather_hsv_by_indices(flat_h, flat_s, flat_v, idx)
+        if hsv_src is not None:
+            hsv = np.take(hsv_src.reshape(-1, 3), idx, axis=0)
+        else:
+            hsv = _gather_hsv_by_indices(flat_h, flat_s, flat_v, idx)
         rgb = _gather_rgb_from_bgr_indices(bgr_flat, idx)
         return hsv, rgb
 
+    if hsv_src is not None:
+        return hsv_src.reshape(-1, 3).copy(), _convert_bgr_flat_to_rgb(bgr_flat)
     hsv = np.empty((n, 3), dtype=np.uint8)
     hsv[:, 0] = flat_h
     hsv[:, 1] = flat_s
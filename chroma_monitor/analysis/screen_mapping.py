@@ -1,6 +1,7 @@
 """Qt 論理座標と mss/Win32 物理座標の対応付けヘルパー。"""
 
 import mss
+import numpy as np
 from PySide6.QtCore import QPoint, QRect
 from PySide6.QtGui import QGuiApplication
 
@@ -59,34 +60,57 @@ def monitor_match_pairs(
     m_bounds: tuple[float, float, float, float],
 ) -> list[tuple[float, int, int]]:
     """Qt画面と実モニタの対応候補スコア一覧を作る。"""
+    if not qt_infos or not native_monitors:
+        return []
     q_left, q_top, q_w, q_h = q_bounds
     m_left, m_top, m_w, m_h = m_bounds
-    pairs: list[tuple[float, int, int]] = []
-    for qi, q in enumerate(qt_infos):
-        qrect = q["rect"]
-        qw = max(1.0, float(qrect.width()))
-        qh = max(1.0, float(qrect.height()))
-        qcx = qrect.left() + qw * 0.5
-        qcy = qrect.top() + qh * 0.5
-        qx_norm = (qcx - q_left) / q_w
-        qy_norm = (qcy - q_top) / q_h
-        for mi, mon in enumerate(native_monitors):
-            sx = float(mon["width"]) / qw
-            sy = float(mon["height"]) / qh
-            mcx = mon["left"] + mon["width"] * 0.5
-            mcy = mon["top"] + mon["height"] * 0.5
-            mx_norm = (mcx - m_left) / m_w
-            my_norm = (mcy - m_top) / m_h
-            score = (
-                abs(sx - sy) * 300.0
-                + abs(sx - q["dpr"]) * 80.0
-                + abs(sy - q["dpr"]) * 80.0
-                + abs(qx_norm - mx_norm) * 60.0
-                + abs(qy_norm - my_norm) * 60.0
+    # Q x M の総当たりは行列演算でまとめて評価し、ペアごとの Python ループを避ける。
+    q_rect = np.array(
+        [
+            (
+                float(q["rect"].left()),
+                float(q["rect"].top()),
+                float(q["rect"].width()),
+                float(q["rect"].height()),
             )
-            pairs.append((score, qi, mi))
-    pairs.sort(key=lambda x: x[0])
-    return pairs
+            for q in qt_infos
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+    q_dpr = np.array([float(q["dpr"]) for q in qt_infos], dtype=np.float64)
+    m_rect = np.array(
+        [
+            (float(m["left"]), float(m["top"]), float(m["width"]), float(m["height"]))
+            for m in native_monitors
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+
+    qw = np.maximum(1.0, q_rect[:, 2])
+    qh = np.maximum(1.0, q_rect[:, 3])
+    qx_norm = (q_rect[:, 0] + qw * 0.5 - q_left) / q_w
+    qy_norm = (q_rect[:, 1] + qh * 0.5 - q_top) / q_h
+    mx_norm = (m_rect[:, 0] + m_rect[:, 2] * 0.5 - m_left) / m_w
+    my_norm = (m_rect[:, 1] + m_rect[:, 3] * 0.5 - m_top) / m_h
+
+    sx = m_rect[None, :, 2] / qw[:, None]
+    sy = m_rect[None, :, 3] / qh[:, None]
+    dpr = q_dpr[:, None]
+    score = (
+        np.abs(sx - sy) * 300.0
+        + np.abs(sx - dpr) * 80.0
+        + np.abs(sy - dpr) * 80.0
+        + np.abs(qx_norm[:, None] - mx_norm[None, :]) * 60.0
+        + np.abs(qy_norm[:, None] - my_norm[None, :]) * 60.0
+    )
+    # 同点時は従来の (qi, mi) 走査順を保つため stable sort を使う。
+    order = np.argsort(score, axis=None, kind="stable")
+    q_idx, m_idx = np.unravel_index(order, score.shape)
+    flat_score = score.reshape(-1)[order]
+    return [
+        (float(sc), int(qi), int(mi))
+        for sc, qi, mi in zip(flat_score.tolist(), q_idx.tolist(), m_idx.tolist())
+    ]
 
 
 def resolve_monitor_mapping(
@@ -9,6 +9,8 @@ from ..util.color_utils import HUE_NAME_12
 TopColorBar = tuple[str, float, tuple[int, int, int]]
 _TOP_COLOR_MEDOID_CANDIDATE_LIMIT = 64
 _TOP_COLOR_MEDOID_MAX_PIXELS_PER_SEGMENT = 120_000
+# RGB 各 5bit を詰めた 15bit 色コードの総数。
+_TOP_COLOR_MEDOID_CODE_BINS = 1 << 15
 
 
 def _medoid_rgb_from_pixels(rgb_pixels: np.ndarray) -> tuple[int, int, int]:
@@ -19,16 +21,21 @@ def _medoid_rgb_from_pixels(rgb_pixels: np.ndarray) -> tuple[int, int, int]:
     if arr.shape[0] == 1:
         return (int(arr[0, 0]), int(arr[0, 1]), int(arr[0, 2]))
 
-    q = np.right_shift(arr.astype(np.uint16), 3)
+    q = np.right_shift(arr[:, :3], 3).astype(np.uint16)
     packed = (q[:, 0] << 10) | (q[:, 1] << 5) | q[:, 2]
-    unique_codes, counts = np.unique(packed, return_counts=True)
+    # 色コードは 15bit に収まるため、ソートを伴う np.unique ではなく bincount で数える。
+    # flatnonzero の結果は昇順なので np.unique と同じ並びになる。
+    code_counts = np.bincount(packed, minlength=_TOP_COLOR_MEDOID_CODE_BINS)
+    unique_codes = np.flatnonzero(code_counts)
+    counts = code_counts[unique_codes]
     if unique_codes.size <= 0:
         return (int(arr[0, 0]), int(arr[0, 1]), int(arr[0, 2]))
 
-    ur = np.right_shift(unique_codes, 10) & 31
-    ug = np.right_shift(unique_codes, 5) & 31
-    ub = unique_codes & 31
-    all_centers = np.stack([ur, ug, ub], axis=1).astype(np.int16) * 8 + 4
+    all_centers = np.empty((unique_codes.size, 3), dtype=np.int32)
+    all_centers[:, 0] = np.right_shift(unique_codes, 10) & 31
+    all_centers[:, 1] = np.right_shift(unique_codes, 5) & 31
+    all_centers[:, 2] = unique_codes & 31
+    all_centers = all_centers * 8 + 4
     all_weights = counts.astype(np.int32)
 
     candidate_count = min(int(_TOP_COLOR_MEDOID_CANDIDATE_LIMIT), int(unique_codes.size))
@@ -38,7 +45,13 @@ def _medoid_rgb_from_pixels(rgb_pixels: np.ndarray) -> tuple[int, int, int]:
         candidate_idx = np.arange(unique_codes.size, dtype=np.int32)
     cand_centers = all_centers[candidate_idx]
 
-    diff = np.abs(cand_centers[:, None, :] - all_centers[None, :, :]).sum(axis=2, dtype=np.int32)
+    # 候補×全色の L1 距離はチャネルごとに加算し、3次元の一時配列と軸方向 reduce を避ける。
+    diff = np.zeros((candidate_idx.size, unique_codes.size), dtype=np.int32)
+    channel_diff = np.empty_like(diff)
+    for ch in range(3):
+        np.subtract(cand_centers[:, ch, None], all_centers[None, :, ch], out=channel_diff)
+        np.abs(channel_diff, out=channel_diff)
+        diff += channel_diff
     scores = diff @ all_weights
     best_local = int(np.argmin(scores))
     best_idx = int(candidate_idx[best_local])
@@ -127,6 +140,17 @@ def _segment_hue_to_12bin(h_u16: np.ndarray) -> np.ndarray:
     return (((h_u16 * 2) // 30) % 12).astype(np.uint8, copy=False)
 
 
+# uint8 の Hue 全値に対する 12 区分インデックス表。画素ごとの演算を表引き1回に置き換える。
+_HUE_TO_12BIN_LUT = _segment_hue_to_12bin(np.arange(256, dtype=np.uint16))
+_ACHROMATIC_BIN = 12
+_EXCLUDED_BIN = 255
+
+
+def _segment_hue_to_12bin_lut(h_flat: np.ndarray) -> np.ndarray:
+    """uint8 Hue 配列全体を LUT で 12 区分インデックスへ変換する。"""
+    return np.take(_HUE_TO_12BIN_LUT, h_flat)
+
+
 def compute_top_bars_from_prepared(
     *,
     bgr_u8: np.ndarray,
@@ -150,37 +174,31 @@ def compute_top_bars_from_prepared(
     sat_th = int(max(0, min(255, int(sat_threshold))))
     max_count = max(1, int(top_count))
 
+    # 彩度マスクで画素を詰め直さず、全画素の区分表に対象外ビンを書き込んで集計する。
+    seg = _segment_hue_to_12bin_lut(h_flat)
     if sat_th <= 0:
-        achro_bin = 12
-        seg = np.full(h_flat.shape, achro_bin, dtype=np.uint8)
-        chroma_mask = s_flat > 0
-        h_chroma = h_flat[chroma_mask].astype(np.uint16, copy=False)
-        seg[chroma_mask] = _segment_hue_to_12bin(h_chroma)
+        np.copyto(seg, _ACHROMATIC_BIN, where=s_flat == 0)
         counts = np.bincount(seg, minlength=13)[:13]
         return _build_top_color_bars(
             counts=counts,
             seg=seg,
             rgb_source=rgb_all,
             max_count=max_count,
-            label_for_idx=lambda idx, achro=achro_bin: (
+            label_for_idx=lambda idx, achro=_ACHROMATIC_BIN: (
                 "無彩色"
                 if int(idx) == int(achro)
                 else HUE_NAME_12[int(idx) % len(HUE_NAME_12)]
             ),
         )
 
-    chroma_mask = s_flat >= sat_th
-    if not np.any(chroma_mask):
-        return []
-
-    h_chroma = h_flat[chroma_mask].astype(np.uint16, copy=False)
-    seg = _segment_hue_to_12bin(h_chroma)
+    np.copyto(seg, _EXCLUDED_BIN, where=s_flat < sat_th)
     counts = np.bincount(seg, minlength=12)[:12]
-    rgb_chroma = rgb_all[chroma_mask]
+    if int(counts.sum()) <= 0:
+        return []
     return _build_top_color_bars(
         counts=counts,
         seg=seg,
-        rgb_source=rgb_chroma,
+        rgb_source=rgb_all,
         max_count=max_count,
         label_for_idx=lambda idx: HUE_NAME_12[int(idx) % len(HUE_NAME_12)],
     )
@@ -2,6 +2,7 @@
 
 import threading
 import time
+import weakref
 from dataclasses import dataclass, replace
 from typing import Optional
 
@@ -10,11 +11,12 @@ import numpy as np
 from PySide6.QtCore import QObject, QRect, Signal
 
 from .analysis import change_detection, live_graph_data, screen_mapping
-from .analysis.result_payloads import GraphDataPayload
+from .analysis.result_payloads import AnalyzerResult, GraphDataPayload
 from .capture import frame_capture, win32_window_capture
 from .capture.win32_windows import HAS_WIN32
 from .util import constants as C
 from .util.debug_log import write_window_layout_debug_log
+from .util.image_ops import resize_by_long_edge
 from .util.value_utils import clamp_int
 
 GraphData = GraphDataPayload
@@ -39,6 +41,25 @@ _ANALYZER_CHANGE_COOLDOWN_SEC = 0.12
 _ANALYZER_CHANGE_DETECT_DIM = 120
 _CAPTURE_SLEEP_SEC_DEFAULT = 0.5
 _CAPTURE_SLEEP_SEC_RETRY = 0.3
+_WINDOW_CLOAKED_STATUS = "ターゲットウィンドウが表示されていません（別の仮想デスクトップ等）"
+# Windows の既定タイマー分解能(約15.6ms)では短い周期の sleep が大きくずれるため、
+# キャプチャスレッド稼働中だけ 1ms に上げる。
+_WIN_TIMER_PERIOD_MS = 1
+
+
+def _set_win_timer_period(enabled: bool) -> bool:
+    """Windows のシステムタイマー分解能を変更し、成功したら True を返す。"""
+    if not HAS_WIN32:
+        return False
+    try:
+        import ctypes
+
+        winmm = ctypes.windll.winmm
+        if enabled:
+            return int(winmm.timeBeginPeriod(_WIN_TIMER_PERIOD_MS)) == 0
+        return int(winmm.timeEndPeriod(_WIN_TIMER_PERIOD_MS)) == 0
+    except Exception:
+        return False
 
 
 @dataclass(frozen=True, slots=True)
@@ -54,12 +75,7 @@ class AnalyzerConfig:
     mode: str = C.DEFAULT_MODE
     diff_threshold: float = C.DEFAULT_DIFF_THRESHOLD
     stable_frames: int = C.DEFAULT_STABLE_FRAMES
-    view_color: bool = True
-    view_color_band: bool = True
-    view_scatter: bool = True
-    view_hsv_hist: bool = True
-    view_image: bool = True
-    want_preview: bool = False
+    view_flags: int = live_graph_data.VIEW_FLAGS_DEFAULT
 
 
 @dataclass(frozen=True, slots=True)
@@ -85,16 +101,22 @@ class AnalyzerLoopState:
 
     cfg: AnalyzerConfig
     capture: AnalyzerCaptureSelection
-    need_color: bool
-    need_color_band: bool
-    need_scatter: bool
-    need_hsv_hist: bool
+    graph_flags: int
     need_graph_data: bool
     need_bgr_emit: bool
     loop_interval: float
     idle_sleep_sec: float
 
 
+@dataclass(frozen=True, slots=True)
+class AnalyzerCapturedFrame:
+    """キャプチャスレッドから解析スレッドへ渡す最新1フレーム。"""
+
+    bgr: np.ndarray
+    cap: QRect
+    captured_at: float
+
+
 @dataclass(frozen=True, slots=True)
 class AnalyzerFrameState:
     """取得済み1フレームに対する通知判定結果。"""
@@ -124,10 +146,18 @@ class AnalyzerGraphRequest:
     need_graph_data: bool
     bgr: np.ndarray
     cfg: AnalyzerConfig
-    need_color: bool
-    need_color_band: bool
-    need_scatter: bool
-    need_hsv_hist: bool
+    graph_flags: int
+    # 縮小前のキャプチャ画像(ウィンドウ ROI では WGC フレームの切り出しビュー)。
+    source_bgr: Optional[np.ndarray] = None
+
+
+def _frame_view_identity(bgr: np.ndarray) -> tuple[np.ndarray, tuple]:
+    """配列ビューを「元の所有配列」と「その中での位置/形状」の組へ分解する。"""
+    root = bgr
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    offset = int(bgr.__array_interface__["data"][0]) - int(root.__array_interface__["data"][0])
+    return root, (offset, bgr.shape, bgr.strides)
 
 
 def _copy_rect(rect: Optional[QRect]) -> Optional[QRect]:
@@ -138,7 +168,7 @@ def _copy_rect(rect: Optional[QRect]) -> Optional[QRect]:
 class AnalyzerWorker(QObject):
     """キャプチャと解析をバックグラウンドで実行するワーカー。"""
 
-    resultReady = Signal(dict)
+    resultReady = Signal(object)
     status = Signal(str)
 
     def __init__(self):
@@ -150,16 +180,32 @@ class AnalyzerWorker(QObject):
         self._capture_selection = AnalyzerCaptureSelection()
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._capture_thread: Optional[threading.Thread] = None
+        # キャプチャと解析を別スレッドに分け、受け渡しは最新1枚だけを保持するスロットで行う。
+        self._frame_slot_cond = threading.Condition()
+        self._frame_slot: Optional[AnalyzerCapturedFrame] = None
+        # キャプチャ周期は「前回の予定時刻 + 周期」で刻み、sleep の誤差を累積させない。
+        self._capture_deadline: Optional[float] = None
+        self._capture_deadline_interval: float = 0.0
         # UIスレッドが処理しきれないとキューが肥大化するため、未処理フレームは1件までに制限
         self._result_inflight = threading.Event()
+        # 消費完了を待つ間は固定 sleep ではなくこのイベントで即座に起床する。
+        self._result_consumed = threading.Event()
 
         self._frame = 0
 
         # changeトリガーモード用の履歴
-        self._prev_h: Optional[np.ndarray] = None
-        self._prev_s: Optional[np.ndarray] = None
-        self._prev_v: Optional[np.ndarray] = None
-        self._hue_wrap_buf: Optional[np.ndarray] = None
+        # 前回/今回の HSV は2枚のバッファを交互に使い回し、毎フレームの確保を避ける。
+        self._prev_hsv: Optional[np.ndarray] = None
+        self._spare_hsv: Optional[np.ndarray] = None
+        self._change_diff_buf: Optional[np.ndarray] = None
+        # 直前キャプチャと全画素一致なら縮小/HSV 化を省くため、元フレームを1枚保持する。
+        self._prev_capture_bgr: Optional[np.ndarray] = None
+        # WGC は内容が変わらない間は同じ配列を返すため、同一フレームならグラフ計算結果を使い回す。
+        # ROI は毎回新しい切り出しビューになるので、元フレームと切り出し位置で同一性を判定する。
+        self._graph_cache_source: Optional[weakref.ref] = None
+        self._graph_cache_key: tuple = ()
+        self._graph_cache_data: GraphData = _EMPTY_GRAPH_DATA
         self._stable_frames: int = 0
         self._was_stable: bool = False
         self._cooldown_until: float = 0.0
@@ -173,9 +219,8 @@ class AnalyzerWorker(QObject):
         """差分更新モードで使う履歴状態を初期化する。"""
         with self._change_state_lock:
             # changeモードの履歴を初期化する。
-            self._prev_h = None
-            self._prev_s = None
-            self._prev_v = None
+            self._prev_hsv = None
+            self._prev_capture_bgr = None
             self._stable_frames = 0
             self._was_stable = False
             self._cooldown_until = 0.0
@@ -236,11 +281,16 @@ class AnalyzerWorker(QObject):
     def start(self):
         """解析スレッドを開始する。"""
         # 既に稼働中なら二重起動しない。
-        if self._thread and self._thread.is_alive():
+        threads = (self._thread, self._capture_thread)
+        if any(thread is not None and thread.is_alive() for thread in threads):
             return
         self._stop.clear()
         self._result_inflight.clear()
+        self._result_consumed.set()
+        self._discard_captured_frame()
+        self._capture_thread = threading.Thread(target=self._capture_run, daemon=True)
         self._thread = threading.Thread(target=self._run, daemon=True)
+        self._capture_thread.start()
         self._thread.start()
         self.status.emit("計測開始")
 
@@ -254,8 +304,22 @@ class AnalyzerWorker(QObject):
         # 停止要求は次ループで反映される。
         self._stop.set()
         self._result_inflight.clear()
+        self._result_consumed.set()
+        # 受け渡し待ちの解析スレッドも即座に起こして停止させる。
+        self._discard_captured_frame()
         self.status.emit("停止")
 
+    def wait(self, timeout: float = 1.5) -> bool:
+        """停止要求後、キャプチャ/解析スレッドの終了を最大 `timeout` 秒待つ。"""
+        # 両スレッド合計で timeout を超えないよう、期限から残り時間を割り当てる。
+        deadline = time.perf_counter() + max(0.0, float(timeout))
+        for thread in (self._capture_thread, self._thread):
+            if thread is None or thread is threading.current_thread():
+                continue
+            thread.join(max(0.0, deadline - time.perf_counter()))
+        threads = (self._thread, self._capture_thread)
+        return not any(thread is not None and thread.is_alive() for thread in threads)
+
     def is_running(self) -> bool:
         """ライブ解析が実行状態なら True を返す。"""
         thread = self._thread
@@ -264,61 +328,93 @@ class AnalyzerWorker(QObject):
     def mark_result_consumed(self):
         """UI側で結果消費完了したことをワーカーへ通知する。"""
         self._result_inflight.clear()
+        self._result_consumed.set()
+
+    def configure(
+        self,
+        *,
+        interval_sec: Optional[float] = None,
+        sample_points: Optional[int] = None,
+        max_dim: Optional[int] = None,
+        wheel_sat_threshold: Optional[int] = None,
+        color_band_sat_threshold: Optional[int] = None,
+        graph_every: Optional[int] = None,
+        mode: Optional[str] = None,
+        diff_threshold: Optional[float] = None,
+        stable_frames: Optional[int] = None,
+    ) -> None:
+        """指定された解析設定だけを正規化し、1回の設定差し替えでまとめて反映する。"""
+        changes = {}
+        if interval_sec is not None:
+            changes["interval_sec"] = max(_ANALYZER_MIN_INTERVAL_SEC, float(interval_sec))
+        if sample_points is not None:
+            changes["sample_points"] = clamp_int(
+                sample_points, C.ANALYZER_MIN_SAMPLE_POINTS, C.ANALYZER_MAX_SAMPLE_POINTS
+            )
+        if max_dim is not None:
+            # 0 以下はオリジナル解像度（縮小なし）として扱う
+            max_dim = int(max_dim)
+            changes["max_dim"] = (
+                0
+                if max_dim <= 0
+                else clamp_int(max_dim, C.ANALYZER_MAX_DIM_MIN, C.ANALYZER_MAX_DIM_MAX)
+            )
+        if wheel_sat_threshold is not None:
+            changes["wheel_sat_threshold"] = clamp_int(
+                wheel_sat_threshold, C.WHEEL_SAT_THRESHOLD_MIN, C.WHEEL_SAT_THRESHOLD_MAX
+            )
+        if color_band_sat_threshold is not None:
+            changes["color_band_sat_threshold"] = clamp_int(
+                color_band_sat_threshold, C.WHEEL_SAT_THRESHOLD_MIN, C.WHEEL_SAT_THRESHOLD_MAX
+            )
+        if graph_every is not None:
+            changes["graph_every"] = max(_ANALYZER_MIN_GRAPH_EVERY, int(graph_every))
+        if mode is not None:
+            changes["mode"] = mode if mode in C.UPDATE_MODES else C.DEFAULT_MODE
+        if diff_threshold is not None:
+            changes["diff_threshold"] = max(C.ANALYZER_MIN_DIFF_THRESHOLD, float(diff_threshold))
+        if stable_frames is not None:
+            changes["stable_frames"] = max(C.ANALYZER_MIN_STABLE_FRAMES, int(stable_frames))
+        self._update_cfg(**changes)
+        if mode is not None:
+            # モード切替時は差分検知用の状態をリセット
+            self._reset_change_state()
 
     def set_interval(self, sec: float):
         """更新間隔を設定する。"""
-        self._update_cfg(interval_sec=max(_ANALYZER_MIN_INTERVAL_SEC, float(sec)))
+        self.configure(interval_sec=sec)
 
     def set_sample_points(self, n: int):
         """散布図のサンプル点数を設定する。"""
-        self._update_cfg(
-            sample_points=clamp_int(
-                n, C.ANALYZER_MIN_SAMPLE_POINTS, C.ANALYZER_MAX_SAMPLE_POINTS
-            )
-        )
+        self.configure(sample_points=n)
 
     def set_max_dim(self, n: int):
         """解析用の最大辺サイズを設定する。"""
-        n = int(n)
-        if n <= 0:
-            # 0 はオリジナル解像度（縮小なし）として扱う
-            self._update_cfg(max_dim=0)
-            return
-        self._update_cfg(max_dim=clamp_int(n, C.ANALYZER_MAX_DIM_MIN, C.ANALYZER_MAX_DIM_MAX))
+        self.configure(max_dim=n)
 
     def set_wheel_sat_threshold(self, n: int):
         """色相環用の彩度しきい値を設定する。"""
-        self._update_cfg(
-            wheel_sat_threshold=clamp_int(
-                n, C.WHEEL_SAT_THRESHOLD_MIN, C.WHEEL_SAT_THRESHOLD_MAX
-            )
-        )
+        self.configure(wheel_sat_threshold=n)
 
     def set_color_band_sat_threshold(self, n: int):
         """配色比率用の彩度しきい値を設定する。"""
-        self._update_cfg(
-            color_band_sat_threshold=clamp_int(
-                n, C.WHEEL_SAT_THRESHOLD_MIN, C.WHEEL_SAT_THRESHOLD_MAX
-            )
-        )
+        self.configure(color_band_sat_threshold=n)
 
     def set_graph_every(self, n: int):
         """グラフ更新間引き間隔を設定する。"""
-        self._update_cfg(graph_every=max(_ANALYZER_MIN_GRAPH_EVERY, int(n)))
+        self.configure(graph_every=n)
 
     def set_mode(self, mode: str):
         """更新モードを設定する。"""
-        self._update_cfg(mode=mode if mode in C.UPDATE_MODES else C.DEFAULT_MODE)
-        # モード切替時は差分検知用の状態をリセット
-        self._reset_change_state()
+        self.configure(mode=mode)
 
     def set_diff_threshold(self, th: float):
         """差分更新モードの変化量しきい値を設定する。"""
-        self._update_cfg(diff_threshold=max(C.ANALYZER_MIN_DIFF_THRESHOLD, float(th)))
+        self.configure(diff_threshold=th)
 
     def set_stable_frames(self, n: int):
         """差分更新モードの安定判定フレーム数を設定する。"""
-        self._update_cfg(stable_frames=max(C.ANALYZER_MIN_STABLE_FRAMES, int(n)))
+        self.configure(stable_frames=n)
 
     def set_view_flags(
         self,
@@ -330,20 +426,21 @@ class AnalyzerWorker(QObject):
         preview: Optional[bool] = None,
     ):
         """可視ビューに応じた解析有効フラグを更新する。"""
-        changes = {}
-        if color is not None:
-            changes["view_color"] = bool(color)
-        if color_band is not None:
-            changes["view_color_band"] = bool(color_band)
-        if scatter is not None:
-            changes["view_scatter"] = bool(scatter)
-        if hsv_hist is not None:
-            changes["view_hsv_hist"] = bool(hsv_hist)
-        if image is not None:
-            changes["view_image"] = bool(image)
-        if preview is not None:
-            changes["want_preview"] = bool(preview)
-        self._update_cfg(**changes)
+        updates = (
+            (color, live_graph_data.VIEW_FLAG_COLOR),
+            (color_band, live_graph_data.VIEW_FLAG_COLOR_BAND),
+            (scatter, live_graph_data.VIEW_FLAG_SCATTER),
+            (hsv_hist, live_graph_data.VIEW_FLAG_HSV_HIST),
+            (image, live_graph_data.VIEW_FLAG_IMAGE),
+            (preview, live_graph_data.VIEW_FLAG_PREVIEW),
+        )
+        with self._state_lock:
+            flags = int(self._cfg.view_flags)
+            for enabled, bit in updates:
+                if enabled is None:
+                    continue
+                flags = (flags | bit) if enabled else (flags & ~bit)
+            self._cfg = replace(self._cfg, view_flags=flags)
 
     def set_capture_selection(
         self,
@@ -432,9 +529,14 @@ class AnalyzerWorker(QObject):
         """対象ウィンドウが最小化中か判定する。"""
         return win32_window_capture.is_window_minimized(hwnd)
 
-    def _capture_window_bgr(self, hwnd: int) -> Optional[np.ndarray]:
-        """Win32 APIで対象ウィンドウ全体を BGR 画像として取得する。"""
-        return win32_window_capture.capture_window_bgr(
+    @staticmethod
+    def _is_window_cloaked(hwnd: int) -> bool:
+        """対象ウィンドウが DWM にクロークされて描画されていないか判定する。"""
+        return win32_window_capture.is_window_cloaked(hwnd)
+
+    def _capture_window_frame(self, hwnd: int) -> tuple[Optional[np.ndarray], Optional[QRect]]:
+        """Win32 APIで対象ウィンドウ全体の BGR 画像と、その画像が覆う画面矩形を取得する。"""
+        return win32_window_capture.capture_window_frame(
             hwnd,
             get_window_rect_fn=self._get_window_rect,
         )
@@ -448,7 +550,7 @@ class AnalyzerWorker(QObject):
             target_hwnd=capture.target_hwnd,
             roi_rel=capture.roi_rel,
             get_window_rect_fn=self._get_window_rect,
-            capture_window_bgr_fn=self._capture_window_bgr,
+            capture_window_frame_fn=self._capture_window_frame,
         )
 
     @staticmethod
@@ -471,6 +573,8 @@ class AnalyzerWorker(QObject):
                         None,
                         "ターゲットウィンドウが最小化されています（色を取得できません）",
                     )
+                if self._is_window_cloaked(capture.target_hwnd):
+                    return None, None, _WINDOW_CLOAKED_STATUS
                 bgr, cap = self._capture_target_window_region(capture)
                 if bgr is None or cap is None:
                     return None, None, "選択ウィンドウのキャプチャに失敗しました"
@@ -489,19 +593,27 @@ class AnalyzerWorker(QObject):
             )
             return None, None, "プレビュー取得に失敗しました"
 
-    def _compute_change_metric(self, dh: np.ndarray, ds: np.ndarray, dv: np.ndarray) -> float:
+    def _compute_change_metric(self, curr_hsv: np.ndarray) -> float:
         """前回との差分量を1つのスカラー値へ集約する。"""
-        metric, self._hue_wrap_buf = change_detection.compute_change_metric(
-            dh,
-            ds,
-            dv,
-            prev_h=self._prev_h,
-            prev_s=self._prev_s,
-            prev_v=self._prev_v,
-            hue_wrap_buf=self._hue_wrap_buf,
+        metric, self._change_diff_buf = change_detection.compute_change_metric(
+            curr_hsv,
+            prev_hsv=self._prev_hsv,
+            diff_buf=self._change_diff_buf,
         )
         return float(metric)
 
+    def _update_change_stability(self, metric: float, cfg: AnalyzerConfig) -> bool:
+        """差分量から安定フレーム数を更新し、安定到達時だけ True を返す。"""
+        if metric < cfg.diff_threshold:
+            self._stable_frames += 1
+        else:
+            self._stable_frames = 0
+            self._was_stable = False
+        emit_now = self._stable_frames >= cfg.stable_frames and not self._was_stable
+        if emit_now:
+            self._was_stable = True
+        return emit_now
+
     def _should_emit_in_change_mode(
         self,
         bgr: np.ndarray,
@@ -510,37 +622,32 @@ class AnalyzerWorker(QObject):
     ) -> bool:
         """差分更新モードで今回フレームを通知すべきか判定する。"""
         with self._change_state_lock:
-            dh, ds, dv = change_detection.prepare_change_detection_channels(
-                bgr,
-                detect_dim=_ANALYZER_CHANGE_DETECT_DIM,
+            same_capture = self._prev_hsv is not None and change_detection.is_same_frame(
+                bgr, self._prev_capture_bgr
             )
-
-            emit_now = now >= self._cooldown_until
-            if (
-                self._prev_h is None
-                or self._prev_s is None
-                or self._prev_v is None
-                or self._prev_h.shape != dh.shape
-                or self._prev_s.shape != ds.shape
-                or self._prev_v.shape != dv.shape
-            ):
-                emit_now = False
-                self._stable_frames = 0
-                self._was_stable = False
+            self._prev_capture_bgr = bgr
+            if same_capture:
+                # 静止画面では前回と全画素一致するため、差分量 0 として縮小/HSV 化を省く。
+                emit_now = self._update_change_stability(0.0, cfg)
             else:
-                metric = self._compute_change_metric(dh, ds, dv)
-                if metric < cfg.diff_threshold:
-                    self._stable_frames += 1
-                else:
+                # 解析解像度へ縮小したフレームから判定解像度へ縮小する(発火時は縮小結果を再利用)。
+                curr_hsv = change_detection.prepare_change_detection_hsv(
+                    resize_by_long_edge(bgr, cfg.max_dim),
+                    detect_dim=_ANALYZER_CHANGE_DETECT_DIM,
+                    out=self._spare_hsv,
+                )
+                if self._prev_hsv is None or self._prev_hsv.shape != curr_hsv.shape:
+                    emit_now = False
                     self._stable_frames = 0
                     self._was_stable = False
-                emit_now = self._stable_frames >= cfg.stable_frames and not self._was_stable
-                if emit_now:
-                    self._was_stable = True
+                else:
+                    emit_now = self._update_change_stability(
+                        self._compute_change_metric(curr_hsv), cfg
+                    )
 
-            self._prev_h = dh
-            self._prev_s = ds
-            self._prev_v = dv
+                # 今回分を前回へ回し、旧前回バッファは次フレームの書き込み先にする。
+                self._spare_hsv = self._prev_hsv
+                self._prev_hsv = curr_hsv
             if self._force_emit_once:
                 self._force_emit_once = False
                 emit_now = True
@@ -585,6 +692,15 @@ class AnalyzerWorker(QObject):
                     _CAPTURE_SLEEP_SEC_DEFAULT,
                 )
                 return None, None
+            if self._is_window_cloaked(capture.target_hwnd):
+                # クローク中は PrintWindow/WGC とも古い画像しか返さないため、取得自体を省く。
+                write_window_layout_debug_log(
+                    "capture_window_source_error",
+                    target_hwnd=int(capture.target_hwnd),
+                    reason="cloaked",
+                )
+                self._emit_status_and_sleep(_WINDOW_CLOAKED_STATUS, _CAPTURE_SLEEP_SEC_DEFAULT)
+                return None, None
             bgr, cap = self._capture_target_window_region(capture)
             if bgr is None or cap is None:
                 write_window_layout_debug_log(
@@ -647,6 +763,7 @@ class AnalyzerWorker(QObject):
         state: AnalyzerLoopState,
         bgr: np.ndarray,
         decision: AnalyzerFrameDecision,
+        source_bgr: Optional[np.ndarray] = None,
     ) -> AnalyzerGraphRequest:
         """現在フレームの graph 計算要求を組み立てる。"""
         return AnalyzerGraphRequest(
@@ -655,24 +772,36 @@ class AnalyzerWorker(QObject):
             need_graph_data=bool(state.need_graph_data),
             bgr=bgr,
             cfg=state.cfg,
-            need_color=bool(state.need_color),
-            need_color_band=bool(state.need_color_band),
-            need_scatter=bool(state.need_scatter),
-            need_hsv_hist=bool(state.need_hsv_hist),
+            graph_flags=int(state.graph_flags),
+            source_bgr=source_bgr,
         )
 
     def _graph_data_for_frame(self, request: AnalyzerGraphRequest) -> GraphData:
         """必要なときだけグラフ計算を実行する。"""
         if not (request.can_emit_now and request.graph_update and request.need_graph_data):
             return _EMPTY_GRAPH_DATA
-        return live_graph_data.collect_graph_data(
+        # 縮小結果は毎回新しい配列になるため、縮小前のキャプチャ画像で同一フレームを判定する。
+        # 縮小率は cfg.max_dim で決まるので、cfg を鍵に含めれば縮小後の内容も一意に定まる。
+        source_bgr = request.bgr if request.source_bgr is None else request.source_bgr
+        root, view = _frame_view_identity(source_bgr)
+        key = (request.cfg, int(request.graph_flags), view)
+        source = self._graph_cache_source
+        if source is not None and source() is root and key == self._graph_cache_key:
+            # 前回と同じフレームの同じ位置(=未更新の WGC フレーム)なら HSV 変換からの再計算を省く。
+            return self._graph_cache_data
+        graph_data = live_graph_data.collect_graph_data(
             request.bgr,
             request.cfg,
-            need_color=request.need_color,
-            need_color_band=request.need_color_band,
-            need_scatter=request.need_scatter,
-            need_hsv_hist=request.need_hsv_hist,
+            view_flags=request.graph_flags,
         )
+        try:
+            self._graph_cache_source = weakref.ref(root)
+        except TypeError:
+            self._graph_cache_source = None
+            return graph_data
+        self._graph_cache_key = key
+        self._graph_cache_data = graph_data
+        return graph_data
 
     def _frame_state_for_loop(
         self,
@@ -684,7 +813,14 @@ class AnalyzerWorker(QObject):
     ) -> AnalyzerFrameState:
         """今回キャプチャ済みフレームの通知状態をまとめる。"""
         decision = self._frame_decision_for_loop(state.cfg, bgr)
-        graph_request = self._graph_request_for_frame(state, bgr, decision)
+        analysis_bgr = bgr
+        if decision.emit_now and (state.need_bgr_emit or decision.graph_update):
+            # 通知するフレームだけ解析解像度へ縮小し、graph 計算と画像ドックで共有する。
+            # change 判定で縮小済みならキャッシュを再利用し、UI スレッドでも cv2.resize を走らせない。
+            analysis_bgr = resize_by_long_edge(bgr, state.cfg.max_dim)
+        graph_request = self._graph_request_for_frame(
+            state, analysis_bgr, decision, source_bgr=bgr
+        )
         return AnalyzerFrameState(
             started_at=float(started_at),
             bgr=bgr,
@@ -694,18 +830,37 @@ class AnalyzerWorker(QObject):
             graph_data=self._graph_data_for_frame(graph_request),
         )
 
-    @staticmethod
-    def _sleep_remaining_loop_interval(state: AnalyzerLoopState, started_at: float) -> None:
-        """ループ周期を維持するため残り時間だけ待機する。"""
-        remain = state.loop_interval - (time.perf_counter() - started_at)
+    def _reset_capture_deadline(self) -> None:
+        """キャプチャ周期の予定時刻を破棄し、次回取得時点から刻み直す。"""
+        self._capture_deadline = None
+        self._capture_deadline_interval = 0.0
+
+    def _sleep_until_next_capture_deadline(
+        self, state: AnalyzerLoopState, started_at: float
+    ) -> None:
+        """予定時刻ベースで次のキャプチャまで待機する。"""
+        interval = float(state.loop_interval)
+        deadline = self._capture_deadline
+        if deadline is None or interval != self._capture_deadline_interval:
+            # 初回・モード/周期変更時は今回の取得開始時刻を基準に刻み直す。
+            deadline = float(started_at)
+            self._capture_deadline_interval = interval
+        deadline += interval
+        now = time.perf_counter()
+        if deadline <= now:
+            # 処理が周期を超えて遅れた分は取り戻さず、連続取得にならないよう現在時刻へ合わせる。
+            deadline = now
+        self._capture_deadline = deadline
+        remain = deadline - now
         if remain > 0:
             time.sleep(remain)
 
-    def _emit_result_if_possible(self, payload: dict, *, cfg: AnalyzerConfig) -> None:
+    def _emit_result_if_possible(self, payload: AnalyzerResult, *, cfg: AnalyzerConfig) -> None:
         """未消費キューが空いている場合のみ結果を通知する。"""
         if self._result_inflight.is_set():
             return
         # UI側が未消費の間は次結果を積まず、キュー膨張を防ぐ。
+        self._result_consumed.clear()
         self._result_inflight.set()
         self.resultReady.emit(payload)
         if cfg.mode == C.UPDATE_MODE_CHANGE:
@@ -719,22 +874,14 @@ class AnalyzerWorker(QObject):
         cfg = runtime.cfg
         capture = runtime.capture
         # 可視ビューから必要計算を決める。
-        (
-            need_color,
-            need_color_band,
-            need_scatter,
-            need_hsv_hist,
-            need_graph_data,
-            need_bgr_emit,
-        ) = live_graph_data.view_requirements(cfg)
+        graph_flags, need_graph_data, need_bgr_emit = live_graph_data.view_requirements(
+            cfg.view_flags
+        )
         loop_interval = self._loop_interval_sec(cfg)
         return AnalyzerLoopState(
             cfg=cfg,
             capture=capture,
-            need_color=bool(need_color),
-            need_color_band=bool(need_color_band),
-            need_scatter=bool(need_scatter),
-            need_hsv_hist=bool(need_hsv_hist),
+            graph_flags=int(graph_flags),
             need_graph_data=bool(need_graph_data),
             need_bgr_emit=bool(need_bgr_emit),
             loop_interval=float(loop_interval),
@@ -749,7 +896,8 @@ class AnalyzerWorker(QObject):
             return True
         if self._result_inflight.is_set():
             # UIが前フレームを消費中の間は新規キャプチャを抑止して無駄負荷を避ける。
-            time.sleep(state.idle_sleep_sec)
+            # 消費完了(または停止)の通知で待機を切り上げ、次フレームの取得遅延を抑える。
+            self._result_consumed.wait(state.idle_sleep_sec)
             return True
         return False
 
@@ -776,32 +924,79 @@ class AnalyzerWorker(QObject):
         )
         self._emit_result_if_possible(payload, cfg=state.cfg)
 
-    def _run_loop_iteration(self, sct) -> None:
-        """メインループ1回分の判定・取得・通知を実行する。"""
+    def _publish_captured_frame(self, frame: AnalyzerCapturedFrame) -> None:
+        """キャプチャ済みフレームをスロットへ置き、解析スレッドへ通知する。"""
+        with self._frame_slot_cond:
+            # 未解析の古いフレームは破棄し、解析側は常に最新フレームだけを見る。
+            self._frame_slot = frame
+            self._frame_slot_cond.notify()
+
+    def _take_captured_frame(self, timeout_sec: float) -> Optional[AnalyzerCapturedFrame]:
+        """最新フレームをスロットから取り出す。無ければ timeout まで待つ。"""
+        with self._frame_slot_cond:
+            if self._frame_slot is None and not self._stop.is_set():
+                self._frame_slot_cond.wait(max(0.0, float(timeout_sec)))
+            frame = self._frame_slot
+            self._frame_slot = None
+            return frame
+
+    def _discard_captured_frame(self) -> None:
+        """受け渡し待ちフレームを破棄し、待機中の解析スレッドを起こす。"""
+        with self._frame_slot_cond:
+            self._frame_slot = None
+            self._frame_slot_cond.notify_all()
+
+    def _capture_loop_iteration(self, sct) -> None:
+        """キャプチャスレッド1回分の判定・取得・受け渡しを実行する。"""
         t0 = time.perf_counter()
         state = self._loop_state()
         if self._should_skip_loop_iteration(state):
+            # 休止を挟んだら予定時刻は古くなるため、再開時に刻み直す。
+            self._reset_capture_deadline()
             return
 
         # 1フレーム取得。
         bgr, cap = self._capture_frame_for_loop(sct, state.capture)
         if bgr is None or cap is None:
+            self._reset_capture_deadline()
             return
+        self._publish_captured_frame(
+            AnalyzerCapturedFrame(bgr=bgr, cap=cap, captured_at=float(t0))
+        )
+
+        # キャプチャ周期を維持。解析時間はこの周期に含めない。
+        self._sleep_until_next_capture_deadline(state, float(t0))
 
+    def _run_loop_iteration(self) -> None:
+        """解析スレッド1回分の判定・通知を実行する。"""
+        state = self._loop_state()
+        captured = self._take_captured_frame(state.idle_sleep_sec)
+        if captured is None:
+            return
         frame = self._frame_state_for_loop(
             state,
-            started_at=float(t0),
-            bgr=bgr,
-            cap=cap,
+            started_at=captured.captured_at,
+            bgr=captured.bgr,
+            cap=captured.cap,
         )
         self._maybe_emit_loop_payload(state, frame)
 
-        # ループ周期を維持。
-        self._sleep_remaining_loop_interval(state, float(t0))
+    def _capture_run(self):
+        """キャプチャだけを繰り返し、最新フレームをスロットへ供給する。"""
+        self._reset_capture_deadline()
+        timer_period_raised = _set_win_timer_period(True)
+        try:
+            # mss は作成したスレッドで使う必要があるため、キャプチャスレッド内で保持する。
+            with mss.mss() as sct:
+                while not self._stop.is_set():
+                    self._capture_loop_iteration(sct)
+        finally:
+            # キャプチャスレッド終了時に WGC セッションも閉じ、黄色枠や GPU 資源を残さない。
+            win32_window_capture.close_window_capture_sessions()
+            if timer_period_raised:
+                _set_win_timer_period(False)
 
     def _run(self):
-        """キャプチャ/解析/通知を繰り返すメインループ。"""
-        # mss は with 内で使い回し、毎フレーム初期化コストを避ける。
-        with mss.mss() as sct:
-            while not self._stop.is_set():
-                self._run_loop_iteration(sct)
+        """最新フレームを受け取り、解析/通知を繰り返すメインループ。"""
+        while not self._stop.is_set():
+            self._run_loop_iteration()
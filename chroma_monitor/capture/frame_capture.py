@@ -1,6 +1,7 @@
 """1フレーム分のキャプチャ矩形解決と切り出し補助。"""
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Optional
 
 import cv2
@@ -37,7 +38,7 @@ def capture_target_window_region(
     target_hwnd: Optional[int],
     roi_rel: Optional[QRect],
     get_window_rect_fn: Callable[[int], Optional[QRect]],
-    capture_window_bgr_fn: Callable[[int], Optional[np.ndarray]],
+    capture_window_frame_fn: Callable[[int], tuple[Optional[np.ndarray], Optional[QRect]]],
 ) -> tuple[Optional[np.ndarray], Optional[QRect]]:
     """対象ウィンドウ画像から ROI 相当領域を切り出して返す。"""
     if target_hwnd is None:
@@ -45,20 +46,25 @@ def capture_target_window_region(
     wrect = get_window_rect_fn(target_hwnd)
     if wrect is None:
         return None, None
-    full = capture_window_bgr_fn(target_hwnd)
+    full, frame_rect = capture_window_frame_fn(target_hwnd)
     if full is None:
         return None, None
+    # 画像が覆う画面矩形が不明なら、従来どおりウィンドウ矩形全体とみなす。
+    frame_rect = wrect if frame_rect is None else frame_rect
 
     if roi_rel is None:
-        return full, wrect
+        return full, frame_rect
 
+    # ROI はウィンドウ矩形基準なので、画像側の矩形(WGC では可視枠)の原点とサイズで写像する。
     full_h, full_w = full.shape[:2]
-    ww = max(1, int(wrect.width()))
-    wh = max(1, int(wrect.height()))
-    sx = float(full_w) / float(ww)
-    sy = float(full_h) / float(wh)
-    x = max(0, int(round(float(roi_rel.left()) * sx)))
-    y = max(0, int(round(float(roi_rel.top()) * sy)))
+    fw = max(1, int(frame_rect.width()))
+    fh = max(1, int(frame_rect.height()))
+    sx = float(full_w) / float(fw)
+    sy = float(full_h) / float(fh)
+    left = int(wrect.left()) + int(roi_rel.left()) - int(frame_rect.left())
+    top = int(wrect.top()) + int(roi_rel.top()) - int(frame_rect.top())
+    x = max(0, int(round(float(left) * sx)))
+    y = max(0, int(round(float(top) * sy)))
     w = max(1, int(round(float(roi_rel.width()) * sx)))
     h = max(1, int(round(float(roi_rel.height()) * sy)))
     if x + w > full_w:
@@ -77,6 +83,27 @@ def capture_target_window_region(
     return crop, cap
 
 
+@lru_cache(maxsize=8)
+def _clipped_grab_geometry(
+    cap_geometry: tuple[int, int, int, int],
+    vmon_geometry: tuple[int, int, int, int],
+) -> Optional[tuple[int, int, int, int]]:
+    """キャプチャ矩形を仮想モニタ範囲へ切り詰めた `(left, top, width, height)` を返す。"""
+    # ROI とモニタ構成が同じ間は毎フレーム同じ結果になるため、切り詰め結果を使い回す。
+    # 共有される戻り値が呼び出し側で書き換えられないよう、辞書ではなくタプルで保持する。
+    cap_left, cap_top, cap_width, cap_height = cap_geometry
+    vmon_left, vmon_top, vmon_width, vmon_height = vmon_geometry
+    left = max(cap_left, vmon_left)
+    top = max(cap_top, vmon_top)
+    right = min(cap_left + cap_width, vmon_left + vmon_width)
+    bottom = min(cap_top + cap_height, vmon_top + vmon_height)
+    width = right - left
+    height = bottom - top
+    if width <= 1 or height <= 1:
+        return None
+    return int(left), int(top), int(width), int(height)
+
+
 def capture_screen_region(
     sct,
     cap: Optional[QRect],
@@ -86,24 +113,22 @@ def capture_screen_region(
     if cap is None:
         return None, None, "キャプチャ領域を選択してください"
 
-    left = max(cap.left(), vmon["left"])
-    top = max(cap.top(), vmon["top"])
-    right = min(cap.left() + cap.width(), vmon["left"] + vmon["width"])
-    bottom = min(cap.top() + cap.height(), vmon["top"] + vmon["height"])
-    width = right - left
-    height = bottom - top
-    if width <= 1 or height <= 1:
+    clipped = _clipped_grab_geometry(
+        (int(cap.left()), int(cap.top()), int(cap.width()), int(cap.height())),
+        (int(vmon["left"]), int(vmon["top"]), int(vmon["width"]), int(vmon["height"])),
+    )
+    if clipped is None:
         return None, None, "領域が画面外です（範囲を選び直してください）"
+    left, top, width, height = clipped
+    monitor = {"left": left, "top": top, "width": width, "height": height}
 
-    monitor = {
-        "left": int(left),
-        "top": int(top),
-        "width": int(width),
-        "height": int(height),
-    }
     try:
         img = np.asarray(sct.grab(monitor), dtype=np.uint8)
     except mss.exception.ScreenShotError:
         return None, None, "画面キャプチャに失敗しました（権限/表示/Wayland設定を確認）"
     bgr = cv2.cvtColor(img, cv2.COLOR_BGRA2BGR)
-    return bgr, QRect(int(left), int(top), int(width), int(height)), None
+    return (
+        bgr,
+        QRect(left, top, width, height),
+        None,
+    )
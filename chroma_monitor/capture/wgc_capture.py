@@ -0,0 +1,307 @@
+"""Windows Graphics Capture によるウィンドウキャプチャ補助。"""
+
+import threading
+import time
+from datetime import timedelta
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from .win32_windows import HAS_WIN32
+
+_WGC_FRAME_POOL_BUFFERS = 2
+# 0 を指定すると既定(約 16ms 以上)扱いになるため、最短の 1ms を明示する。
+_WGC_MIN_UPDATE_INTERVAL = timedelta(microseconds=1000)
+_WGC_FIRST_FRAME_TIMEOUT_SEC = 0.2
+_WGC_FIRST_FRAME_POLL_SEC = 0.002
+_BGRA_CHANNEL_COUNT = 4
+# 一時的な失敗(最小化直後/起動途中など)で WGC を使えなくし続けないよう、この秒数後に再試行する。
+_WGC_RETRY_AFTER_SEC = 5.0
+# D3D11CreateDevice に渡す定数(ハードウェアドライバ/BGRA 対応/SDK バージョン)。
+_D3D_DRIVER_TYPE_HARDWARE = 1
+_D3D11_CREATE_DEVICE_BGRA_SUPPORT = 0x20
+_D3D11_SDK_VERSION = 7
+_IID_IDXGI_DEVICE = "{54EC77FA-1377-44E6-8C32-88FD5F44C84C}"
+
+_sessions_lock = threading.Lock()
+_active_session: Optional["_WgcWindowSession"] = None
+# 作成に失敗したウィンドウへ毎フレーム再試行しないよう失敗時刻を記録し、その間は PrintWindow 経路へ任せる。
+_failed_hwnds: dict[int, float] = {}
+
+
+@lru_cache(maxsize=1)
+def _winrt_api() -> Optional[SimpleNamespace]:
+    """pywinrt の WGC 関連モジュールを1度だけ読み込み、使えなければ None を返す。"""
+    if not HAS_WIN32:
+        return None
+    try:
+        from winrt.windows.graphics.capture import (  # type: ignore
+            Direct3D11CaptureFramePool,
+            GraphicsCaptureSession,
+        )
+        from winrt.windows.graphics.capture.interop import create_for_window  # type: ignore
+        from winrt.windows.graphics.directx import DirectXPixelFormat  # type: ignore
+        from winrt.windows.graphics.directx.direct3d11.interop import (  # type: ignore
+            create_direct3d11_device_from_dxgi_device,
+        )
+        from winrt.windows.graphics.imaging import (  # type: ignore
+            BitmapBufferAccessMode,
+            SoftwareBitmap,
+        )
+    except ImportError:
+        return None
+    try:
+        if not GraphicsCaptureSession.is_supported():
+            return None
+    except Exception:
+        return None
+    return SimpleNamespace(
+        create_direct3d11_device_from_dxgi_device=create_direct3d11_device_from_dxgi_device,
+        Direct3D11CaptureFramePool=Direct3D11CaptureFramePool,
+        create_for_window=create_for_window,
+        DirectXPixelFormat=DirectXPixelFormat,
+        BitmapBufferAccessMode=BitmapBufferAccessMode,
+        SoftwareBitmap=SoftwareBitmap,
+    )
+
+
+def _bgra_plane_to_bgr(
+    raw: np.ndarray,
+    *,
+    offset: int,
+    stride: int,
+    width: int,
+    height: int,
+) -> Optional[np.ndarray]:
+    """行ストライド付き BGRA 平面から指定サイズの BGR 画像を取り出す。"""
+    row_bytes = int(width) * _BGRA_CHANNEL_COUNT
+    if width <= 0 or height <= 0 or stride < row_bytes:
+        return None
+    end = int(offset) + int(stride) * int(height)
+    if raw.size < end:
+        return None
+    rows = raw[int(offset) : end].reshape(int(height), int(stride))
+    bgra = rows[:, :row_bytes].reshape(int(height), int(width), _BGRA_CHANNEL_COUNT)
+    # cvtColor が新しい配列へ書き出すため、WinRT バッファ解放後も安全に参照できる。
+    return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
+
+
+def _create_direct3d_device(api: SimpleNamespace):
+    """D3D11 デバイスを作成し、WinRT の IDirect3DDevice へ包んで返す。"""
+    import ctypes
+    from ctypes import wintypes
+
+    class _GUID(ctypes.Structure):
+        _fields_ = [
+            ("Data1", wintypes.DWORD),
+            ("Data2", wintypes.WORD),
+            ("Data3", wintypes.WORD),
+            ("Data4", ctypes.c_ubyte * 8),
+        ]
+
+    d3d_device = ctypes.c_void_p()
+    hr = ctypes.windll.d3d11.D3D11CreateDevice(
+        None,
+        _D3D_DRIVER_TYPE_HARDWARE,
+        None,
+        _D3D11_CREATE_DEVICE_BGRA_SUPPORT,
+        None,
+        0,
+        _D3D11_SDK_VERSION,
+        ctypes.byref(d3d_device),
+        None,
+        None,
+    )
+    if hr != 0 or not d3d_device:
+        raise OSError(f"D3D11CreateDevice failed: 0x{hr & 0xFFFFFFFF:08X}")
+
+    # IUnknown の vtable 先頭3つ(QueryInterface/AddRef/Release)だけを使う。
+    vtable = ctypes.cast(d3d_device, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    query_interface = ctypes.WINFUNCTYPE(
+        ctypes.c_long, ctypes.c_void_p, ctypes.POINTER(_GUID), ctypes.POINTER(ctypes.c_void_p)
+    )(vtable[0])
+    release = ctypes.WINFUNCTYPE(ctypes.c_ulong, ctypes.c_void_p)(vtable[2])
+    iid = _GUID()
+    ctypes.oledll.ole32.CLSIDFromString(_IID_IDXGI_DEVICE, ctypes.byref(iid))
+    dxgi_device = ctypes.c_void_p()
+    try:
+        hr = query_interface(d3d_device, ctypes.byref(iid), ctypes.byref(dxgi_device))
+        if hr != 0 or not dxgi_device:
+            raise OSError(f"IDXGIDevice query failed: 0x{hr & 0xFFFFFFFF:08X}")
+        try:
+            # WinRT 側が参照を保持するため、ここで得た生ポインタの参照は解放してよい。
+            return api.create_direct3d11_device_from_dxgi_device(int(dxgi_device.value))
+        finally:
+            release(dxgi_device)
+    finally:
+        release(d3d_device)
+
+
+async def _await_winrt(operation):
+    """WinRT の非同期操作を待って結果を返す。"""
+    return await operation
+
+
+class _WgcWindowSession:
+    """1ウィンドウ分の WGC セッションと直近フレームを保持する。"""
+
+    def __init__(self, api: SimpleNamespace, hwnd: int):
+        """キャプチャ対象ウィンドウの WGC セッションを開始する。"""
+        # asyncio の読み込みは数十 ms かかるため、WGC を実際に使う時まで遅らせる。
+        import asyncio
+
+        self.hwnd = int(hwnd)
+        self._api = api
+        self._lock = threading.Lock()
+        self._loop = asyncio.new_event_loop()
+        self._last_bgr: Optional[np.ndarray] = None
+        self._closed = False
+        self._pixel_format = api.DirectXPixelFormat.B8_G8_R8_A8_UINT_NORMALIZED
+        self._item = api.create_for_window(self.hwnd)
+        self._device = _create_direct3d_device(api)
+        self._pool_size = self._item.size
+        self._pool = api.Direct3D11CaptureFramePool.create_free_threaded(
+            self._device,
+            self._pixel_format,
+            _WGC_FRAME_POOL_BUFFERS,
+            self._pool_size,
+        )
+        self._session = self._pool.create_capture_session(self._item)
+        # 以下は OS バージョンにより未対応のプロパティなので、設定できなくても続行する。
+        for name, value in (
+            ("min_update_interval", _WGC_MIN_UPDATE_INTERVAL),
+            ("is_cursor_capture_enabled", False),
+            ("is_border_required", False),
+        ):
+            try:
+                setattr(self._session, name, value)
+            except Exception:
+                pass
+        self._session.start_capture()
+
+    def grab(self) -> Optional[np.ndarray]:
+        """新着フレームがあれば BGR へ変換し、無ければ直近フレームを返す。"""
+        with self._lock:
+            if self._closed:
+                return None
+            frame = self._pool.try_get_next_frame()
+            if frame is None and self._last_bgr is None:
+                # 開始直後は最初の合成フレームが届くまで少しだけ待つ。
+                deadline = time.perf_counter() + _WGC_FIRST_FRAME_TIMEOUT_SEC
+                while frame is None and time.perf_counter() < deadline:
+                    time.sleep(_WGC_FIRST_FRAME_POLL_SEC)
+                    frame = self._pool.try_get_next_frame()
+            if frame is None:
+                # WGC はウィンドウ内容が変わったときだけフレームを届けるため、前回画像を再利用する。
+                return self._last_bgr
+            try:
+                bgr = self._frame_to_bgr(frame)
+            finally:
+                frame.close()
+            if bgr is not None:
+                self._last_bgr = bgr
+            return self._last_bgr
+
+    def _frame_to_bgr(self, frame) -> Optional[np.ndarray]:
+        """キャプチャフレームを CPU 側へコピーして BGR 画像にする。"""
+        content = frame.content_size
+        width = int(content.width)
+        height = int(content.height)
+        if width != int(self._pool_size.width) or height != int(self._pool_size.height):
+            # ウィンドウサイズ変更時はプールを作り直し、次フレームから新サイズで受け取る。
+            self._pool_size = content
+            self._pool.recreate(
+                self._device,
+                self._pixel_format,
+                _WGC_FRAME_POOL_BUFFERS,
+                content,
+            )
+        api = self._api
+        bitmap = self._loop.run_until_complete(
+            _await_winrt(api.SoftwareBitmap.create_copy_from_surface_async(frame.surface))
+        )
+        try:
+            buffer = bitmap.lock_buffer(api.BitmapBufferAccessMode.READ)
+            try:
+                plane = buffer.get_plane_description(0)
+                reference = buffer.create_reference()
+                try:
+                    raw = np.frombuffer(reference, dtype=np.uint8)
+                    return _bgra_plane_to_bgr(
+                        raw,
+                        offset=int(plane.start_index),
+                        stride=int(plane.stride),
+                        width=min(width, int(plane.width)),
+                        height=min(height, int(plane.height)),
+                    )
+                finally:
+                    reference.close()
+            finally:
+                buffer.close()
+        finally:
+            bitmap.close()
+
+    def close(self) -> None:
+        """WGC セッションとフレームプールを解放する。"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for resource in (self._session, self._pool):
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+            self._last_bgr = None
+            self._loop.close()
+
+
+def capture_window_bgr(hwnd: int) -> Optional[np.ndarray]:
+    """WGC で対象ウィンドウ全体を BGR 画像として取得する。使えなければ None を返す。"""
+    global _active_session
+    api = _winrt_api()
+    if api is None:
+        return None
+    hwnd = int(hwnd)
+    with _sessions_lock:
+        failed_at = _failed_hwnds.get(hwnd)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < _WGC_RETRY_AFTER_SEC:
+                return None
+            del _failed_hwnds[hwnd]
+        session = _active_session
+        if session is None or session.hwnd != hwnd:
+            # 対象切替時は旧セッションを閉じ、同時に保持する WGC セッションは1つだけにする。
+            if session is not None:
+                session.close()
+                _active_session = None
+            try:
+                session = _WgcWindowSession(api, hwnd)
+            except Exception:
+                _failed_hwnds[hwnd] = time.monotonic()
+                return None
+            _active_session = session
+    try:
+        return session.grab()
+    except Exception:
+        # ウィンドウ破棄などで失敗したセッションは破棄し、次回は PrintWindow 経路へ任せる。
+        with _sessions_lock:
+            if _active_session is session:
+                session.close()
+                _active_session = None
+            _failed_hwnds[hwnd] = time.monotonic()
+        return None
+
+
+def close_capture_sessions() -> None:
+    """保持中の WGC セッションを閉じ、失敗記録もリセットする。"""
+    global _active_session
+    with _sessions_lock:
+        session = _active_session
+        _active_session = None
+        _failed_hwnds.clear()
+    if session is not None:
+        session.close()
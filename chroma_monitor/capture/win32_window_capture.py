@@ -1,17 +1,21 @@
 """Win32 ウィンドウの低レベルキャプチャ補助。"""
 
+from functools import lru_cache
 from typing import Optional
 
 import cv2
 import numpy as np
 from PySide6.QtCore import QRect
 
+from . import wgc_capture
 from .win32_windows import HAS_WIN32, ctypes_win_api, win32gui
 
 _ctypes_win = ctypes_win_api
 _WIN_BI_RGB = 0
 _WIN_DIB_RGB_COLORS = 0
 _WIN_PRINTWINDOW_FULL = 0x00000002
+_WIN_DWMWA_EXTENDED_FRAME_BOUNDS = 9
+_WIN_DWMWA_CLOAKED = 14
 
 
 def get_window_rect(hwnd: int) -> Optional[QRect]:
@@ -56,6 +60,58 @@ def is_window_minimized(hwnd: int) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
+def _dwm_get_window_attribute():
+    """dwmapi.DwmGetWindowAttribute を1度だけ解決し、使えなければ None を返す。"""
+    if not HAS_WIN32:
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        fn = ctypes.windll.dwmapi.DwmGetWindowAttribute
+        fn.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+        fn.restype = ctypes.c_long
+        return fn
+    except Exception:
+        return None
+
+
+def is_window_cloaked(hwnd: int) -> bool:
+    """対象ウィンドウが DWM にクローク(別仮想デスクトップ等で非表示)されているか判定する。"""
+    fn = _dwm_get_window_attribute()
+    if fn is None:
+        return False
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        cloaked = wintypes.DWORD(0)
+        hr = fn(hwnd, _WIN_DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked))
+        # 失敗時は判定不能として通常どおりキャプチャさせる。
+        return hr == 0 and bool(cloaked.value)
+    except Exception:
+        return False
+
+
+def get_window_frame_bounds(hwnd: int) -> Optional[QRect]:
+    """DWM が合成する可視枠(不可視のリサイズ境界を除く)の矩形を返す。取れなければ None。"""
+    fn = _dwm_get_window_attribute()
+    if fn is None:
+        return None
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        rect = wintypes.RECT()
+        hr = fn(hwnd, _WIN_DWMWA_EXTENDED_FRAME_BOUNDS, ctypes.byref(rect), ctypes.sizeof(rect))
+        if hr != 0 or rect.right - rect.left <= 0 or rect.bottom - rect.top <= 0:
+            return None
+        return QRect(rect.left, rect.top, rect.right - rect.left, rect.bottom - rect.top)
+    except Exception:
+        return None
+
+
 def _capture_window_size(hwnd: int, *, get_window_rect_fn=get_window_rect) -> Optional[tuple[int, int]]:
     """対象ウィンドウのキャプチャ寸法を返す。"""
     wrect = get_window_rect_fn(hwnd)
@@ -156,14 +212,24 @@ def _dib_bits_to_bgr(*, ctypes_mod, bits, width: int, height: int) -> np.ndarray
     return cv2.cvtColor(bgra, cv2.COLOR_BGRA2BGR)
 
 
-def capture_window_bgr(
+def capture_window_frame(
     hwnd: int,
     *,
     get_window_rect_fn=get_window_rect,
-) -> Optional[np.ndarray]:
-    """Win32 APIで対象ウィンドウ全体を BGR 画像として取得する。"""
+) -> tuple[Optional[np.ndarray], Optional[QRect]]:
+    """対象ウィンドウ全体の BGR 画像と、画像が覆う画面矩形(ウィンドウ矩形と同じなら None)を返す。"""
     if not HAS_WIN32:
-        return None
+        return None, None
+    # WGC が使える環境では GPU 合成済みフレームを使い、PrintWindow の CPU 転送を避ける。
+    bgr = wgc_capture.capture_window_bgr(hwnd)
+    if bgr is not None:
+        # WGC のフレームは DWM の可視枠単位なので、GetWindowRect ではなく同じ枠で座標を対応させる。
+        return bgr, get_window_frame_bounds(hwnd)
+    return _print_window_bgr(hwnd, get_window_rect_fn=get_window_rect_fn), None
+
+
+def _print_window_bgr(hwnd: int, *, get_window_rect_fn=get_window_rect) -> Optional[np.ndarray]:
+    """PrintWindow で GetWindowRect 全体を BGR 画像として取得する。"""
     try:
         import ctypes
         from ctypes import wintypes
@@ -209,3 +275,8 @@ def capture_window_bgr(
             _release_window_capture_dc(user32, gdi32, hwnd, hwnd_dc, mem_dc)
     except Exception:
         return None
+
+
+def close_window_capture_sessions() -> None:
+    """ウィンドウキャプチャで保持している WGC セッションを解放する。"""
+    wgc_capture.close_capture_sessions()
@@ -1,6 +1,17 @@
 import sys
+import threading
+import time
+from concurrent.futures import Future
 
 HAS_WIN32 = sys.platform.startswith("win")
+# フォーカス時とポップアップ表示時の連続更新で同じ列挙を繰り返さないための保持秒数。
+_LIST_WINDOWS_CACHE_TTL_SEC = 0.5
+_list_windows_cache: tuple[float, list[tuple[int, str]]] | None = None
+# 先行列挙の完了待ち上限。超えたら GUI スレッドで列挙し直し、起動が固まらないようにする。
+_LIST_WINDOWS_PREFETCH_WAIT_SEC = 1.0
+_list_windows_prefetch: Future | None = None
+# ほぼ全てのタイトルが収まる長さ。これで足りない時だけ長さを問い合わせて取り直す。
+_WINDOW_TITLE_BUFFER_CHARS = 512
 
 ctypes_win_api = None
 if HAS_WIN32:
@@ -49,17 +60,19 @@ def _list_windows_pywin32() -> list[tuple[int, str]]:
     """pywin32 バックエンドでウィンドウ一覧を取得する。"""
     if not win32gui:
         return []
-    out: list[tuple[int, str]] = []
-
-    def enum_proc(hwnd, _):
-        if not win32gui.IsWindowVisible(hwnd):
-            return
-        title = win32gui.GetWindowText(hwnd)
-        if not title or not title.strip():
-            return
-        out.append((hwnd, title))
+    # コールバックでは hwnd の収集だけ行い、可視判定/タイトル取得は列挙後にまとめて行う。
+    hwnds: list[int] = []
+    win32gui.EnumWindows(lambda hwnd, acc: acc.append(hwnd), hwnds)
 
-    win32gui.EnumWindows(enum_proc, None)
+    is_window_visible = win32gui.IsWindowVisible
+    get_window_text = win32gui.GetWindowText
+    out: list[tuple[int, str]] = []
+    for hwnd in hwnds:
+        if not is_window_visible(hwnd):
+            continue
+        title = get_window_text(hwnd)
+        if title and title.strip():
+            out.append((hwnd, title))
     return out
 
 
@@ -70,35 +83,106 @@ def _list_windows_ctypes() -> list[tuple[int, str]]:
     import ctypes
     from ctypes import wintypes
 
-    out: list[tuple[int, str]] = []
     enum_windows = ctypes_win_api["EnumWindows"]
     is_window_visible = ctypes_win_api["IsWindowVisible"]
     get_window_text_length = ctypes_win_api["GetWindowTextLengthW"]
     get_window_text = ctypes_win_api["GetWindowTextW"]
 
+    # コールバックでは hwnd の収集だけ行い、C->Python の往復中に追加の API 呼び出しをしない。
+    hwnds: list[int] = []
+
     @ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
     def enum_proc(hwnd, _lparam):
+        hwnds.append(hwnd)
+        return True
+
+    enum_windows(enum_proc, 0)
+
+    out: list[tuple[int, str]] = []
+    buf = ctypes.create_unicode_buffer(_WINDOW_TITLE_BUFFER_CHARS)
+    for hwnd in hwnds:
         if not is_window_visible(hwnd):
-            return True
-        length = get_window_text_length(hwnd)
-        if length == 0:
-            return True
-        buf = ctypes.create_unicode_buffer(length + 1)
-        get_window_text(hwnd, buf, length + 1)
+            continue
+        # 長さ取得を挟まず固定長バッファへ1回で読み、user32 呼び出しを半分にする。
+        copied = get_window_text(hwnd, buf, len(buf))
+        if copied <= 0:
+            continue
+        if copied >= len(buf) - 1:
+            # バッファ一杯まで埋まった長いタイトルだけ、実長で取り直して切り詰めを防ぐ。
+            length = get_window_text_length(hwnd)
+            if length + 1 > len(buf):
+                buf = ctypes.create_unicode_buffer(length + 1)
+                get_window_text(hwnd, buf, len(buf))
         title = buf.value
         if title and title.strip():
             out.append((hwnd, title))
-        return True
+    return out
 
-    enum_windows(enum_proc, 0)
+
+def _enumerate_windows_sorted() -> list[tuple[int, str]]:
+    """OS からウィンドウ一覧を列挙し、タイトル順に並べて返す。"""
+    out = _list_windows_pywin32() if win32gui else _list_windows_ctypes()
+    out.sort(key=lambda x: x[1].lower())
     return out
 
 
+def prefetch_list_windows() -> None:
+    """ウィンドウ列挙を別スレッドで先行開始し、次の `list_windows` でその結果を使う。"""
+    global _list_windows_prefetch
+    if not HAS_WIN32 or _list_windows_prefetch is not None:
+        return
+    future: Future = Future()
+
+    def _run() -> None:
+        try:
+            future.set_result(_enumerate_windows_sorted())
+        except Exception as exc:
+            future.set_exception(exc)
+
+    _list_windows_prefetch = future
+    threading.Thread(target=_run, name="list-windows-prefetch", daemon=True).start()
+
+
+def _take_prefetched_windows() -> list[tuple[int, str]] | None:
+    """先行列挙の結果を1回だけ受け取る。未開始/失敗/待ち時間超過なら None。"""
+    global _list_windows_prefetch
+    future, _list_windows_prefetch = _list_windows_prefetch, None
+    if future is None:
+        return None
+    try:
+        return future.result(timeout=_LIST_WINDOWS_PREFETCH_WAIT_SEC)
+    except Exception:
+        return None
+
+
+def discard_list_windows_prefetch() -> None:
+    """未使用の先行列挙結果を破棄し、以降の `list_windows` を OS 列挙へ戻す。"""
+    global _list_windows_prefetch
+    _list_windows_prefetch = None
+
+
+def clear_list_windows_cache() -> None:
+    """`list_windows` の短期キャッシュを破棄する。"""
+    # 起動中の先行列挙は同じ起動処理内の最新結果なので残し、復元時の再取得で使う。
+    # 使われなかった分は起動完了時に `discard_list_windows_prefetch` で捨てる。
+    global _list_windows_cache
+    _list_windows_cache = None
+
+
 def list_windows():
     """表示中のトップレベルウィンドウ一覧 `(hwnd, title)` を返す。"""
+    global _list_windows_cache
     if not HAS_WIN32:
         return []
 
-    out = _list_windows_pywin32() if win32gui else _list_windows_ctypes()
-    out.sort(key=lambda x: x[1].lower())
-    return out
+    now = time.monotonic()
+    cached = _list_windows_cache
+    if cached is not None and 0.0 <= now - cached[0] <= _LIST_WINDOWS_CACHE_TTL_SEC:
+        return list(cached[1])
+
+    out = _take_prefetched_windows()
+    if out is None:
+        out = _enumerate_windows_sorted()
+    _list_windows_cache = (time.monotonic(), out)
+    # 呼び出し側での並べ替え等がキャッシュへ波及しないようコピーを返す。
+    return list(out)
@@ -1,28 +1,12 @@
-from PySide6.QtCore import QEvent, Qt, QTimer
-from PySide6.QtNetwork import QNetworkAccessManager
-from PySide6.QtWidgets import (
-    QCheckBox,
-    QComboBox,
-    QCompleter,
-    QDoubleSpinBox,
-    QLabel,
-    QMainWindow,
-    QMenu,
-    QMenuBar,
-    QPushButton,
-)
+from functools import partial
+
+from PySide6.QtCore import QEvent, QMetaObject, QModelIndex, QObject, Qt, QTimer, Slot
+from PySide6.QtWidgets import QApplication, QDockWidget, QMainWindow, QMenu, QPushButton
 
 from .analyzer import AnalyzerWorker
-from .capture.win32_windows import HAS_WIN32
+from .capture.win32_windows import HAS_WIN32, discard_list_windows_prefetch, prefetch_list_windows
 from .ui import layout_presets as mw_layout_presets
-from .ui.input_widgets import (
-    RefreshOnInteractComboBox,
-    SelectAllLineEdit,
-    SelectAllSpinBox,
-    SplitMenuToolButton,
-    add_checkable_action,
-    configure_numeric_input,
-)
+from .ui.input_widgets import SplitMenuToolButton, add_checkable_action, make_checkable_action
 from .ui.main_window import control_signals as mw_controls_signals
 from .ui.main_window import control_widgets as mw_controls
 from .ui.main_window import help_actions as mw_help
@@ -32,12 +16,9 @@ from .ui.main_window import result_snapshot as mw_snapshot
 from .ui.main_window import roi_handlers as mw_roi
 from .ui.main_window import runtime_actions as mw_runtime
 from .ui.main_window import settings_logic as mw_settings
-from .ui.main_window import tools_actions as mw_tools
 from .ui.main_window import window_layout as mw_windowing
 from .ui.main_window import window_tabs as mw_tabs
 from .ui.main_window import window_topmost as mw_topmost
-from .ui.settings_dialog import hide_settings_window as hide_settings_dialog_window
-from .ui.settings_dialog import show_settings_window as show_settings_dialog_window
 from .ui.view_docks import setup_view_docks
 from .util import constants as C
 from .util.debug_log import is_window_layout_debug_enabled
@@ -61,12 +42,58 @@ _WINDOW_DOCK_MENU_ITEMS = (
 )
 _DEFAULT_PREVIEW_WINDOW = False
 _SETTINGS_SAVE_DEBOUNCE_MS = 220
+_SETTINGS_APPLY_THROTTLE_MS = 50
 _DOCK_REBALANCE_DEBOUNCE_MS = 36
 _LAYOUT_INTERACTION_RESUME_DEBOUNCE_MS = 220
+_VIEW_FLAGS_SYNC_THROTTLE_MS = 50
+_LAYOUT_DIRTY_AUTOSAVE = 1
+_LAYOUT_DIRTY_REBALANCE = 2
+_LAYOUT_DIRTY_FIT = 4
+#: ドラッグ中に保持した要求ビットの解放確認間隔(ms)。解放イベントの取りこぼし対策。
+_LAYOUT_DIRTY_RELEASE_POLL_MS = 250
 _FOCUS_PEAK_THICKNESS_STEP = 0.1
 _SQUINT_BLUR_SIGMA_STEP = 0.1
 
 
+class _MouseReleaseWatcher(QObject):
+    """左ボタンが離されたときに1回だけ callback を呼ぶアプリ全体のイベントフィルタ。"""
+
+    def __init__(self, callback, parent=None):
+        """離された時に呼ぶ callback を保持する。"""
+        super().__init__(parent)
+        self._callback = callback
+        self._installed = False
+
+    def arm(self) -> None:
+        """次の左ボタン解放を待ち受ける。既に待機中なら何もしない。"""
+        app = QApplication.instance()
+        if self._installed or app is None:
+            return
+        self._installed = True
+        app.installEventFilter(self)
+
+    def disarm(self) -> None:
+        """待ち受け中ならフィルタを外す。"""
+        if not self._installed:
+            return
+        self._installed = False
+        app = QApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """左ボタン解放でフィルタを外し、callback を呼ぶ。"""
+        # タイトルバーや枠のドラッグ(フローティングドック移動)は非クライアント領域の解放になる。
+        if (
+            event.type() in (QEvent.MouseButtonRelease, QEvent.NonClientAreaMouseButtonRelease)
+            and event.button() == Qt.LeftButton
+        ):
+            # 全イベントを通るフィルタなので、待ち受けが済んだら即座に外す。
+            self.disarm()
+            self._callback()
+        return False
+
+
 def _sync_toolbar_button_geometry(main_window) -> None:
     """split button の高さを Start / Stop ボタンへ揃える。"""
     start_button = getattr(main_window, "btn_start_bar", None)
@@ -101,6 +128,8 @@ class MainWindow(QMainWindow):
     def __init__(self):
         """ウィンドウ状態・各種UI・シグナル接続を順に初期化する。"""
         super().__init__()
+        # 設定ロード時の対象ウィンドウ復元で使う OS のウィンドウ列挙を、UI 構築と並行して進める。
+        prefetch_list_windows()
         self._init_window_runtime_state()
         self._init_analyzer_workers()
 
@@ -112,7 +141,8 @@ class MainWindow(QMainWindow):
         self._setup_preview_and_docks()
 
         # --- Styling (theme) ---
-        self._apply_ui_style()
+        # テーマは load_settings 内の apply_theme_settings で表示前に1回だけ適用する。
+        # ここで既定テーマを先に当てると、全体スタイルシートの構築と polish が起動時に二重になる。
 
         # --- Init ---
         self._initialize_runtime_defaults()
@@ -128,6 +158,7 @@ class MainWindow(QMainWindow):
         self.resize(1120, 700)
         self._did_initial_screen_fit = False
         self._layout_autosave_enabled = False
+        self._layout_restore_in_progress = False
         self._layout_save_timer = QTimer(self)
         self._layout_save_timer.setSingleShot(True)
         self._layout_save_timer.setInterval(600)
@@ -143,7 +174,27 @@ class MainWindow(QMainWindow):
         self._dock_rebalance_timer.setInterval(_DOCK_REBALANCE_DEBOUNCE_MS)
         self._dock_rebalance_timer.timeout.connect(self._rebalance_dock_layout)
         self._dock_rebalance_running = False
+        # 1回のリサイズで大量に届く LayoutRequest 等は要求ビットへ畳み込み、
+        # イベントループ1周ごとに各デバウンスタイマーを1回だけ再始動する。
+        self._layout_dirty = 0
+        # ドラッグ中に積まれた要求ビットは、左ボタン解放時に1回だけ処理する。
+        self._layout_dirty_release_watcher = _MouseReleaseWatcher(self._mark_layout_released, self)
+        self._layout_dirty_timer = QTimer(self)
+        self._layout_dirty_timer.setSingleShot(True)
+        self._layout_dirty_timer.setInterval(0)
+        self._layout_dirty_timer.timeout.connect(self._process_layout_dirty)
+        self._window_menu_sync_timer = QTimer(self)
+        self._window_menu_sync_timer.setSingleShot(True)
+        self._window_menu_sync_timer.setInterval(0)
+        self._window_menu_sync_timer.timeout.connect(self.sync_window_menu_checks)
+        self._placeholder_update_timer = QTimer(self)
+        self._placeholder_update_timer.setSingleShot(True)
+        self._placeholder_update_timer.setInterval(0)
+        self._placeholder_update_timer.timeout.connect(self.update_placeholder)
         self._dockability_sync_timer = None
+        # fit_window_to_desktop が使う全画面の利用可能領域。画面構成の変化通知で破棄する。
+        self._desktop_available_geometry = None
+        self._desktop_geometry_watched = False
         self._dock_geometry_snapshot = {}
         self._dock_rebalance_last_main_size = self.size()
         self._layout_interaction_pause_active = False
@@ -152,6 +203,35 @@ class MainWindow(QMainWindow):
         self._layout_interaction_resume_timer.setSingleShot(True)
         self._layout_interaction_resume_timer.setInterval(_LAYOUT_INTERACTION_RESUME_DEBOUNCE_MS)
         self._layout_interaction_resume_timer.timeout.connect(self._end_layout_interaction_pause)
+        self._view_flags_sync_timer = QTimer(self)
+        self._view_flags_sync_timer.setSingleShot(True)
+        self._view_flags_sync_timer.setInterval(_VIEW_FLAGS_SYNC_THROTTLE_MS)
+        self._view_flags_sync_timer.timeout.connect(self._sync_worker_view_flags)
+        # 同一イベントループ内で連続するフローティング切替は、ドックごとの最終状態だけ反映する。
+        self._pending_dock_top_level = {}
+        self._dock_top_level_timer = QTimer(self)
+        self._dock_top_level_timer.setSingleShot(True)
+        self._dock_top_level_timer.setInterval(0)
+        self._dock_top_level_timer.timeout.connect(self._flush_dock_top_level_changes)
+        # スライダー操作などで同じ apply_* が連続しても、イベントループ1周につき1回だけ反映する。
+        self._pending_settings_applies = {}
+        self._wheel_sat_threshold_cache = None
+        self._layout_presets_cache = None
+        # プリセットのコンボ/メニューに現在並んでいる名前一覧。
+        self._layout_preset_names = None
+        # 自動保存で最後に書き込んだ配置。変化がなければ設定ファイルへ触れない。
+        self._last_saved_layout = None
+        # move/resize 由来で最後に自動保存を予約したときの (x, y, 幅, 高さ)。
+        self._autosave_geometry_key = None
+        # update_placeholder が最後に反映した (可視ドック有無, 案内文表示) の組。
+        self._placeholder_state = None
+        # 高彩度警告ラベルへ最後に反映した (高彩度率, しきい値)。
+        self._vectorscope_warning_key = None
+        self._settings_apply_timer = QTimer(self)
+        self._settings_apply_timer.setSingleShot(True)
+        # スピンの押しっぱなし/ドラッグ中もワーカーへの反映は 50ms に1回までに抑える。
+        self._settings_apply_timer.setInterval(_SETTINGS_APPLY_THROTTLE_MS)
+        self._settings_apply_timer.timeout.connect(self._flush_settings_applies)
         self._settings_save_timer = QTimer(self)
         self._settings_save_timer.setSingleShot(True)
         self._settings_save_timer.setInterval(_SETTINGS_SAVE_DEBOUNCE_MS)
@@ -164,13 +244,16 @@ class MainWindow(QMainWindow):
         self._release_page_url = C.APP_RELEASES_URL
         self._update_check_started = False
         self._update_reply = None
-        self._update_network = QNetworkAccessManager(self)
-        self._update_network.finished.connect(self._on_release_check_finished)
+        # QNetworkAccessManager は更新確認を実際に送る時まで生成しない。
+        self._update_network = None
         self._ui_theme_name = C.DEFAULT_UI_THEME
         self._ui_theme = None
         # ROI選択オーバーレイ（マルチモニタ対応）管理。
         self._roi_selectors = []
         self._canvas_preview_window = None
+        # eventFilter が毎イベント直接参照するため、ドック構築前から属性を用意しておく。
+        self.top_colors_bar = None
+        self.dock_color_band = None
         self._loaded_image_source_path = ""
         self._loaded_image_source_name = ""
         self._loaded_image_source_bgr = None
@@ -182,474 +265,38 @@ class MainWindow(QMainWindow):
         """ライブ解析と画像解析のワーカー参照を初期化する。"""
         # キャプチャ解析ワーカー（ライブ）と画像解析ワーカー（単発）を分離して保持。
         self.worker = AnalyzerWorker()
-        self.worker.resultReady.connect(self.on_result)
+        # 結果はキュー接続で受け、描画が追いつかない間は最新1件へ畳み込んで反映する。
+        self._pending_result = None
+        self._result_flush_scheduled = False
+        self._result_flush_timer = QTimer(self)
+        self._result_flush_timer.setSingleShot(True)
+        self._result_flush_timer.setInterval(0)
+        self._result_flush_timer.timeout.connect(self._drain_pending_result)
+        self.worker.resultReady.connect(self._enqueue_result, Qt.QueuedConnection)
         self.worker.status.connect(self.on_status)
         self._image_thread = None
         self._image_worker = None
         self._image_progress = None
 
-    @staticmethod
-    def _set_widget_unit_label(widget, suffix: str) -> None:
-        """設定ダイアログ表示用の単位ラベル文字列をウィジェットへ保持する。"""
-        widget._chroma_unit_label_text = str(suffix).strip()
-
-    @staticmethod
-    def _populate_data_combo(combo: QComboBox, items) -> None:
-        """`(label, data)` 形式の候補列でコンボを初期化する。"""
-        combo.clear()
-        for label, data in items:
-            combo.addItem(label, data)
-
-    @staticmethod
-    def _build_int_spinbox(
-        minimum: int,
-        maximum: int,
-        value: int,
-        *,
-        step: int = 1,
-        suffix: str = "",
-        min_width: int = 110,
-        min_height: int = 28,
-    ) -> SelectAllSpinBox:
-        """共通設定済みの整数入力欄を生成する。"""
-        spin = SelectAllSpinBox()
-        spin.setRange(int(minimum), int(maximum))
-        spin.setSingleStep(int(step))
-        spin.setValue(int(value))
-        if suffix:
-            MainWindow._set_widget_unit_label(spin, suffix)
-        configure_numeric_input(spin, min_width=min_width, min_height=min_height)
-        return spin
-
-    @staticmethod
-    def _build_double_spinbox(
-        minimum: float,
-        maximum: float,
-        value: float,
-        *,
-        decimals: int,
-        step: float,
-        suffix: str = "",
-        min_width: int = 110,
-        min_height: int = 28,
-    ) -> QDoubleSpinBox:
-        """共通設定済みの小数入力欄を生成する。"""
-        spin = QDoubleSpinBox()
-        spin.setRange(float(minimum), float(maximum))
-        spin.setDecimals(int(decimals))
-        spin.setSingleStep(float(step))
-        spin.setValue(float(value))
-        if suffix:
-            MainWindow._set_widget_unit_label(spin, suffix)
-        configure_numeric_input(spin, min_width=min_width, min_height=min_height)
-        return spin
-
-    def _populate_harmony_guide_combo(self, combo: QComboBox) -> None:
-        """色彩調和ガイド用コンボへ候補を設定する。"""
-        self._populate_data_combo(
-            combo,
-            (
-                (C.WHEEL_HARMONY_GUIDE_LABELS[guide_type], guide_type)
-                for guide_type in C.WHEEL_HARMONY_GUIDE_COMBO_ORDER
-            ),
-        )
-
-    def _build_control_widgets(self) -> None:
-        """設定・操作に使う入力ウィジェット群を生成する。"""
-        # --- Controls: キャプチャ/解析設定 ---
-        self.combo_win = RefreshOnInteractComboBox()
-        self.combo_win.setEditable(True)
-        self.combo_win.setInsertPolicy(QComboBox.NoInsert)
-        self.combo_win.set_refresh_callback(
-            lambda force=False: self.refresh_windows(announce=False, force=bool(force))
-        )
-        win_completer = QCompleter(self.combo_win.model(), self.combo_win)
-        win_completer.setCaseSensitivity(Qt.CaseInsensitive)
-        win_completer.setFilterMode(Qt.MatchContains)
-        win_completer.setCompletionMode(QCompleter.PopupCompletion)
-        self.combo_win.setCompleter(win_completer)
-        if self.combo_win.lineEdit() is not None:
-            self.combo_win.lineEdit().setClearButtonEnabled(True)
-            self.combo_win.lineEdit().setPlaceholderText("ウィンドウ名を入力")
-            self.combo_win.lineEdit().setToolTip(
-                "ウィンドウ名の一部を入力して候補を絞り込めます。"
-            )
-        self.btn_pick_roi_win = QPushButton("領域選択（ウィンドウ内）")
-        self.btn_pick_roi_screen = QPushButton("領域選択（画面）")
-        # 設定ダイアログ上の Enter で領域選択ボタンが誤起動しないようにする。
-        for btn in (self.btn_pick_roi_win, self.btn_pick_roi_screen):
-            btn.setAutoDefault(False)
-            btn.setDefault(False)
-
-        self.spin_interval = self._build_double_spinbox(
-            0.10,
-            10.00,
-            C.DEFAULT_INTERVAL_SEC,
-            decimals=1,
-            step=0.10,
-            suffix=" 秒",
-        )
-
-        self.spin_points = self._build_int_spinbox(
-            C.ANALYZER_MIN_SAMPLE_POINTS,
-            C.ANALYZER_MAX_SAMPLE_POINTS,
-            C.DEFAULT_SAMPLE_POINTS,
-            step=500,
-        )
-        self.combo_analysis_resolution_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_analysis_resolution_mode,
-            (
-                ("オリジナルサイズ", C.ANALYSIS_RESOLUTION_MODE_ORIGINAL),
-                ("指定サイズ", C.ANALYSIS_RESOLUTION_MODE_CUSTOM),
-            ),
-        )
-        self.edit_analysis_max_dim = self._build_int_spinbox(
-            C.ANALYZER_MAX_DIM_MIN,
-            C.ANALYZER_MAX_DIM_MAX,
-            C.ANALYZER_MAX_DIM,
-            step=10,
-            suffix=" px",
-        )
-
-        self.combo_capture_source = QComboBox()
-        self._populate_data_combo(
-            self.combo_capture_source,
-            (
-                ("ウィンドウを選んで取得", C.CAPTURE_SOURCE_WINDOW),
-                ("画面範囲を直接指定", C.CAPTURE_SOURCE_SCREEN),
-            ),
-        )
-
-        self.combo_scatter_shape = QComboBox()
-        self._populate_data_combo(
-            self.combo_scatter_shape,
-            (
-                ("四角", C.SCATTER_SHAPE_SQUARE),
-                ("三角", C.SCATTER_SHAPE_TRIANGLE),
-            ),
-        )
-        self.combo_scatter_render_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_scatter_render_mode,
-            (
-                ("色をそのまま", C.SCATTER_RENDER_MODE_DOMINANT),
-                ("ヒートマップ", C.SCATTER_RENDER_MODE_HEATMAP),
-            ),
-        )
-        self.combo_wheel_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_wheel_mode,
-            (
-                ("HSV 180ビン", C.WHEEL_MODE_HSV180),
-                ("マンセル基準（40色相）", C.WHEEL_MODE_MUNSELL40),
-            ),
-        )
-
-        self.chk_wheel_harmony_guide = QCheckBox("色彩調和ガイドを表示")
-        self.chk_wheel_harmony_guide.setChecked(C.DEFAULT_WHEEL_HARMONY_GUIDE_ENABLED)
-        self.combo_wheel_harmony_guide = QComboBox()
-        self._populate_harmony_guide_combo(self.combo_wheel_harmony_guide)
-        default_harmony_idx = self.combo_wheel_harmony_guide.findData(
-            C.DEFAULT_WHEEL_HARMONY_GUIDE_TYPE
-        )
-        if default_harmony_idx >= 0:
-            self.combo_wheel_harmony_guide.setCurrentIndex(default_harmony_idx)
-        self.combo_wheel_harmony_guide.setEnabled(C.DEFAULT_WHEEL_HARMONY_GUIDE_ENABLED)
-        self.combo_rgb_hist_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_rgb_hist_mode,
-            (
-                ("横並び", C.RGB_HIST_MODE_SIDE_BY_SIDE),
-                ("重ね表示", C.RGB_HIST_MODE_OVERLAY),
-            ),
-        )
-        self.combo_mirror_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_mirror_mode,
-            (
-                ("左右", C.MIRROR_MODE_HORIZONTAL),
-                ("上下", C.MIRROR_MODE_VERTICAL),
-                ("上下左右", C.MIRROR_MODE_BOTH),
-            ),
-        )
-        self.spin_wheel_sat_threshold = self._build_int_spinbox(
-            C.WHEEL_SAT_THRESHOLD_MIN,
-            C.WHEEL_SAT_THRESHOLD_MAX,
-            C.DEFAULT_WHEEL_SAT_THRESHOLD,
-            suffix=" / 255",
-        )
-        self.chk_color_band_use_wheel_sat_threshold = QCheckBox("彩度しきい値を色相環と同じにする")
-        self.chk_color_band_use_wheel_sat_threshold.setChecked(
-            C.DEFAULT_COLOR_BAND_USE_WHEEL_SAT_THRESHOLD
-        )
-        self.spin_color_band_sat_threshold = self._build_int_spinbox(
-            C.WHEEL_SAT_THRESHOLD_MIN,
-            C.WHEEL_SAT_THRESHOLD_MAX,
-            C.DEFAULT_COLOR_BAND_SAT_THRESHOLD,
-            suffix=" / 255",
-        )
-        self.chk_color_band_use_wheel_harmony = QCheckBox("色彩調和を色相環と同じ設定にする")
-        self.chk_color_band_use_wheel_harmony.setChecked(C.DEFAULT_COLOR_BAND_USE_WHEEL_HARMONY)
-        self.chk_color_band_harmony_guide = QCheckBox("色彩調和を表示")
-        self.chk_color_band_harmony_guide.setChecked(C.DEFAULT_COLOR_BAND_HARMONY_GUIDE_ENABLED)
-        self.combo_color_band_harmony_guide = QComboBox()
-        self._populate_harmony_guide_combo(self.combo_color_band_harmony_guide)
-        default_color_band_harmony_idx = self.combo_color_band_harmony_guide.findData(
-            C.DEFAULT_COLOR_BAND_HARMONY_GUIDE_TYPE
-        )
-        if default_color_band_harmony_idx >= 0:
-            self.combo_color_band_harmony_guide.setCurrentIndex(default_color_band_harmony_idx)
-        self.spin_color_band_sat_threshold.setEnabled(
-            not self.chk_color_band_use_wheel_sat_threshold.isChecked()
-        )
-        own_harmony_enabled = (
-            not self.chk_color_band_use_wheel_harmony.isChecked()
-            and self.chk_color_band_harmony_guide.isChecked()
-        )
-        self.chk_color_band_harmony_guide.setEnabled(
-            not self.chk_color_band_use_wheel_harmony.isChecked()
-        )
-        self.combo_color_band_harmony_guide.setEnabled(own_harmony_enabled)
-
-        self.combo_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_mode,
-            (
-                ("一定間隔で更新", C.UPDATE_MODE_INTERVAL),
-                ("画面に動きがあったとき", C.UPDATE_MODE_CHANGE),
-            ),
-        )
-        self.spin_diff = self._build_double_spinbox(
-            C.ANALYZER_MIN_DIFF_THRESHOLD,
-            50.0,
-            C.DEFAULT_DIFF_THRESHOLD,
-            decimals=2,
-            step=0.01,
-        )
-        self.spin_stable = self._build_int_spinbox(
-            C.ANALYZER_MIN_STABLE_FRAMES,
-            20,
-            C.DEFAULT_STABLE_FRAMES,
-        )
-        self.spin_edge_sensitivity = self._build_int_spinbox(
-            C.EDGE_SENSITIVITY_MIN,
-            C.EDGE_SENSITIVITY_MAX,
-            C.DEFAULT_EDGE_SENSITIVITY,
-            suffix=" / 100",
-            min_width=130,
-        )
-        self.combo_binary_preset = QComboBox()
-        self._populate_data_combo(
-            self.combo_binary_preset,
-            (
-                ("自動", C.BINARY_PRESET_AUTO),
-                ("白を増やす", C.BINARY_PRESET_MORE_WHITE),
-                ("黒を増やす", C.BINARY_PRESET_MORE_BLACK),
-            ),
-        )
-        self.combo_ternary_preset = QComboBox()
-        self._populate_data_combo(
-            self.combo_ternary_preset,
-            (
-                ("標準", C.TERNARY_PRESET_STANDARD),
-                ("やわらかめ", C.TERNARY_PRESET_SOFT),
-                ("くっきり", C.TERNARY_PRESET_STRONG),
-            ),
-        )
-        self.spin_saliency_alpha = self._build_int_spinbox(
-            C.SALIENCY_ALPHA_MIN,
-            C.SALIENCY_ALPHA_MAX,
-            C.DEFAULT_SALIENCY_OVERLAY_ALPHA,
-            suffix=" %",
-        )
-        self.combo_composition_guide = QComboBox()
-        self._populate_data_combo(
-            self.combo_composition_guide,
-            (
-                ("なし", C.COMPOSITION_GUIDE_NONE),
-                ("三分割", C.COMPOSITION_GUIDE_THIRDS),
-                ("中央クロス", C.COMPOSITION_GUIDE_CENTER),
-                ("対角線", C.COMPOSITION_GUIDE_DIAGONAL),
-            ),
-        )
-        self.spin_focus_peak_sensitivity = self._build_int_spinbox(
-            C.FOCUS_PEAK_SENSITIVITY_MIN,
-            C.FOCUS_PEAK_SENSITIVITY_MAX,
-            C.DEFAULT_FOCUS_PEAK_SENSITIVITY,
-            suffix=" / 100",
-            min_width=130,
-        )
-        self.combo_focus_peak_color = QComboBox()
-        self._populate_data_combo(
-            self.combo_focus_peak_color,
-            (
-                ("シアン", C.FOCUS_PEAK_COLOR_CYAN),
-                ("グリーン", C.FOCUS_PEAK_COLOR_GREEN),
-                ("イエロー", C.FOCUS_PEAK_COLOR_YELLOW),
-                ("レッド", C.FOCUS_PEAK_COLOR_RED),
-            ),
-        )
-        self.spin_focus_peak_thickness = self._build_double_spinbox(
-            C.FOCUS_PEAK_THICKNESS_MIN,
-            C.FOCUS_PEAK_THICKNESS_MAX,
-            C.DEFAULT_FOCUS_PEAK_THICKNESS,
-            decimals=1,
-            step=_FOCUS_PEAK_THICKNESS_STEP,
-            suffix=" px",
-        )
-        self.combo_squint_mode = QComboBox()
-        self._populate_data_combo(
-            self.combo_squint_mode,
-            (
-                ("ぼかしのみ", C.SQUINT_MODE_BLUR),
-                ("縮小 → 拡大", C.SQUINT_MODE_SCALE),
-                ("縮小 → 拡大 + ぼかし", C.SQUINT_MODE_SCALE_BLUR),
-            ),
-        )
-        self.spin_squint_scale = self._build_int_spinbox(
-            C.SQUINT_SCALE_PERCENT_MIN,
-            C.SQUINT_SCALE_PERCENT_MAX,
-            C.DEFAULT_SQUINT_SCALE_PERCENT,
-            suffix=" %",
-        )
-        self.spin_squint_blur = self._build_double_spinbox(
-            C.SQUINT_BLUR_SIGMA_MIN,
-            C.SQUINT_BLUR_SIGMA_MAX,
-            C.DEFAULT_SQUINT_BLUR_SIGMA,
-            decimals=1,
-            step=_SQUINT_BLUR_SIGMA_STEP,
-            suffix=" px",
-        )
-        self.chk_vectorscope_skin_line = QCheckBox("スキントーンラインを表示")
-        self.chk_vectorscope_skin_line.setChecked(C.DEFAULT_VECTORSCOPE_SHOW_SKIN_LINE)
-        self.spin_vectorscope_warn_threshold = self._build_int_spinbox(
-            C.VECTORSCOPE_WARN_THRESHOLD_MIN,
-            C.VECTORSCOPE_WARN_THRESHOLD_MAX,
-            C.DEFAULT_VECTORSCOPE_WARN_THRESHOLD,
-            suffix=" %",
-        )
-
-        self.chk_preview_window = QCheckBox("領域プレビュー")
-        self.chk_preview_window.setChecked(_DEFAULT_PREVIEW_WINDOW)
-
-        self.edit_preset_name = SelectAllLineEdit()
-        self.edit_preset_name.setPlaceholderText("例: 作業レイアウトA")
-        self.edit_preset_name.setToolTip(
-            "入力例: 作業レイアウトA\n現在のドック配置をこの名前で保存します。"
-        )
-        self.combo_layout_presets = QComboBox()
-        self.btn_save_preset = QPushButton("プリセット保存")
-        self.btn_load_preset = QPushButton("適用")
-        self.btn_delete_preset = QPushButton("削除")
-        self._row_target_settings = None
-        self._row_pick_roi_win_settings = None
-        self._row_pick_roi_screen_settings = None
-        self._row_analysis_max_dim_settings = None
-        self._hint_analysis_max_dim_settings = None
-        self._row_interval_settings = None
-        self._row_diff_settings = None
-        self._hint_diff_settings = None
-        self._row_stable_settings = None
-        self._hint_stable_settings = None
-        self._row_squint_scale_settings = None
-        self._row_squint_blur_settings = None
-
-        self.lbl_status = QLabel("準備完了")
-        self.lbl_status.setStyleSheet("color:#BBBBBB;")
-
-    def _connect_control_signals(self) -> None:
-        """操作ウィジェットと各種ハンドラのシグナル接続を行う。"""
-        self._connect_capture_control_signals()
-        self._connect_analysis_control_signals()
-        self._connect_layout_preset_signals()
-
-    def _connect_capture_control_signals(self) -> None:
-        """取得元選択とROI操作のシグナルを接続する。"""
-        self.combo_win.currentIndexChanged.connect(self.on_window_changed)
-        self.combo_win.currentTextChanged.connect(self.on_window_text_changed)
-        self.combo_win.activated.connect(self.on_window_index_activated)
-        text_activated = getattr(self.combo_win, "textActivated", None)
-        if text_activated is not None:
-            text_activated.connect(self.on_window_text_activated)
-        popup_view = self.combo_win.view()
-        if popup_view is not None:
-            # スタイル差で片方しか発火しないケースがあるため両方を監視する。
-            popup_view.pressed.connect(self.on_window_popup_row_selected)
-            popup_view.clicked.connect(self.on_window_popup_row_selected)
-        if self.combo_win.lineEdit() is not None:
-            self.combo_win.lineEdit().textEdited.connect(self.on_window_text_edited)
-            self.combo_win.lineEdit().editingFinished.connect(self.on_window_text_committed)
-        self.btn_pick_roi_win.clicked.connect(self.pick_roi_in_window)
-        self.btn_pick_roi_screen.clicked.connect(self.pick_roi_on_screen)
-        self.combo_capture_source.currentIndexChanged.connect(self.apply_capture_source)
-
-    def _connect_analysis_control_signals(self) -> None:
-        """解析設定とプレビュー制御のシグナルを接続する。"""
-        self.spin_interval.valueChanged.connect(lambda v: self.worker.set_interval(float(v)))
-        self.spin_points.valueChanged.connect(self.apply_sample_points_settings)
-        self.combo_analysis_resolution_mode.currentIndexChanged.connect(
-            self.apply_analysis_resolution_settings
-        )
-        self.edit_analysis_max_dim.valueChanged.connect(self.apply_analysis_resolution_settings)
-        self.combo_scatter_shape.currentIndexChanged.connect(self.apply_scatter_settings)
-        self.combo_scatter_render_mode.currentIndexChanged.connect(self.apply_scatter_settings)
-        self.combo_wheel_mode.currentIndexChanged.connect(self.apply_wheel_settings)
-        self.chk_wheel_harmony_guide.toggled.connect(self.apply_wheel_settings)
-        self.combo_wheel_harmony_guide.currentIndexChanged.connect(self.apply_wheel_settings)
-        self.combo_rgb_hist_mode.currentIndexChanged.connect(self.apply_rgb_hist_settings)
-        self.combo_mirror_mode.currentIndexChanged.connect(self.apply_mirror_settings)
-        self.spin_wheel_sat_threshold.valueChanged.connect(self.apply_wheel_settings)
-        self.chk_color_band_use_wheel_sat_threshold.toggled.connect(self.apply_color_band_settings)
-        self.spin_color_band_sat_threshold.valueChanged.connect(self.apply_color_band_settings)
-        self.chk_color_band_use_wheel_harmony.toggled.connect(self.apply_color_band_settings)
-        self.chk_color_band_harmony_guide.toggled.connect(self.apply_color_band_settings)
-        self.combo_color_band_harmony_guide.currentIndexChanged.connect(
-            self.apply_color_band_settings
-        )
-        self.combo_mode.currentIndexChanged.connect(self.apply_mode_settings)
-        self.spin_diff.valueChanged.connect(self.apply_mode_settings)
-        self.spin_stable.valueChanged.connect(self.apply_mode_settings)
-        self.spin_edge_sensitivity.valueChanged.connect(self.apply_edge_settings)
-        self.combo_binary_preset.currentIndexChanged.connect(self.apply_binary_settings)
-        self.combo_ternary_preset.currentIndexChanged.connect(self.apply_ternary_settings)
-        self.spin_saliency_alpha.valueChanged.connect(self.apply_saliency_settings)
-        self.combo_composition_guide.currentIndexChanged.connect(
-            self.apply_composition_guide_settings
-        )
-        self.spin_focus_peak_sensitivity.valueChanged.connect(self.apply_focus_peaking_settings)
-        self.combo_focus_peak_color.currentIndexChanged.connect(self.apply_focus_peaking_settings)
-        self.spin_focus_peak_thickness.valueChanged.connect(self.apply_focus_peaking_settings)
-        self.combo_squint_mode.currentIndexChanged.connect(self.apply_squint_settings)
-        self.spin_squint_scale.valueChanged.connect(self.apply_squint_settings)
-        self.spin_squint_blur.valueChanged.connect(self.apply_squint_settings)
-        self.chk_vectorscope_skin_line.toggled.connect(self.apply_vectorscope_settings)
-        self.spin_vectorscope_warn_threshold.valueChanged.connect(self.apply_vectorscope_settings)
-        self.chk_preview_window.toggled.connect(self.on_preview_toggled)
-
-    def _connect_layout_preset_signals(self) -> None:
-        """レイアウトプリセット操作のシグナルを接続する。"""
-        self.btn_save_preset.clicked.connect(self.save_layout_preset)
-        self.btn_load_preset.clicked.connect(self.load_selected_layout_preset)
-        self.btn_delete_preset.clicked.connect(self.delete_selected_layout_preset)
-
     def _build_menu_bar(self) -> None:
         """メニューバーと各アクションを構築する。"""
         # --- Menu bar (ウィンドウ / 設定 / レイアウト) ---
-        mb = self.menuBar() if hasattr(self, "menuBar") else QMenuBar(self)
+        mb = self.menuBar()
         win_menu = mb.addMenu("ウィンドウ")
 
-        def _bind_dock_action(attr_name: str, title: str, default: bool, dock_attr: str):
-            action = add_checkable_action(
+        dock_actions = []
+        for attr_name, title, default, dock_attr in _WINDOW_DOCK_MENU_ITEMS:
+            # ドック名だけを束縛し、ドック参照は構築後の `_dock_map` から引く。
+            action = make_checkable_action(
                 win_menu,
                 title,
                 default,
-                lambda visible, name=dock_attr: self.toggle_dock(getattr(self, name), visible),
+                partial(self._toggle_named_dock, dock_attr),
             )
             setattr(self, attr_name, action)
-
-        for spec in _WINDOW_DOCK_MENU_ITEMS:
-            _bind_dock_action(*spec)
+            dock_actions.append(action)
+        # 1件ずつ追加せず、メニューの再レイアウトを1回にまとめる。
+        win_menu.addActions(dock_actions)
 
         menu = mb.addMenu("設定")
         self.act_always_on_top = add_checkable_action(
@@ -733,7 +380,13 @@ class MainWindow(QMainWindow):
         tb.addWidget(self.btn_stop_bar)
         tb.addWidget(self.btn_load_image_bar)
         self.btn_stop_bar.setChecked(True)
-        QTimer.singleShot(0, lambda mw=self: _sync_toolbar_button_geometry(mw))
+        # 次のイベントループで揃えるだけなので、使い捨て QTimer を作らずキュー接続で呼ぶ。
+        QMetaObject.invokeMethod(self, "_sync_toolbar_geometry", Qt.QueuedConnection)
+
+    @Slot()
+    def _sync_toolbar_geometry(self) -> None:
+        """ツールバーの split button の高さを Start / Stop ボタンへ揃える。"""
+        _sync_toolbar_button_geometry(self)
 
     def _setup_preview_and_docks(self) -> None:
         """プレビューとドック群を構築し、関連イベントを接続する。"""
@@ -744,22 +397,29 @@ class MainWindow(QMainWindow):
         self._setup_image_input_drop_targets()
         if hasattr(self, "tabifiedDockWidgetActivated"):
             self.tabifiedDockWidgetActivated.connect(self._on_tabified_dock_activated)
-        self.top_colors_bar.installEventFilter(self)
         if hasattr(self, "list_color_chips"):
             self.list_color_chips.currentRowChanged.connect(self._on_color_chip_selected)
         if hasattr(self.wheel, "harmonyGuideRotationChanged"):
             self.wheel.harmonyGuideRotationChanged.connect(self._on_wheel_harmony_rotation_changed)
-        self.chk_scatter_hue_filter.toggled.connect(self.apply_scatter_settings)
-        self.slider_scatter_hue_center.valueChanged.connect(self.apply_scatter_settings)
+        queue_scatter_apply = partial(self._queue_settings_apply, "apply_scatter_settings")
+        self.chk_scatter_hue_filter.toggled.connect(queue_scatter_apply)
+        self.slider_scatter_hue_center.valueChanged.connect(queue_scatter_apply)
         self._sync_scatter_filter_controls()
-        for d in self._dock_map.values():
-            d.visibilityChanged.connect(lambda _v, self=self: self._sync_worker_view_flags())
-            d.topLevelChanged.connect(
-                lambda v, dock=d, self=self: self._on_dock_top_level_changed(dock, bool(v))
-            )
+        for d in self._dock_list:
+            d.visibilityChanged.connect(self._on_dock_visibility_changed)
+            d.topLevelChanged.connect(partial(self._schedule_dock_top_level_changed, d))
             d.installEventFilter(self)
-        self._sync_worker_view_flags()
 
+    def _toggle_named_dock(self, dock_name: str, visible: bool) -> None:
+        """メニュー操作に対応するドックの表示状態を切り替える。"""
+        self._toggle_actions[dock_name](visible)
+
+    @Slot(bool)
+    def _on_dock_visibility_changed(self, _visible: bool) -> None:
+        """ドック表示切替時にワーカー表示フラグの同期を予約する。"""
+        self._schedule_worker_view_flags_sync()
+
+    @Slot(QDockWidget)
     def _on_tabified_dock_activated(self, dock) -> None:
         """タブ切替直後の表示同期とスナップショット復元を行う。"""
         # タブ切替時に表示フラグ再同期と表示復元を行い、更新取りこぼしを防ぐ。
@@ -772,12 +432,9 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(60, lambda d=dock, self=self: self._restore_dock_from_snapshot(d))
 
     def _initialize_runtime_defaults(self) -> None:
-        """起動直後のワーカー既定値をUI設定から反映する。"""
-        self.worker.set_interval(self.spin_interval.value())
-        self.worker.set_sample_points(self.spin_points.value())
-        self.apply_analysis_resolution_settings(save=False)
-        self.worker.set_wheel_sat_threshold(self.spin_wheel_sat_threshold.value())
-        self.worker.set_graph_every(C.DEFAULT_GRAPH_EVERY)
+        """起動直後の設定ロードと初期同期を行う。"""
+        # ワーカー設定・表示フラグは load_settings が読み込んだ値で各1回だけ反映するため、
+        # ここで UI 既定値を先に流し込んで直後に上書きすることはしない。
         # 初回表示前に設定/レイアウトを反映して、表示後の位置ジャンプを避ける。
         self._finish_startup()
 
@@ -793,7 +450,9 @@ class MainWindow(QMainWindow):
             and self.combo_win.count() <= 1
         ):
             self.refresh_windows()
-        for dock in self._dock_map.values():
+        # 復元で使われなかった先行列挙は古くなるため、以降の再取得へ持ち越さない。
+        discard_list_windows_prefetch()
+        for dock in self._dock_list:
             self._on_dock_top_level_changed(dock, dock.isFloating())
         self._sync_tabbed_dock_title_bars()
         self.sync_window_menu_checks()
@@ -804,7 +463,7 @@ class MainWindow(QMainWindow):
         self._start_release_check_once()
         # 構成差分時のみ、起動直後に最終補正する。
         if bool(self._startup_should_fit_window):
-            QTimer.singleShot(260, self._fit_window_to_desktop)
+            QTimer.singleShot(260, self._schedule_window_fit)
 
     _setup_help_menu = mw_help.setup_help_menu
     _start_release_check_once = mw_help.start_release_check_once
@@ -821,6 +480,7 @@ class MainWindow(QMainWindow):
         self._settings_save_pending = True
         self._settings_save_timer.start()
 
+    @Slot()
     def _flush_settings_save(self):
         """保留中の設定保存を実行する。"""
         if not self._settings_save_pending:
@@ -834,21 +494,54 @@ class MainWindow(QMainWindow):
         if not self._did_initial_screen_fit:
             self._did_initial_screen_fit = True
             if bool(self._startup_should_fit_window):
-                self._fit_window_to_desktop()
+                # 表示直後の resize/状態変化と同じデバウンスタイマーへ寄せ、補正を1回にまとめる。
+                self._schedule_window_fit()
 
     def event(self, event):
         """レイアウト・表示状態変化イベントに応じて同期処理を行う。"""
         if event.type() == QEvent.LayoutRequest:
-            self._schedule_layout_autosave()
-            self._schedule_dock_rebalance()
+            # 起動構築中の大量の LayoutRequest は _finish_startup がまとめて予約し直すため無視する。
+            if self._layout_autosave_enabled:
+                self._mark_layout_dirty(_LAYOUT_DIRTY_AUTOSAVE | _LAYOUT_DIRTY_REBALANCE)
         elif event.type() == QEvent.WindowStateChange:
-            self._schedule_layout_autosave()
-            self._schedule_window_fit()
+            self._mark_layout_dirty(_LAYOUT_DIRTY_AUTOSAVE | _LAYOUT_DIRTY_FIT)
             self._refresh_topmost_if_enabled()
         elif event.type() == QEvent.Show:
             self._refresh_topmost_if_enabled()
         return super().event(event)
 
+    def _mark_layout_dirty(self, flags: int) -> None:
+        """レイアウト追従処理の要求ビットを積み、次のイベントループでまとめて予約する。"""
+        self._layout_dirty |= int(flags)
+        if not self._layout_dirty_timer.isActive():
+            self._layout_dirty_timer.start(0)
+
+    @Slot()
+    def _process_layout_dirty(self) -> None:
+        """積まれた要求ビットに応じて各デバウンス処理を1回ずつ予約する。"""
+        if QApplication.mouseButtons() & Qt.LeftButton:
+            # スプリッタ/ドック操作のドラッグ中は再配分や保存を走らせず、ビットを保持して待つ。
+            self._layout_dirty_release_watcher.arm()
+            # 解放イベントがアプリへ届かない場合に備え、間隔を空けてボタン状態を再確認する。
+            self._layout_dirty_timer.start(_LAYOUT_DIRTY_RELEASE_POLL_MS)
+            return
+        # 再確認で解放を検出した場合は、残った解放待ちフィルタも外す。
+        self._layout_dirty_release_watcher.disarm()
+        flags = self._layout_dirty
+        self._layout_dirty = 0
+        if flags & _LAYOUT_DIRTY_AUTOSAVE:
+            self._schedule_layout_autosave()
+        if flags & _LAYOUT_DIRTY_REBALANCE:
+            self._schedule_dock_rebalance()
+        if flags & _LAYOUT_DIRTY_FIT:
+            self._schedule_window_fit()
+
+    def _mark_layout_released(self) -> None:
+        """ドラッグ終了時に、保持していた要求ビットの処理を予約する。"""
+        if self._layout_dirty:
+            # 再確認待ちのタイマーが動いていても、即時実行へ張り替える。
+            self._layout_dirty_timer.start(0)
+
     def keyPressEvent(self, event):
         """Esc入力時に領域選択モードを優先的に解除する。"""
         if event.key() == Qt.Key_Escape and bool(getattr(self, "_roi_selectors", ())):
@@ -857,16 +550,9 @@ class MainWindow(QMainWindow):
             return
         super().keyPressEvent(event)
 
-    def _handle_top_colors_bar_resize_event(self, obj, event) -> bool:
-        """配色比率バーのリサイズイベントを処理したか返す。"""
-        if obj is getattr(self, "top_colors_bar", None) and event.type() == QEvent.Resize:
-            self._refresh_top_color_bar()
-            return True
-        return False
-
     def _handle_color_band_layout_event(self, obj, event) -> None:
         """配色比率ドックの表示/サイズ変更イベントを処理する。"""
-        if obj is getattr(self, "dock_color_band", None) and event.type() in (
+        if obj is self.dock_color_band and event.type() in (
             QEvent.Resize,
             QEvent.Show,
         ):
@@ -929,15 +615,14 @@ class MainWindow(QMainWindow):
 
     def _is_managed_dock(self, obj) -> bool:
         """イベント対象が管理中ドックか判定する。"""
-        return obj in getattr(self, "_dock_map", {}).values()
+        # 毎イベント通る経路なので、値の線形走査ではなくドック→名前の辞書で判定する。
+        return obj in getattr(self, "_dock_name_by_object", {})
 
     def eventFilter(self, obj, event):
         """ドック/タブ/カラーバーの共通イベントを捕捉して処理する。"""
-        if self._handle_top_colors_bar_resize_event(obj, event):
-            return super().eventFilter(obj, event)
         self._handle_color_band_layout_event(obj, event)
-        if mw_tabs.is_dock_tab_bar(self, obj):
-            if mw_tabs.handle_dock_tab_bar_event(self, obj, event):
+        if self._is_dock_tab_bar(obj):
+            if self._handle_dock_tab_bar_event(obj, event):
                 return True
             return super().eventFilter(obj, event)
         if self._is_managed_dock(obj):
@@ -949,18 +634,30 @@ class MainWindow(QMainWindow):
     def moveEvent(self, event):
         """メイン移動時にフローティングドック状態と保存予約を更新する。"""
         super().moveEvent(event)
-        self._schedule_floating_dock_dockability_sync()
-        self._schedule_layout_autosave()
+        self._schedule_floating_dock_dockability_sync_if_floating()
+        self._schedule_layout_autosave_if_geometry_changed()
 
     def resizeEvent(self, event):
         """メインリサイズ時の一時停止制御とレイアウト同期を行う。"""
         self._begin_layout_interaction_pause("main_resize")
         super().resizeEvent(event)
-        self._schedule_floating_dock_dockability_sync()
+        self._schedule_floating_dock_dockability_sync_if_floating()
         self.update_placeholder()
-        self._schedule_layout_autosave()
+        self._schedule_layout_autosave_if_geometry_changed()
         self._schedule_layout_interaction_resume("main_resize")
 
+    def _schedule_layout_autosave_if_geometry_changed(self) -> None:
+        """ウィンドウ位置/サイズが前回の予約時から変わったときだけ自動保存を予約する。"""
+        if not self._layout_autosave_enabled:
+            # 起動中の move/resize は記録せず、_finish_startup の予約に任せる。
+            return
+        # 同じジオメトリで重複して届く move/resize ではタイマーを張り直さない。
+        geometry_key = (self.x(), self.y(), self.width(), self.height())
+        if geometry_key == self._autosave_geometry_key:
+            return
+        self._autosave_geometry_key = geometry_key
+        self._schedule_layout_autosave()
+
     _fit_window_to_desktop = mw_windowing.fit_window_to_desktop
     _fit_dialog_to_desktop = mw_windowing.fit_dialog_to_desktop
     _fit_top_level_widget_to_desktop = mw_windowing.fit_top_level_widget_to_desktop
@@ -969,54 +666,83 @@ class MainWindow(QMainWindow):
     _schedule_dock_rebalance = mw_windowing.schedule_dock_rebalance
     _rebalance_dock_layout = mw_windowing.rebalance_dock_layout
     _on_dock_top_level_changed = mw_windowing.on_dock_top_level_changed
+    _schedule_dock_top_level_changed = mw_windowing.schedule_dock_top_level_changed
+    _flush_dock_top_level_changes = mw_windowing.flush_dock_top_level_changes
     _update_floating_dock_dockability = mw_windowing.update_floating_dock_dockability
     _sync_all_floating_dock_dockability = mw_windowing.sync_all_floating_dock_dockability
     _schedule_floating_dock_dockability_sync = mw_windowing.schedule_floating_dock_dockability_sync
+    _schedule_floating_dock_dockability_sync_if_floating = (
+        mw_windowing.schedule_floating_dock_dockability_sync_if_floating
+    )
     _notify_floating_dock_moved = mw_windowing.notify_floating_dock_moved
     _track_floating_dock_size = mw_windowing.track_floating_dock_size
 
-    def _sync_tabbed_dock_title_bars(self, *_):
+    _is_dock_tab_bar = mw_tabs.is_dock_tab_bar
+    _handle_dock_tab_bar_event = mw_tabs.handle_dock_tab_bar_event
+
+    @Slot()
+    def _sync_tabbed_dock_title_bars(self) -> None:
         """タブ化状態に応じてドックのタイトルバー表示を同期する。"""
+        # 引数なしスロットとして登録し、visibilityChanged(bool) などの値は Qt 側で捨てさせる。
+        if self._layout_restore_in_progress:
+            # レイアウト復元中のドック単位の通知は無視し、復元後にまとめて同期する。
+            return
         mw_tabs.sync_tabbed_dock_title_bars(self)
 
-    apply_always_on_top = mw_topmost.apply_always_on_top
+    apply_always_on_top = Slot(bool)(mw_topmost.apply_always_on_top)
     _refresh_topmost_if_enabled = mw_topmost.refresh_topmost_if_enabled
     _present_settings_window = mw_topmost.present_settings_window
-    show_canvas_preview_window = mw_tools.show_canvas_preview_window
-    _close_canvas_preview_window = mw_tools.close_canvas_preview_window
+
+    @Slot()
+    def show_canvas_preview_window(self) -> None:
+        """キャンバスプレビューを開く。"""
+        # プレビューダイアログ一式は初回に開くまで読み込まず、起動時の import を軽くする。
+        from .ui.main_window import tools_actions as mw_tools
+
+        mw_tools.show_canvas_preview_window(self)
+
+    def _close_canvas_preview_window(self) -> None:
+        """開いているキャンバスプレビューを閉じる。"""
+        if getattr(self, "_canvas_preview_window", None) is None:
+            return
+        from .ui.main_window import tools_actions as mw_tools
+
+        mw_tools.close_canvas_preview_window(self)
+
     _refresh_top_color_bar = mw_color_band.refresh_top_color_bar
     _on_color_chip_selected = mw_color_band.on_color_chip_selected
     _on_wheel_harmony_rotation_changed = mw_settings.on_wheel_harmony_rotation_changed
     _update_color_band_compact_visibility = mw_color_band.update_color_band_compact_visibility
     _restore_dock_from_snapshot = mw_snapshot.restore_dock_from_snapshot
-    on_status = mw_runtime.on_status
+    on_status = Slot(str)(mw_runtime.on_status)
     _cancel_image_analysis = mw_runtime.cancel_image_analysis
     can_accept_image_drop_target = mw_runtime.can_accept_image_drop_target
     is_supported_image_path = mw_runtime.is_supported_image_path
     _setup_image_input_drop_targets = mw_runtime.setup_image_input_drop_targets
     on_image_files_dropped = mw_runtime.on_image_files_dropped
-    on_load_image = mw_runtime.on_load_image
-    on_load_image_from_clipboard = mw_runtime.on_load_image_from_clipboard
-    on_image_analysis_progress = mw_runtime.on_image_analysis_progress
-    on_image_analysis_finished = mw_runtime.on_image_analysis_finished
-    on_image_analysis_failed = mw_runtime.on_image_analysis_failed
-    on_image_analysis_canceled = mw_runtime.on_image_analysis_canceled
-    on_start = mw_runtime.on_start
-    on_stop = mw_runtime.on_stop
+    on_load_image = Slot()(mw_runtime.on_load_image)
+    on_load_image_from_clipboard = Slot()(mw_runtime.on_load_image_from_clipboard)
+    on_image_analysis_progress = Slot(int, str)(mw_runtime.on_image_analysis_progress)
+    on_image_analysis_finished = Slot(dict)(mw_runtime.on_image_analysis_finished)
+    on_image_analysis_failed = Slot(str)(mw_runtime.on_image_analysis_failed)
+    on_image_analysis_canceled = Slot()(mw_runtime.on_image_analysis_canceled)
+    on_start = Slot()(mw_runtime.on_start)
+    on_stop = Slot()(mw_runtime.on_stop)
     closeEvent = mw_runtime.close_event
     refresh_windows = mw_runtime.refresh_windows
     _selected_capture_source = mw_runtime.selected_capture_source
     _sync_capture_source_ui = mw_runtime.sync_capture_source_ui
-    apply_capture_source = mw_runtime.apply_capture_source
+    apply_capture_source = Slot(int)(mw_runtime.apply_capture_source)
     _apply_capture_source = mw_runtime.apply_capture_source
-    on_window_changed = mw_runtime.on_window_changed
-    on_window_text_changed = mw_runtime.on_window_text_changed
-    on_window_index_activated = mw_runtime.on_window_index_activated
-    on_window_text_activated = mw_runtime.on_window_text_activated
-    on_window_popup_row_selected = mw_runtime.on_window_popup_row_selected
-    on_window_text_edited = mw_runtime.on_window_text_edited
-    on_window_text_committed = mw_runtime.on_window_text_committed
-    _selected_wheel_sat_threshold = mw_settings.selected_wheel_sat_threshold
+    on_window_changed = Slot(int)(mw_runtime.on_window_changed)
+    on_window_text_changed = Slot(str)(mw_runtime.on_window_text_changed)
+    on_window_index_activated = Slot(int)(mw_runtime.on_window_index_activated)
+    on_window_text_activated = Slot(str)(mw_runtime.on_window_text_activated)
+    on_window_popup_row_selected = Slot(QModelIndex)(mw_runtime.on_window_popup_row_selected)
+    on_window_text_edited = Slot(str)(mw_runtime.on_window_text_edited)
+    on_window_text_committed = Slot()(mw_runtime.on_window_text_committed)
+    _selected_wheel_sat_threshold = mw_settings.cached_wheel_sat_threshold
+    _invalidate_wheel_sat_threshold = mw_settings.invalidate_wheel_sat_threshold
 
     def _apply_ui_style(self, theme_name: str | None = None):
         """010 の dock スタイルを適用し、その後で非ドック要素だけへ追加テーマ反映する。"""
@@ -1028,12 +754,16 @@ class MainWindow(QMainWindow):
     _sync_mode_dependent_rows = mw_settings.sync_mode_dependent_rows
     _sync_squint_mode_rows = mw_settings.sync_squint_mode_rows
     _sync_analysis_resolution_rows = mw_settings.sync_analysis_resolution_rows
+    _sync_all_mode_rows = mw_settings.sync_all_mode_rows
     _sync_color_band_controls = mw_settings.sync_color_band_controls
-    apply_theme_settings = mw_settings.apply_theme_settings
+    apply_theme_settings = Slot(int)(mw_settings.apply_theme_settings)
     _sync_worker_view_flags = mw_runtime.sync_worker_view_flags
+    _schedule_worker_view_flags_sync = mw_runtime.schedule_worker_view_flags_sync
     _begin_layout_interaction_pause = mw_runtime.begin_layout_interaction_pause
     _schedule_layout_interaction_resume = mw_runtime.schedule_layout_interaction_resume
     _end_layout_interaction_pause = mw_runtime.end_layout_interaction_pause
+    # 操作由来の apply_* は `_queue_settings_apply` 経由で畳み込んで呼ぶため、Qt スロット登録はしない。
+    apply_interval_settings = mw_settings.apply_interval_settings
     apply_sample_points_settings = mw_settings.apply_sample_points_settings
     _sync_scatter_filter_controls = mw_settings.sync_scatter_filter_controls
     apply_scatter_settings = mw_settings.apply_scatter_settings
@@ -1052,29 +782,71 @@ class MainWindow(QMainWindow):
     _update_vectorscope_warning_label = mw_settings.update_vectorscope_warning_label
     apply_vectorscope_settings = mw_settings.apply_vectorscope_settings
     _update_preview_snapshot = mw_runtime.update_preview_snapshot
-    on_preview_toggled = mw_runtime.on_preview_toggled
-    on_preview_closed = mw_runtime.on_preview_closed
+    on_preview_toggled = Slot(bool)(mw_runtime.on_preview_toggled)
+    on_preview_closed = Slot()(mw_runtime.on_preview_closed)
     apply_mode_settings = mw_settings.apply_mode_settings
+    _queue_settings_apply = mw_settings.queue_settings_apply
+
+    @Slot()
+    def _flush_settings_applies(self) -> None:
+        """予約済みの apply_* をまとめて実行する。"""
+        mw_settings.flush_settings_applies(self)
+
     load_settings = mw_settings.load_settings
     save_settings = mw_settings.save_settings
-    sync_window_menu_checks = mw_windowing.sync_window_menu_checks
+
+    @Slot()
+    def sync_window_menu_checks(self) -> None:
+        """ウィンドウメニューのチェック状態をドック表示へ合わせる。"""
+        mw_windowing.sync_window_menu_checks(self)
+
+    _schedule_window_menu_checks_sync = mw_windowing.schedule_window_menu_checks_sync
+    _schedule_placeholder_update = mw_windowing.schedule_placeholder_update
     _apply_default_view_layout = mw_layout_presets.apply_default_view_layout
     save_current_layout_to_config = mw_layout_presets.save_current_layout_to_config
     _schedule_layout_autosave = mw_layout_presets.schedule_layout_autosave
     apply_layout_from_config = mw_layout_presets.apply_layout_from_config
     refresh_layout_preset_views = mw_layout_presets.refresh_layout_preset_views
     apply_layout_preset = mw_layout_presets.apply_layout_preset
-    load_selected_layout_preset = mw_layout_presets.load_selected_layout_preset
-    save_layout_preset = mw_layout_presets.save_layout_preset
-    delete_selected_layout_preset = mw_layout_presets.delete_selected_layout_preset
+    load_selected_layout_preset = Slot()(mw_layout_presets.load_selected_layout_preset)
+    save_layout_preset = Slot()(mw_layout_presets.save_layout_preset)
+    delete_selected_layout_preset = Slot()(mw_layout_presets.delete_selected_layout_preset)
     toggle_dock = mw_windowing.toggle_dock
-    update_placeholder = mw_windowing.update_placeholder
-    show_settings_window = show_settings_dialog_window
-    hide_settings_window = hide_settings_dialog_window
+
+    @Slot()
+    def update_placeholder(self) -> None:
+        """可視ドック有無に応じて中央プレースホルダを切り替える。"""
+        mw_windowing.update_placeholder(self)
+
+    def show_settings_window(self, page_index: int | None = None) -> None:
+        """設定ダイアログを開く。"""
+        # 設定ダイアログ一式は初回に開くまで読み込まず、起動時の import を軽くする。
+        from .ui import settings_dialog
+
+        settings_dialog.show_settings_window(self, page_index)
+
+    def hide_settings_window(self) -> None:
+        """設定ダイアログを非表示にする。"""
+        if not hasattr(self, "_settings_window"):
+            return
+        from .ui import settings_dialog
+
+        settings_dialog.hide_settings_window(self)
+
     _close_roi_selectors = mw_roi.close_roi_selectors
     _cancel_roi_selection = mw_roi.cancel_roi_selection
-    pick_roi_on_screen = mw_roi.pick_roi_on_screen
+    pick_roi_on_screen = Slot()(mw_roi.pick_roi_on_screen)
     on_roi_screen_selected = mw_roi.on_roi_screen_selected
-    pick_roi_in_window = mw_roi.pick_roi_in_window
+    pick_roi_in_window = Slot()(mw_roi.pick_roi_in_window)
     on_roi_window_selected = mw_roi.on_roi_window_selected
     on_result = mw_snapshot.on_result
+
+    @Slot(object)
+    def _enqueue_result(self, res) -> None:
+        """ワーカー結果を最新1件へ畳み込んで反映を予約する。"""
+        mw_snapshot.enqueue_result(self, res)
+
+    @Slot()
+    def _drain_pending_result(self) -> None:
+        """保留中の最新結果を反映する。"""
+        mw_snapshot.drain_pending_result(self)
@@ -43,6 +43,7 @@ from .input_widgets import configure_numeric_input
 from ..util import constants as APP_C
 from ..util.config import load_config, save_config
 from ..util.debug_log import write_window_layout_debug_log
+from ..util.qt_helpers import updates_suspended
 from ..util.theme import get_ui_theme, refresh_widget_style
 from ..views.canvas_preview import CanvasPreviewWidget
 from ..views.canvas_preview_constants import (
@@ -1278,7 +1279,10 @@ class CanvasPreviewDialog(QDialog):
             self._preset_id = current.preset_id
             self._syncing_controls = True
             try:
-                with signal_blocked(self.list_ratio_presets):
+                # 再描画は作り直しが終わるまで止め、項目は ID を載せ終えてから挿入する。
+                with updates_suspended(self.list_ratio_presets), signal_blocked(
+                    self.list_ratio_presets
+                ):
                     self.list_ratio_presets.clear()
                     for preset in self._visible_presets():
                         item = QListWidgetItem(self._preset_list_text(preset))
@@ -3,7 +3,8 @@
 import inspect
 import time
 
-from PySide6.QtCore import QEvent, QPoint, QSize, Qt, QTimer
+from PySide6.QtCore import QEvent, QPoint, QSize, Qt, QTimer, Slot
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import (
     QAbstractSpinBox,
     QComboBox,
@@ -47,7 +48,7 @@ class SelectAllLineEdit(QLineEdit):
         """ダブルクリック時は単語選択ではなくカーソル位置編集を優先する。"""
         self._select_all_on_release = False
         super().mouseDoubleClickEvent(event)
-        point = event.position().toPoint() if hasattr(event, "position") else event.pos()
+        point = event.position().toPoint()
         self.setCursorPosition(self.cursorPositionAt(point))
         self.deselect()
 
@@ -56,17 +57,40 @@ class SelectAllSpinBox(QSpinBox):
     """フォーカス時に数値部分のみ選択する `QSpinBox`。"""
 
     def __init__(self, *args, **kwargs):
-        """クリック選択制御フラグを初期化する。"""
+        """クリック選択制御フラグと遅延選択タイマーを初期化する。"""
         super().__init__(*args, **kwargs)
         self._select_value_on_release = False
-
+        # フォーカス遷移のたびに singleShot を作らず、1本のタイマーを再始動して使い回す。
+        self._select_value_timer = QTimer(self)
+        self._select_value_timer.setSingleShot(True)
+        self._select_value_timer.setInterval(0)
+        self._select_value_timer.timeout.connect(self._select_value_text)
+        # 選択範囲計算のたびに prefix/suffix 文字列を取り出さないよう長さを保持する。
+        self._prefix_len = len(self.prefix())
+        self._suffix_len = len(self.suffix())
+
+    def setPrefix(self, prefix: str) -> None:
+        """prefix を設定し、選択範囲計算用の長さを更新する。"""
+        super().setPrefix(prefix)
+        self._prefix_len = len(self.prefix())
+
+    def setSuffix(self, suffix: str) -> None:
+        """suffix を設定し、選択範囲計算用の長さを更新する。"""
+        super().setSuffix(suffix)
+        self._suffix_len = len(self.suffix())
+
+    @Slot()
     def _select_value_text(self) -> None:
         """prefix/suffix を除いた数値部分だけを選択状態にする。"""
         editor = self.lineEdit()
         if editor is None:
             return
-        start = len(self.prefix())
-        length = len(self.cleanText())
+        start = self._prefix_len
+        length = len(editor.text()) - start - self._suffix_len
+        if length <= 0:
+            # 保持長と表示が食い違う場合だけ cleanText() で数値部分を測り直す。
+            start = len(self.prefix())
+            length = len(self.cleanText())
         if length <= 0:
             editor.selectAll()
             return
@@ -76,7 +100,7 @@ class SelectAllSpinBox(QSpinBox):
         """キーボード遷移時は数値部分を全選択する。"""
         super().focusInEvent(event)
         if event.reason() != Qt.MouseFocusReason:
-            QTimer.singleShot(0, self._select_value_text)
+            self._select_value_timer.start()
 
     def mousePressEvent(self, event):
         """未フォーカス状態の左クリックでリリース後選択を予約する。"""
@@ -233,7 +257,7 @@ class SplitMenuToolButton(QToolButton):
             and event.button() == Qt.LeftButton
             and self.popupMode() == QToolButton.MenuButtonPopup
         ):
-            pos = event.position().toPoint() if hasattr(event, "position") else event.pos()
+            pos = event.position().toPoint()
             if self._menu_button_rect().contains(pos):
                 self.showMenu()
                 event.accept()
@@ -248,9 +272,8 @@ def configure_numeric_input(
     min_height: int = 28,
 ) -> None:
     """Spin系入力の共通見た目と入力ガイドを設定する。"""
-    widget.setButtonSymbols(QAbstractSpinBox.UpDownArrows)
-    widget.setMinimumWidth(int(min_width))
-    widget.setMinimumHeight(int(min_height))
+    # ボタン表示は既定の UpDownArrows のまま使い、最小サイズは1回の呼び出しで確定させる。
+    widget.setMinimumSize(int(min_width), int(min_height))
     numeric_align = Qt.AlignRight | Qt.AlignVCenter
     set_alignment = getattr(widget, "setAlignment", None)
     if callable(set_alignment):
@@ -277,15 +300,22 @@ def _apply_spin_input_hint(widget: QAbstractSpinBox) -> None:
     widget.setToolTip(tooltip)
 
 
-def add_checkable_action(menu, text: str, checked: bool, toggled_cb):
-    """メニューのチェック可能アクション生成を共通化する。"""
-    action = menu.addAction(text)
+def make_checkable_action(parent, text: str, checked: bool, toggled_cb) -> QAction:
+    """メニューへ追加せずにチェック可能アクションを生成する。"""
+    action = QAction(text, parent)
     action.setCheckable(True)
     action.setChecked(bool(checked))
     action.toggled.connect(toggled_cb)
     return action
 
 
+def add_checkable_action(menu, text: str, checked: bool, toggled_cb):
+    """メニューのチェック可能アクション生成を共通化する。"""
+    action = make_checkable_action(menu, text, checked, toggled_cb)
+    menu.addAction(action)
+    return action
+
+
 def _callback_accepts_force_keyword(callback) -> bool:
     """callback が `force=` キーワードを受け取れるか判定する。"""
     if not callable(callback):
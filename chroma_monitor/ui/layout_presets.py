@@ -14,7 +14,7 @@ from ..util.layout_state import (
     restore_layout_geometry,
     restore_layout_geometry_rect,
 )
-from ..util.qt_helpers import blocked_signals
+from ..util.qt_helpers import blocked_signals, updates_suspended
 from ..util.value_utils import safe_int
 
 _LAYOUT_ENGINE_VERSION = 2
@@ -59,7 +59,17 @@ def _capture_layout_with_debug(
 
 def _apply_layout_or_default(main_window, layout: dict) -> bool:
     """レイアウト適用を試し、失敗時は既定レイアウトへ戻す。"""
-    restored = apply_layout_state(main_window, main_window._dock_map, layout)
+    # restoreState 中はドックごとに visibilityChanged / dockLocationChanged が続くため、
+    # タブ掴み帯の同期と自動保存予約を止め、適用後の _after_layout_apply で1回だけ行う。
+    main_window._layout_restore_in_progress = True
+    # 表示中のプリセット適用では、ドックの付け替えごとの再描画を止めて最後に1回で描く。
+    # 起動時の非表示ウィンドウでは描画が起きないため、子全体への属性伝播を省く。
+    suspend_target = main_window if main_window.isVisible() else None
+    try:
+        with updates_suspended(suspend_target):
+            restored = apply_layout_state(main_window, main_window._dock_map, layout)
+    finally:
+        main_window._layout_restore_in_progress = False
     if not restored:
         main_window._apply_default_view_layout()
         return False
@@ -90,6 +100,7 @@ def _after_layout_apply(
 ) -> None:
     """レイアウト適用後に必要なUI同期と保存予約を行う。"""
     main_window.sync_window_menu_checks()
+    main_window._sync_tabbed_dock_title_bars()
     main_window.update_placeholder()
     should_fit_window = True
     if applied_layout is not None:
@@ -208,11 +219,15 @@ def apply_default_view_layout(main_window) -> None:
 def save_current_layout_to_config(main_window, silent: bool = False) -> None:
     """現在レイアウトを設定へ保存する。"""
     # 現在のドック配置を layout_current へ保存する。
+    layout = _capture_layout_with_debug(main_window, event="layout_saved_current")
+    # 自動保存は前回書き込んだ配置と同じなら設定の読み書き自体を省く。
+    if silent and layout == getattr(main_window, "_last_saved_layout", None):
+        return
     cfg = load_config()
     _stamp_layout_engine_version(cfg)
-    layout = _capture_layout_with_debug(main_window, event="layout_saved_current")
     cfg[C.CFG_LAYOUT_CURRENT] = layout
     save_config(cfg)
+    main_window._last_saved_layout = layout
     if not silent:
         main_window.on_status("現在の配置を保存しました")
         main_window.refresh_layout_preset_views()
@@ -221,7 +236,7 @@ def save_current_layout_to_config(main_window, silent: bool = False) -> None:
 def schedule_layout_autosave(main_window) -> None:
     """条件を満たすときだけ遅延レイアウト保存を予約する。"""
     # 起動直後や最小化中は不要保存を抑止する。
-    if not main_window._layout_autosave_enabled:
+    if not main_window._layout_autosave_enabled or main_window._layout_restore_in_progress:
         return
     if main_window.isMinimized():
         return
@@ -240,6 +255,7 @@ def apply_layout_from_config(main_window, cfg: dict) -> None:
         saved[C.CFG_LAYOUT_PRESETS] = {}
         saved[C.CFG_LAYOUT_CURRENT] = capture_layout_state(main_window, main_window._dock_map)
         save_config(saved)
+        main_window._last_saved_layout = saved[C.CFG_LAYOUT_CURRENT]
         return
     # 復元失敗時は安全側として既定レイアウトに戻す。
     layout = cfg.get(C.CFG_LAYOUT_CURRENT, {})
@@ -250,13 +266,18 @@ def refresh_layout_preset_views(main_window) -> None:
     """プリセット一覧UIを設定内容で再構築する。"""
     # コンボボックスとメニューの両方を同じプリセット一覧で更新する。
     _, presets = _load_cfg_with_presets()
-    preset_names = sorted(presets.keys())
+    # プリセット保存/削除のたびに呼ばれるため、適用時はここで保持した辞書を使い設定を読み直さない。
+    main_window._layout_presets_cache = presets
+    preset_names = tuple(sorted(presets.keys()))
+    # 設定画面を開くたび・上書き保存のたびに呼ばれるが、名前一覧が同じなら表示は作り直さない。
+    if preset_names == getattr(main_window, "_layout_preset_names", None):
+        return
+    main_window._layout_preset_names = preset_names
 
     current = main_window.combo_layout_presets.currentText()
     with blocked_signals(main_window.combo_layout_presets):
         main_window.combo_layout_presets.clear()
-        for name in preset_names:
-            main_window.combo_layout_presets.addItem(name)
+        main_window.combo_layout_presets.addItems(list(preset_names))
         if current:
             idx = main_window.combo_layout_presets.findText(current)
             if idx >= 0:
@@ -275,7 +296,9 @@ def refresh_layout_preset_views(main_window) -> None:
 def apply_layout_preset(main_window, name: str) -> None:
     """指定名のプリセットを読み込み適用する。"""
     # 名前解決できたプリセットだけ適用する。
-    _, presets = _load_cfg_with_presets()
+    presets = getattr(main_window, "_layout_presets_cache", None)
+    if presets is None:
+        _, presets = _load_cfg_with_presets()
     layout = presets.get(name)
     if not isinstance(layout, dict):
         return
@@ -313,6 +336,7 @@ def save_layout_preset(main_window) -> None:
     cfg[C.CFG_LAYOUT_PRESETS] = presets
     cfg[C.CFG_LAYOUT_CURRENT] = presets[name]
     save_config(cfg)
+    main_window._last_saved_layout = presets[name]
 
     main_window.refresh_layout_preset_views()
     main_window.combo_layout_presets.setCurrentText(name)
@@ -1,5 +1,63 @@
 """MainWindow の control signal 配線補助。"""
 
+from functools import partial
+
+# (ウィジェット属性, シグナル名, ハンドラ属性) の順。新しい設定項目はここへ1行追加する。
+_ANALYSIS_CONTROL_BINDINGS = (
+    ("spin_interval", "valueChanged", "apply_interval_settings"),
+    ("spin_points", "valueChanged", "apply_sample_points_settings"),
+    ("combo_analysis_resolution_mode", "currentIndexChanged", "apply_analysis_resolution_settings"),
+    ("edit_analysis_max_dim", "valueChanged", "apply_analysis_resolution_settings"),
+    ("combo_scatter_shape", "currentIndexChanged", "apply_scatter_settings"),
+    ("combo_scatter_render_mode", "currentIndexChanged", "apply_scatter_settings"),
+    ("combo_wheel_mode", "currentIndexChanged", "apply_wheel_settings"),
+    ("chk_wheel_harmony_guide", "toggled", "apply_wheel_settings"),
+    ("combo_wheel_harmony_guide", "currentIndexChanged", "apply_wheel_settings"),
+    ("combo_rgb_hist_mode", "currentIndexChanged", "apply_rgb_hist_settings"),
+    ("combo_mirror_mode", "currentIndexChanged", "apply_mirror_settings"),
+    ("spin_wheel_sat_threshold", "valueChanged", "_invalidate_wheel_sat_threshold"),
+    ("spin_wheel_sat_threshold", "valueChanged", "apply_wheel_settings"),
+    ("chk_color_band_use_wheel_sat_threshold", "toggled", "apply_color_band_settings"),
+    ("spin_color_band_sat_threshold", "valueChanged", "apply_color_band_settings"),
+    ("chk_color_band_use_wheel_harmony", "toggled", "apply_color_band_settings"),
+    ("chk_color_band_harmony_guide", "toggled", "apply_color_band_settings"),
+    ("combo_color_band_harmony_guide", "currentIndexChanged", "apply_color_band_settings"),
+    ("combo_mode", "currentIndexChanged", "apply_mode_settings"),
+    ("spin_diff", "valueChanged", "apply_mode_settings"),
+    ("spin_stable", "valueChanged", "apply_mode_settings"),
+    ("spin_edge_sensitivity", "valueChanged", "apply_edge_settings"),
+    ("combo_binary_preset", "currentIndexChanged", "apply_binary_settings"),
+    ("combo_ternary_preset", "currentIndexChanged", "apply_ternary_settings"),
+    ("spin_saliency_alpha", "valueChanged", "apply_saliency_settings"),
+    ("combo_composition_guide", "currentIndexChanged", "apply_composition_guide_settings"),
+    ("spin_focus_peak_sensitivity", "valueChanged", "apply_focus_peaking_settings"),
+    ("combo_focus_peak_color", "currentIndexChanged", "apply_focus_peaking_settings"),
+    ("spin_focus_peak_thickness", "valueChanged", "apply_focus_peaking_settings"),
+    ("combo_squint_mode", "currentIndexChanged", "apply_squint_settings"),
+    ("spin_squint_scale", "valueChanged", "apply_squint_settings"),
+    ("spin_squint_blur", "valueChanged", "apply_squint_settings"),
+    ("chk_vectorscope_skin_line", "toggled", "apply_vectorscope_settings"),
+    ("spin_vectorscope_warn_threshold", "valueChanged", "apply_vectorscope_settings"),
+    ("chk_preview_window", "toggled", "on_preview_toggled"),
+)
+# 取得元選択・ROI操作・テーマは即時反映したいので、畳み込まずに直接接続する。
+_CAPTURE_CONTROL_BINDINGS = (
+    ("combo_win", "currentIndexChanged", "on_window_changed"),
+    ("combo_win", "currentTextChanged", "on_window_text_changed"),
+    ("combo_win", "activated", "on_window_index_activated"),
+    ("btn_pick_roi_win", "clicked", "pick_roi_in_window"),
+    ("btn_pick_roi_screen", "clicked", "pick_roi_on_screen"),
+    ("combo_capture_source", "currentIndexChanged", "apply_capture_source"),
+    ("combo_ui_theme", "currentIndexChanged", "apply_theme_settings"),
+)
+_LAYOUT_PRESET_BINDINGS = (
+    ("btn_save_preset", "clicked", "save_layout_preset"),
+    ("btn_load_preset", "clicked", "load_selected_layout_preset"),
+    ("btn_delete_preset", "clicked", "delete_selected_layout_preset"),
+)
+# このプレフィックスのハンドラは UI 状態を読み直すだけなので、連続操作を1回の反映へ畳み込む。
+_COALESCED_HANDLER_PREFIX = "apply_"
+
 
 def connect_control_signals(main_window) -> None:
     """操作ウィジェットと各種ハンドラのシグナル接続を行う。"""
@@ -8,11 +66,18 @@ def connect_control_signals(main_window) -> None:
     connect_layout_preset_signals(main_window)
 
 
+def _connect_bindings(main_window, bindings) -> None:
+    """(ウィジェット属性, シグナル名, ハンドラ属性) の表どおりに直接接続する。"""
+    for widget_attr, signal_name, slot_attr in bindings:
+        getattr(getattr(main_window, widget_attr), signal_name).connect(
+            getattr(main_window, slot_attr)
+        )
+
+
 def connect_capture_control_signals(main_window) -> None:
     """取得元選択とROI操作のシグナルを接続する。"""
-    main_window.combo_win.currentIndexChanged.connect(main_window.on_window_changed)
-    main_window.combo_win.currentTextChanged.connect(main_window.on_window_text_changed)
-    main_window.combo_win.activated.connect(main_window.on_window_index_activated)
+    _connect_bindings(main_window, _CAPTURE_CONTROL_BINDINGS)
+    # 以下は Qt バージョンや編集可否で存在しない場合があるため、表の外で個別に接続する。
     text_activated = getattr(main_window.combo_win, "textActivated", None)
     if text_activated is not None:
         text_activated.connect(main_window.on_window_text_activated)
@@ -23,80 +88,18 @@ def connect_capture_control_signals(main_window) -> None:
     if main_window.combo_win.lineEdit() is not None:
         main_window.combo_win.lineEdit().textEdited.connect(main_window.on_window_text_edited)
         main_window.combo_win.lineEdit().editingFinished.connect(main_window.on_window_text_committed)
-    main_window.btn_pick_roi_win.clicked.connect(main_window.pick_roi_in_window)
-    main_window.btn_pick_roi_screen.clicked.connect(main_window.pick_roi_on_screen)
-    main_window.combo_capture_source.currentIndexChanged.connect(main_window.apply_capture_source)
-    main_window.combo_ui_theme.currentIndexChanged.connect(main_window.apply_theme_settings)
 
 
 def connect_analysis_control_signals(main_window) -> None:
     """解析設定とプレビュー制御のシグナルを接続する。"""
-    main_window.spin_interval.valueChanged.connect(
-        lambda v: main_window.worker.set_interval(float(v))
-    )
-    main_window.spin_points.valueChanged.connect(main_window.apply_sample_points_settings)
-    main_window.combo_analysis_resolution_mode.currentIndexChanged.connect(
-        main_window.apply_analysis_resolution_settings
-    )
-    main_window.edit_analysis_max_dim.valueChanged.connect(
-        main_window.apply_analysis_resolution_settings
-    )
-    main_window.combo_scatter_shape.currentIndexChanged.connect(main_window.apply_scatter_settings)
-    main_window.combo_scatter_render_mode.currentIndexChanged.connect(
-        main_window.apply_scatter_settings
-    )
-    main_window.combo_wheel_mode.currentIndexChanged.connect(main_window.apply_wheel_settings)
-    main_window.chk_wheel_harmony_guide.toggled.connect(main_window.apply_wheel_settings)
-    main_window.combo_wheel_harmony_guide.currentIndexChanged.connect(
-        main_window.apply_wheel_settings
-    )
-    main_window.combo_rgb_hist_mode.currentIndexChanged.connect(main_window.apply_rgb_hist_settings)
-    main_window.combo_mirror_mode.currentIndexChanged.connect(main_window.apply_mirror_settings)
-    main_window.spin_wheel_sat_threshold.valueChanged.connect(main_window.apply_wheel_settings)
-    main_window.chk_color_band_use_wheel_sat_threshold.toggled.connect(
-        main_window.apply_color_band_settings
-    )
-    main_window.spin_color_band_sat_threshold.valueChanged.connect(
-        main_window.apply_color_band_settings
-    )
-    main_window.chk_color_band_use_wheel_harmony.toggled.connect(
-        main_window.apply_color_band_settings
-    )
-    main_window.chk_color_band_harmony_guide.toggled.connect(main_window.apply_color_band_settings)
-    main_window.combo_color_band_harmony_guide.currentIndexChanged.connect(
-        main_window.apply_color_band_settings
-    )
-    main_window.combo_mode.currentIndexChanged.connect(main_window.apply_mode_settings)
-    main_window.spin_diff.valueChanged.connect(main_window.apply_mode_settings)
-    main_window.spin_stable.valueChanged.connect(main_window.apply_mode_settings)
-    main_window.spin_edge_sensitivity.valueChanged.connect(main_window.apply_edge_settings)
-    main_window.combo_binary_preset.currentIndexChanged.connect(main_window.apply_binary_settings)
-    main_window.combo_ternary_preset.currentIndexChanged.connect(main_window.apply_ternary_settings)
-    main_window.spin_saliency_alpha.valueChanged.connect(main_window.apply_saliency_settings)
-    main_window.combo_composition_guide.currentIndexChanged.connect(
-        main_window.apply_composition_guide_settings
-    )
-    main_window.spin_focus_peak_sensitivity.valueChanged.connect(
-        main_window.apply_focus_peaking_settings
-    )
-    main_window.combo_focus_peak_color.currentIndexChanged.connect(
-        main_window.apply_focus_peaking_settings
-    )
-    main_window.spin_focus_peak_thickness.valueChanged.connect(
-        main_window.apply_focus_peaking_settings
-    )
-    main_window.combo_squint_mode.currentIndexChanged.connect(main_window.apply_squint_settings)
-    main_window.spin_squint_scale.valueChanged.connect(main_window.apply_squint_settings)
-    main_window.spin_squint_blur.valueChanged.connect(main_window.apply_squint_settings)
-    main_window.chk_vectorscope_skin_line.toggled.connect(main_window.apply_vectorscope_settings)
-    main_window.spin_vectorscope_warn_threshold.valueChanged.connect(
-        main_window.apply_vectorscope_settings
-    )
-    main_window.chk_preview_window.toggled.connect(main_window.on_preview_toggled)
+    for widget_attr, signal_name, slot_attr in _ANALYSIS_CONTROL_BINDINGS:
+        signal = getattr(getattr(main_window, widget_attr), signal_name)
+        if slot_attr.startswith(_COALESCED_HANDLER_PREFIX):
+            signal.connect(partial(main_window._queue_settings_apply, slot_attr))
+        else:
+            signal.connect(getattr(main_window, slot_attr))
 
 
 def connect_layout_preset_signals(main_window) -> None:
     """レイアウトプリセット操作のシグナルを接続する。"""
-    main_window.btn_save_preset.clicked.connect(main_window.save_layout_preset)
-    main_window.btn_load_preset.clicked.connect(main_window.load_selected_layout_preset)
-    main_window.btn_delete_preset.clicked.connect(main_window.delete_selected_layout_preset)
+    _connect_bindings(main_window, _LAYOUT_PRESET_BINDINGS)
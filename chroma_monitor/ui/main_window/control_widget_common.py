@@ -4,6 +4,7 @@ from PySide6.QtWidgets import QComboBox, QDoubleSpinBox
 
 from ..input_widgets import SelectAllSpinBox, configure_numeric_input
 from ...util import constants as C
+from ...util.qt_helpers import blocked_signals
 
 
 def set_widget_unit_label(widget, suffix: str) -> None:
@@ -16,9 +17,13 @@ def populate_data_combo(combo: QComboBox, items) -> None:
     popup_view = combo.view()
     if popup_view is not None:
         popup_view.setProperty("chromaRole", "comboPopup")
-    combo.clear()
-    for label, data in items:
-        combo.addItem(label, data)
+    items = tuple(items)
+    # 1件ずつ addItem せず一括挿入し、モデル更新通知を1回にまとめる。
+    with blocked_signals(combo):
+        combo.clear()
+        combo.addItems([str(label) for label, _data in items])
+        for index, (_label, data) in enumerate(items):
+            combo.setItemData(index, data)
 
 
 def build_int_spinbox(
@@ -5,7 +5,7 @@ import re
 
 from PySide6.QtCore import QTimer, QUrl
 from PySide6.QtGui import QDesktopServices
-from PySide6.QtNetwork import QNetworkReply, QNetworkRequest
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
 from PySide6.QtWidgets import QMenuBar
 
 from ...util import constants as C
@@ -58,6 +58,16 @@ def start_release_check_once(main_window) -> None:
     QTimer.singleShot(900, main_window._check_latest_release)
 
 
+def _release_check_network(main_window) -> QNetworkAccessManager:
+    """更新確認用の QNetworkAccessManager を初回利用時に生成して返す。"""
+    network = main_window._update_network
+    if network is None:
+        network = QNetworkAccessManager(main_window)
+        network.finished.connect(main_window._on_release_check_finished)
+        main_window._update_network = network
+    return network
+
+
 def check_latest_release(main_window) -> None:
     """GitHub Releases APIへ最新タグ問い合わせを送信する。"""
     if main_window._update_reply is not None:
@@ -67,7 +77,7 @@ def check_latest_release(main_window) -> None:
     request.setRawHeader(b"User-Agent", C.APP_NAME.encode("utf-8"))
     if hasattr(request, "setTransferTimeout"):
         request.setTransferTimeout(int(_UPDATE_CHECK_TIMEOUT_MS))
-    main_window._update_reply = main_window._update_network.get(request)
+    main_window._update_reply = _release_check_network(main_window).get(request)
 
 
 def on_release_check_finished(main_window, reply: QNetworkReply) -> None:
@@ -5,13 +5,16 @@ from __future__ import annotations
 def apply_additional_theme(main_window, theme_name: str | None = None):
     """010 の dock スタイル適用後に、非ドック要素へだけ追加テーマ反映する。"""
     from ...util import theme as ui_theme
-    from .. import settings_dialog as settings_dialog_ui
 
     theme = ui_theme.get_ui_theme(theme_name or getattr(main_window, "_ui_theme_name", None))
     main_window._ui_theme = theme
     main_window._ui_theme_name = theme.name
 
-    settings_dialog_ui.refresh_settings_nav_style(main_window)
+    if hasattr(main_window, "_settings_nav"):
+        # 設定ダイアログを開いた後だけ読み込み済みモジュールでナビを再同期する。
+        from .. import settings_dialog as settings_dialog_ui
+
+        settings_dialog_ui.refresh_settings_nav_style(main_window)
 
     themed_widgets = (
         getattr(main_window, "preview_window", None),
@@ -3,13 +3,12 @@
 from dataclasses import dataclass
 
 from PySide6.QtCore import QRect, QSize, Qt
-from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+from PySide6.QtGui import QColor, QPainter, QPen
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QListWidgetItem, QSizePolicy, QWidget
 
 from ...analysis.frame_analysis import compute_top_bars_chromatic_medoid
 from ...util import constants as C
-from ...util.image_ops import clamp_render_size
-from ...util.qt_helpers import is_widget_renderable, set_visible_if_changed
+from ...util.qt_helpers import is_widget_renderable, set_visible_if_changed, updates_suspended
 from ...util.theme import UiTheme, get_ui_theme, qcolor
 from .result_color_band_palette import (
     COLOR_BAND_KEY_RATIO_DECIMALS,
@@ -31,7 +30,6 @@ from .settings_values import (
     selected_wheel_harmony_guide_type,
 )
 
-_TOP_BAR_MIN_HEIGHT = 12
 _TOP_BAR_TEXT_MIN_WIDTH = 240
 _TOP_BAR_TEXT_MIN_SEGMENT_PX = 42
 _TOP_BAR_LIGHT_TEXT_RGB_SUM_THRESHOLD = 400
@@ -42,6 +40,7 @@ _COLOR_BAND_MIN_H_SHOW_TOP_BAR = 1
 _COLOR_BAND_MIN_H_SHOW_WARMCOOL = 56
 _COLOR_BAND_MIN_H_SHOW_CHIP_LIST = 120
 _COLOR_BAND_MIN_H_SHOW_DETAIL = 210
+_COLOR_CHIP_ROW_SIZE = QSize(0, 34)
 _COLOR_DETAIL_HINT_SELECT = "一覧から色を選択してください。"
 _COLOR_DETAIL_HINT_ACHROMATIC = "無彩色が選択されています。調和色は表示されません。"
 _COLOR_DETAIL_LABEL_HARMONY = "色彩調和"
@@ -135,67 +134,99 @@ def _theme_from(main_window) -> UiTheme:
     return getattr(main_window, "_ui_theme", None) or get_ui_theme()
 
 
-def render_top_color_bar(
+def paint_top_color_bar(
+    painter: QPainter,
     bars: list[tuple],
     *,
     theme: UiTheme,
-    width: int = 300,
-    height: int = C.TOP_COLOR_BAR_HEIGHT,
-) -> QPixmap:
-    """配色比率バーのピクスマップを描画して返す。"""
-    safe_w, safe_h = clamp_render_size(width, max(_TOP_BAR_MIN_HEIGHT, height))
-    pm = QPixmap(safe_w, safe_h)
-    pm.fill(Qt.transparent)
-    painter = QPainter(pm)
-    try:
-        painter.fillRect(QRect(0, 0, pm.width(), pm.height()), qcolor(theme.top_bar_bg))
-        show_text = pm.width() >= _TOP_BAR_TEXT_MIN_WIDTH
-        if bars:
-            ratio_color_pairs = [top_bar_item_ratio_color(item) for item in bars]
-            ratios = [max(0.0, float(pair[0])) for pair in ratio_color_pairs]
-            colors = [tuple(int(c) for c in pair[1]) for pair in ratio_color_pairs]
-            total_ratio = float(sum(ratios))
-            if total_ratio <= 0.0:
-                widths = [0] * len(bars)
+    width: int,
+    height: int,
+) -> None:
+    """配色比率バーを `painter` の `(0, 0, width, height)` 領域へ描画する。"""
+    width = max(1, int(width))
+    height = max(1, int(height))
+    painter.fillRect(QRect(0, 0, width, height), qcolor(theme.top_bar_bg))
+    show_text = width >= _TOP_BAR_TEXT_MIN_WIDTH
+    if bars:
+        ratio_color_pairs = [top_bar_item_ratio_color(item) for item in bars]
+        ratios = [max(0.0, float(pair[0])) for pair in ratio_color_pairs]
+        colors = [tuple(int(c) for c in pair[1]) for pair in ratio_color_pairs]
+        total_ratio = float(sum(ratios))
+        if total_ratio <= 0.0:
+            widths = [0] * len(bars)
+        else:
+            scale = float(width) / total_ratio
+            widths = [max(1, int(round(r * scale))) for r in ratios]
+            total_w = int(sum(widths))
+            if total_w != width:
+                # 端数誤差は最大割合セグメントに寄せ、極小セグメントの過大化を避ける。
+                anchor = max(range(len(ratios)), key=lambda i: ratios[i])
+                widths[anchor] = max(1, int(widths[anchor] + (width - total_w)))
+
+        x = 0
+        n = len(bars)
+        for i in range(n):
+            ratio = ratios[i]
+            color = colors[i]
+            if i == n - 1:
+                w = max(0, int(width - x))
             else:
-                scale = float(pm.width()) / total_ratio
-                widths = [max(1, int(round(r * scale))) for r in ratios]
-                total_w = int(sum(widths))
-                if total_w != int(pm.width()):
-                    # 端数誤差は最大割合セグメントに寄せ、極小セグメントの過大化を避ける。
-                    anchor = max(range(len(ratios)), key=lambda i: ratios[i])
-                    widths[anchor] = max(1, int(widths[anchor] + (pm.width() - total_w)))
-
-            x = 0
-            n = len(bars)
-            for i in range(n):
-                ratio = ratios[i]
-                color = colors[i]
-                if i == n - 1:
-                    w = max(0, int(pm.width() - x))
-                else:
-                    w = max(0, min(int(widths[i]), int(pm.width() - x)))
-                if w <= 0:
-                    continue
-                painter.fillRect(QRect(x, 0, w, pm.height()), QColor(*color))
-                if show_text and w >= _TOP_BAR_TEXT_MIN_SEGMENT_PX:
-                    pct = f"{ratio*100:.1f}%"
-                    painter.setPen(
-                        QColor(255, 255, 255)
-                        if sum(color) < _TOP_BAR_LIGHT_TEXT_RGB_SUM_THRESHOLD
-                        else QColor(40, 40, 40)
-                    )
-                    painter.drawText(QRect(x + 2, 0, w - 4, pm.height()), Qt.AlignCenter, pct)
-                x += w
-        painter.setPen(QPen(qcolor(theme.top_bar_border), 1))
-        painter.drawRect(0, 0, pm.width() - 1, pm.height() - 1)
-    finally:
-        painter.end()
-    return pm
+                w = max(0, min(int(widths[i]), int(width - x)))
+            if w <= 0:
+                continue
+            painter.fillRect(QRect(x, 0, w, height), QColor(*color))
+            if show_text and w >= _TOP_BAR_TEXT_MIN_SEGMENT_PX:
+                pct = f"{ratio*100:.1f}%"
+                painter.setPen(
+                    QColor(255, 255, 255)
+                    if sum(color) < _TOP_BAR_LIGHT_TEXT_RGB_SUM_THRESHOLD
+                    else QColor(40, 40, 40)
+                )
+                painter.drawText(QRect(x + 2, 0, w - 4, height), Qt.AlignCenter, pct)
+            x += w
+    painter.setPen(QPen(qcolor(theme.top_bar_border), 1))
+    painter.drawRect(0, 0, width - 1, height - 1)
+
+
+class TopColorBarWidget(QWidget):
+    """配色比率バーを子ウィジェットや中間ピクスマップなしで直接描画するウィジェット。"""
+
+    def __init__(self, parent=None):
+        """描画対象のバー列とテーマを空で初期化する。"""
+        super().__init__(parent)
+        self._bars: list[tuple] = []
+        self._theme: UiTheme | None = None
+
+    def set_bars(self, bars: list[tuple], theme: UiTheme) -> None:
+        """描画するバー列とテーマを差し替え、再描画を予約する。"""
+        self._bars = list(bars or [])
+        self._theme = theme
+        self.update()
+
+    def clear(self) -> None:
+        """バー表示を消去する。"""
+        self.set_bars([], self._theme)
+
+    def paintEvent(self, _event):
+        """現在サイズに合わせてバーを描画する。"""
+        # バーが無い間は従来の空ラベル同様に何も描かない。
+        if not self._bars or self._theme is None:
+            return
+        painter = QPainter(self)
+        try:
+            paint_top_color_bar(
+                painter,
+                self._bars,
+                theme=self._theme,
+                width=self.width(),
+                height=self.height(),
+            )
+        finally:
+            painter.end()
 
 
 def refresh_top_color_bar(main_window) -> None:
-    """バー表示条件が変わったときだけ配色比率バーを再描画する。"""
+    """バー内容かテーマが変わったときだけ配色比率バーへ反映する。"""
     # 表示対象がないときはバーを消してキャッシュキーも初期化する。
     theme = _theme_from(main_window)
     bars = getattr(main_window, "_last_top_bars", None)
@@ -204,30 +235,16 @@ def refresh_top_color_bar(main_window) -> None:
         main_window._last_top_bars_key = None
         main_window.top_colors_bar.clear()
         return
-    if not main_window.top_colors_bar.isVisible():
-        return
 
     bars_key = getattr(main_window, "_last_top_bars_key", None)
     if bars_key is None:
         bars_key = tuple(bar_key_item(item) for item in bars)
         main_window._last_top_bars_key = bars_key
-    render_key = (
-        int(main_window.top_colors_bar.width()),
-        int(main_window.top_colors_bar.height()),
-        bars_key,
-    )
-    # 前回描画と同じ条件なら再レンダリングを省略する。
-    if render_key == getattr(main_window, "_top_bar_render_key", None):
+    # サイズ変更は paintEvent 側で現在幅に合わせて描き直すため、キーは内容のみで持つ。
+    if bars_key == getattr(main_window, "_top_bar_render_key", None):
         return
-    main_window._top_bar_render_key = render_key
-    main_window.top_colors_bar.setPixmap(
-        render_top_color_bar(
-            bars,
-            theme=theme,
-            width=main_window.top_colors_bar.width(),
-            height=main_window.top_colors_bar.height(),
-        )
-    )
+    main_window._top_bar_render_key = bars_key
+    main_window.top_colors_bar.set_bars(bars, theme)
 
 
 def apply_color_band_theme(main_window, _theme: UiTheme) -> None:
@@ -248,47 +265,50 @@ def _set_color_chip_items(main_window, entries: list[dict]) -> None:
         return
     theme = _theme_from(main_window)
     prev_row = int(list_widget.currentRow())
-    list_widget.blockSignals(True)
-    try:
-        list_widget.clear()
-        for entry in entries:
-            rgb = entry["rgb"]
-            item = QListWidgetItem()
-            item.setData(Qt.UserRole, int(entry["index"]))
-            item.setSizeHint(QSize(0, 34))
-            list_widget.addItem(item)
-
-            row = QWidget()
-            row_l = QHBoxLayout(row)
-            row_l.setContentsMargins(6, 4, 6, 4)
-            row_l.setSpacing(8)
-
-            swatch = QLabel()
-            swatch.setFixedSize(22, 22)
-            swatch.setStyleSheet(
-                f"border:1px solid {theme.swatch_border}; border-radius:3px;"
-                f"background: rgb({int(rgb[0])}, {int(rgb[1])}, {int(rgb[2])});"
-            )
-            row_l.addWidget(swatch, 0)
-
-            text = QLabel(
-                f"{entry['index']+1}. {entry['label']}   "
-                f"{entry['ratio']*100:.1f}%   "
-                f"{entry['hsv_text']}   "
-                f"RGB({int(rgb[0])}, {int(rgb[1])}, {int(rgb[2])})   "
-                f"{entry['hex']}"
-            )
-            text.setProperty("chromaRole", "detailText")
-            text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-            row_l.addWidget(text, 1)
-            list_widget.setItemWidget(item, row)
-        if list_widget.count() > 0 and 0 <= prev_row < list_widget.count():
-            list_widget.setCurrentRow(prev_row)
-        else:
-            # 初回表示時は自動選択しない。ユーザーが明示的に選択したときだけ詳細を出す。
-            list_widget.setCurrentRow(-1)
-    finally:
-        list_widget.blockSignals(False)
+    # 行の作り直しが終わるまで再描画を止め、一覧の再レイアウトを最後の1回にまとめる。
+    with updates_suspended(list_widget):
+        list_widget.blockSignals(True)
+        try:
+            list_widget.clear()
+            for entry in entries:
+                rgb = entry["rgb"]
+                # 値を載せ終えた項目を挿入し、挿入後の setData による行ごとの変更通知を出さない。
+                item = QListWidgetItem()
+                item.setData(Qt.UserRole, int(entry["index"]))
+                item.setSizeHint(_COLOR_CHIP_ROW_SIZE)
+                list_widget.addItem(item)
+
+                row = QWidget()
+                row_l = QHBoxLayout(row)
+                row_l.setContentsMargins(6, 4, 6, 4)
+                row_l.setSpacing(8)
+
+                swatch = QLabel()
+                swatch.setFixedSize(22, 22)
+                swatch.setStyleSheet(
+                    f"border:1px solid {theme.swatch_border}; border-radius:3px;"
+                    f"background: rgb({int(rgb[0])}, {int(rgb[1])}, {int(rgb[2])});"
+                )
+                row_l.addWidget(swatch, 0)
+
+                text = QLabel(
+                    f"{entry['index']+1}. {entry['label']}   "
+                    f"{entry['ratio']*100:.1f}%   "
+                    f"{entry['hsv_text']}   "
+                    f"RGB({int(rgb[0])}, {int(rgb[1])}, {int(rgb[2])})   "
+                    f"{entry['hex']}"
+                )
+                text.setProperty("chromaRole", "detailText")
+                text.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+                row_l.addWidget(text, 1)
+                list_widget.setItemWidget(item, row)
+            if list_widget.count() > 0 and 0 <= prev_row < list_widget.count():
+                list_widget.setCurrentRow(prev_row)
+            else:
+                # 初回表示時は自動選択しない。ユーザーが明示的に選択したときだけ詳細を出す。
+                list_widget.setCurrentRow(-1)
+        finally:
+            list_widget.blockSignals(False)
 
 
 def _harmony_enabled_from_ui(main_window) -> bool:
@@ -6,12 +6,13 @@ import cv2
 import numpy as np
 
 from ...analysis import live_graph_data
-from ...analysis.result_payloads import AnalyzerResultPayload, ResultFramePayload
+from ...analysis.result_payloads import AnalyzerResult, ResultFramePayload
 from ...analysis.frame_analysis import compute_hsv_histograms
 from ...util.image_ops import (
     clear_cvt_color_cache,
     clear_resize_cache,
     cvt_color_cached,
+    image_cache_mark,
     resize_by_long_edge,
 )
 from ...util.qt_helpers import is_widget_renderable
@@ -29,11 +30,21 @@ _GRAPH_DOCK_ORDER = (
     _SNAPSHOT_DOCK_SCATTER,
     _SNAPSHOT_DOCK_HIST,
 )
+_SNAPSHOT_GRAPH_ARRAY_KEYS = (
+    "sv",
+    "rgb",
+    "h_plane",
+    "s_plane",
+    "v_plane",
+    "h_hist",
+    "s_hist",
+    "v_hist",
+)
 _GRAPH_DOCK_REQUIREMENTS = {
-    _SNAPSHOT_DOCK_COLOR: (True, False, False, False),
-    _SNAPSHOT_DOCK_COLOR_BAND: (True, True, False, False),
-    _SNAPSHOT_DOCK_SCATTER: (False, False, True, False),
-    _SNAPSHOT_DOCK_HIST: (False, False, False, True),
+    _SNAPSHOT_DOCK_COLOR: live_graph_data.VIEW_FLAG_COLOR,
+    _SNAPSHOT_DOCK_COLOR_BAND: live_graph_data.VIEW_FLAG_COLOR | live_graph_data.VIEW_FLAG_COLOR_BAND,
+    _SNAPSHOT_DOCK_SCATTER: live_graph_data.VIEW_FLAG_SCATTER,
+    _SNAPSHOT_DOCK_HIST: live_graph_data.VIEW_FLAG_HSV_HIST,
 }
 
 
@@ -83,44 +94,45 @@ def _ensure_snapshot_state(main_window) -> None:
 
 def _store_result_snapshot(
     main_window,
-    res: AnalyzerResultPayload,
+    res: AnalyzerResult,
     *,
     update_bgr: bool = True,
     bump_version: bool = True,
 ) -> tuple[ResultSnapshot, int]:
     """新しい結果を既存スナップショットへ反映し、必要なら版数を進める。"""
     _ensure_snapshot_state(main_window)
-    snap = cast(ResultSnapshot, dict(main_window._latest_result_snapshot))
+    # 毎フレーム辞書を複製せず、保持中のスナップショットを直接更新する。
+    # (旧スナップショットを保持して差分を見る箇所はなく、配色キャッシュ無効化も同じ辞書を更新する)
+    snap = cast(ResultSnapshot, main_window._latest_result_snapshot)
 
     if update_bgr:
         # 生画像は必要なときだけ更新する。
-        bgr_preview = res.get("bgr_preview")
+        bgr_preview = res.bgr_preview
         if bgr_preview is not None:
             snap["bgr_preview"] = bgr_preview
-    if res.get("cap") is not None:
-        snap["cap"] = res.get("cap")
-    if res.get("dt_ms") is not None:
-        snap["dt_ms"] = float(res.get("dt_ms", 0.0))
+    if res.cap is not None:
+        snap["cap"] = res.cap
+    if res.dt_ms is not None:
+        snap["dt_ms"] = float(res.dt_ms)
 
-    if bool(res.get("graph_update")):
+    if res.graph_update:
         # 再計算される派生値は毎回クリアする。
         snap["top_colors_full"] = None
         snap["top_colors_filtered"] = None
         snap["top_colors_key"] = None
-        snap["top_colors"] = res.get("top_colors")
-        if res.get("hist") is not None:
-            snap["hist"] = res.get("hist")
-            snap["warm_ratio"] = float(res.get("warm_ratio", snap["warm_ratio"]))
-            snap["cool_ratio"] = float(res.get("cool_ratio", snap["cool_ratio"]))
-            snap["other_ratio"] = float(res.get("other_ratio", snap["other_ratio"]))
-        for key in ("sv", "rgb", "h_plane", "s_plane", "v_plane", "h_hist", "s_hist", "v_hist"):
-            value = res.get(key)
+        snap["top_colors"] = res.top_colors
+        if res.hist is not None:
+            snap["hist"] = res.hist
+            snap["warm_ratio"] = float(res.warm_ratio)
+            snap["cool_ratio"] = float(res.cool_ratio)
+            snap["other_ratio"] = float(res.other_ratio)
+        for key in _SNAPSHOT_GRAPH_ARRAY_KEYS:
+            value = getattr(res, key)
             if value is not None:
                 snap[key] = value
 
     if bump_version:
         main_window._latest_result_version = int(main_window._latest_result_version) + 1
-    main_window._latest_result_snapshot = snap
     return snap, int(main_window._latest_result_version)
 
 
@@ -217,8 +229,9 @@ def _render_hist_dock_from_snapshot(main_window, snapshot: ResultSnapshot) -> bo
     """HSVヒストグラムドックへスナップショットを反映する。"""
     if not is_widget_renderable(main_window.dock_hist):
         return False
-    bgr_preview = snapshot.get("bgr_preview")
-    h_hist, s_hist, v_hist = _apply_hsv_hist_fallback_from_bgr(snapshot, bgr_preview)
+    # 補完時も graph と同じ解析解像度で HSV 化し、画像ドックと縮小結果を共有する。
+    bgr_input = _image_view_input_bgr(main_window, snapshot.get("bgr_preview"))
+    h_hist, s_hist, v_hist = _apply_hsv_hist_fallback_from_bgr(snapshot, bgr_input)
     hist_pairs = (
         (main_window.hist_h, h_hist, snapshot.get("h_plane")),
         (main_window.hist_s, s_hist, snapshot.get("s_plane")),
@@ -374,15 +387,13 @@ def _ensure_snapshot_graph_data_for_dock(main_window, dock_name: str) -> bool:
             return False
         snapshot, _ = _store_result_snapshot(
             main_window,
-            {"bgr_preview": bgr_preview, "cap": cap, "graph_update": False},
+            AnalyzerResult(bgr_preview=bgr_preview, cap=cap, graph_update=False),
             update_bgr=True,
             bump_version=True,
         )
 
-    need_color, need_color_band, need_scatter, need_hsv_hist = _GRAPH_DOCK_REQUIREMENTS.get(
-        dock_name, (False, False, False, False)
-    )
-    if not (need_color or need_color_band or need_scatter or need_hsv_hist):
+    graph_flags = _GRAPH_DOCK_REQUIREMENTS.get(dock_name, 0)
+    if not graph_flags:
         return True
     try:
         # 必要な項目だけ部分再計算。
@@ -396,15 +407,16 @@ def _ensure_snapshot_graph_data_for_dock(main_window, dock_name: str) -> bool:
                     main_window
                 ),
             ),
-            need_color=need_color,
-            need_color_band=need_color_band,
-            need_scatter=need_scatter,
-            need_hsv_hist=need_hsv_hist,
+            view_flags=graph_flags,
         )
     except (cv2.error, TypeError, ValueError):
         return False
-    graph_res["graph_update"] = True
-    _store_result_snapshot(main_window, graph_res, update_bgr=False, bump_version=True)
+    _store_result_snapshot(
+        main_window,
+        AnalyzerResult.from_payload(graph_res, graph_update=True),
+        update_bgr=False,
+        bump_version=True,
+    )
     return _snapshot_has_graph_data_for_dock(main_window._latest_result_snapshot, dock_name)
 
 
@@ -502,25 +514,55 @@ def restore_dock_from_snapshot(main_window, dock, *, force: bool = False) -> Non
         _mark_docks_rendered(main_window, int(main_window._latest_result_version), {dock_name})
 
 
-def on_result(main_window, res: AnalyzerResultPayload):
+def on_result(main_window, res: AnalyzerResult):
     """ワーカー結果を受け取り、可視ドックへ反映して状態を更新する。"""
     # 例外時でも未消費フラグを解除するため、finallyで必ず後処理する。
+    released = False
+    cache_mark = None
     try:
         snapshot, snapshot_version = _store_result_snapshot(main_window, res)
+        # 解放後に解析スレッドが積む次フレーム分のキャッシュは、後片付けで消さないよう目印を取る。
+        cache_mark = image_cache_mark()
+        # 配列参照はスナップショットへ移し終えたので、描画完了を待たずに次フレームの解析を許可する。
+        main_window.worker.mark_result_consumed()
+        released = True
         rendered_docks: set[str] = set()
-        bgr_preview = res.get("bgr_preview")
+        bgr_preview = res.bgr_preview
         if main_window.preview_window.isVisible() and bgr_preview is not None:
             main_window.preview_window.update_preview(bgr_preview)
 
         # graph_update=False ならグラフ再描画は行わない。
-        if res["graph_update"]:
+        if res.graph_update:
             rendered_docks.update(_render_all_graph_docks(main_window, snapshot))
 
         # 画像系ドックは常に可視分だけ更新する。
         rendered_docks.update(update_image_docks_from_frame(main_window, bgr_preview))
         _mark_docks_rendered(main_window, snapshot_version, rendered_docks)
     finally:
-        # 同一フレーム内で使った縮小キャッシュを破棄して次フレームへ持ち越さない。
-        clear_cvt_color_cache()
-        clear_resize_cache()
-        main_window.worker.mark_result_consumed()
+        # このフレームまでの縮小/色変換キャッシュを破棄する(描画中に積んだ分は次フレームで破棄される)。
+        clear_cvt_color_cache(cache_mark)
+        clear_resize_cache(cache_mark)
+        if not released:
+            # 解放後に再度呼ぶと、既に送られた次フレームの未消費フラグまで消してしまう。
+            main_window.worker.mark_result_consumed()
+
+
+def enqueue_result(main_window, res: AnalyzerResult) -> None:
+    """ワーカー結果を最新1件だけ保持し、次のイベントループで1回だけ反映する。"""
+    # 反映前に次の結果が届いたら古い方は描画せず捨てる(未消費フラグは最新結果側で解除する)。
+    main_window._pending_result = res
+    if main_window._result_flush_scheduled:
+        return
+    main_window._result_flush_scheduled = True
+    # フレームごとに一時タイマーとバインドメソッドを作らないよう、常駐タイマーを再始動する。
+    main_window._result_flush_timer.start()
+
+
+def drain_pending_result(main_window) -> None:
+    """保留中の最新結果を取り出して反映する。"""
+    main_window._result_flush_scheduled = False
+    res = main_window._pending_result
+    main_window._pending_result = None
+    if res is None:
+        return
+    on_result(main_window, res)
@@ -34,6 +34,7 @@ from .runtime_layout_pause import (
     end_layout_interaction_pause,
     has_visible_image_dock,
     schedule_layout_interaction_resume,
+    schedule_worker_view_flags_sync,
     sync_worker_view_flags,
 )
 from .runtime_preview import on_preview_closed, on_preview_toggled, update_preview_snapshot
@@ -70,6 +71,7 @@ __all__ = [
     "on_window_text_edited",
     "refresh_windows",
     "schedule_layout_interaction_resume",
+    "schedule_worker_view_flags_sync",
     "selected_capture_source",
     "sync_capture_source_ui",
     "sync_worker_view_flags",
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 
 from PySide6.QtCore import QRect
 
-from ...capture.win32_windows import HAS_WIN32, list_windows
+from ...capture.win32_windows import HAS_WIN32, clear_list_windows_cache, list_windows
 from ...util import constants as C
 from ...util.debug_log import write_window_layout_debug_log
 from ...util.qt_helpers import (
@@ -88,15 +88,23 @@ def _find_combo_index_by_data(combo, data) -> int:
     return -1
 
 
+def _casefolded_combo_titles(combo) -> tuple[str, ...]:
+    """コンボ項目の casefold 済みタイトル列を返す。一覧再構築時の索引があれば再利用する。"""
+    titles = getattr(combo, "_chroma_casefold_titles", None)
+    if titles is not None and len(titles) == combo.count():
+        return titles
+    return tuple(combo.itemText(idx).casefold() for idx in range(combo.count()))
+
+
 def _find_combo_index_by_text_casefold(combo, text: str) -> int:
     """コンボボックス内で大文字小文字を無視して text を検索する。"""
     needle = str(text).casefold()
     if not needle:
         return -1
-    for idx in range(combo.count()):
-        if combo.itemText(idx).casefold() == needle:
-            return int(idx)
-    return -1
+    try:
+        return _casefolded_combo_titles(combo).index(needle)
+    except ValueError:
+        return -1
 
 
 def _find_combo_index_by_text_hint(combo, text: str) -> int:
@@ -105,8 +113,7 @@ def _find_combo_index_by_text_hint(combo, text: str) -> int:
     if not needle:
         return -1
     partial_idx = -1
-    for idx in range(combo.count()):
-        item_text = combo.itemText(idx).casefold()
+    for idx, item_text in enumerate(_casefolded_combo_titles(combo)):
         if item_text == needle:
             return int(idx)
         if needle not in item_text:
@@ -190,8 +197,20 @@ def _preserved_window_editor_text(combo, editor) -> str:
 def _rebuild_window_combo_items(combo, wins: list[tuple[int, str]]) -> None:
     """ウィンドウ候補一覧でコンボ項目を再構築する。"""
     combo.clear()
-    for hwnd, title in wins[:_WINDOW_LIST_MAX_ITEMS]:
-        combo.addItem(title, hwnd)
+    items = wins[:_WINDOW_LIST_MAX_ITEMS]
+    # 呼び出し側でシグナルを止めているため、一括挿入後に hwnd を後付けしてよい。
+    combo.addItems([str(title) for _hwnd, title in items])
+    for index, (hwnd, _title) in enumerate(items):
+        combo.setItemData(index, hwnd)
+    # 入力中は1打鍵ごとに候補照合するため、casefold 済みタイトルを列挙1回ごとに作っておく。
+    combo._chroma_casefold_titles = tuple(str(title).casefold() for _hwnd, title in items)
+    # 次回の列挙結果が同じなら再構築を省けるよう、反映済みの候補を覚えておく。
+    combo._chroma_window_items = tuple(items)
+
+
+def _window_items_unchanged(combo, wins: list[tuple[int, str]]) -> bool:
+    """列挙結果がコンボへ反映済みの候補と同じかを返す。"""
+    return tuple(wins[:_WINDOW_LIST_MAX_ITEMS]) == getattr(combo, "_chroma_window_items", None)
 
 
 def _should_skip_window_refresh(
@@ -575,7 +594,16 @@ def refresh_windows(
             force=bool(force),
         )
         return
+    if announce:
+        # 明示的な再取得では列挙キャッシュを捨て、必ず OS から取り直す。
+        clear_list_windows_cache()
     wins = _window_refresh_candidates()
+    if not preferred_title and not preferred_text and _window_items_unchanged(combo, wins):
+        # フォーカスやポップアップ表示ごとの再取得で候補が変わっていなければ、
+        # 項目の作り直しと選択/編集テキストの復元を丸ごと省く。
+        _debug_capture_target("refresh_unchanged", count=int(len(wins)), force=bool(force))
+        _announce_window_refresh(main_window, wins, announce=announce)
+        return
     restore_state = _prepare_window_refresh_state(
         combo,
         editor,
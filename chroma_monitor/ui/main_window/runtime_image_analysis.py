@@ -16,6 +16,7 @@ from PySide6.QtWidgets import (
 )
 
 from ...analysis.image_file_worker import ImageFileAnalyzeWorker
+from ...analysis.result_payloads import AnalyzerResult
 from ...util import constants as C
 from ...util.image_inputs import (
     is_supported_image_path as _is_supported_image_path,
@@ -397,7 +398,7 @@ def on_image_analysis_finished(main_window, res: dict):
     """画像解析完了時に結果反映と後処理を行う。"""
     cleanup_image_analysis(main_window)
     _promote_pending_loaded_image_source(main_window)
-    main_window.on_result(res)
+    main_window.on_result(AnalyzerResult.from_payload(res))
     restore_visible_docks_from_snapshot(main_window)
     schedule_snapshot_restore(main_window, 0, 80)
     on_status(main_window, f"画像解析完了 ({res.get('dt_ms', 0.0):.1f} ms)")
@@ -461,6 +462,8 @@ def close_event(main_window, event):
     cancel_image_analysis(main_window)
     cleanup_image_analysis(main_window)
     main_window.worker.stop()
+    # daemon スレッドのまま終了させず、WGC セッション解放まで待ってから閉じる。
+    safe_call(main_window.worker.wait)
     safe_close_widget(getattr(main_window, "preview_window", None), only_if_visible=True)
     safe_close_widget(getattr(main_window, "_settings_window", None))
     safe_close_widget(getattr(main_window, "_canvas_preview_window", None))
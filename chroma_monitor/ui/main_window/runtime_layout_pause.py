@@ -32,7 +32,8 @@ def _set_worker_view_flags_if_changed(
         bool(image),
         bool(preview),
     )
-    if state == getattr(main_window, "_worker_view_flags_state", None):
+    previous = getattr(main_window, "_worker_view_flags_state", None)
+    if state == previous:
         return
     main_window._worker_view_flags_state = state
     main_window.worker.set_view_flags(
@@ -43,6 +44,9 @@ def _set_worker_view_flags_if_changed(
         image=state[4],
         preview=state[5],
     )
+    if previous is not None and any(now and not before for now, before in zip(state, previous)):
+        # 同期が遅延した間に表示直後の強制更新が旧フラグで消費されうるため、新規ビュー分を取り直す。
+        main_window.worker.request_graph_refresh_once()
 
 
 def has_visible_image_dock(main_window) -> bool:
@@ -75,6 +79,17 @@ def sync_worker_view_flags(main_window):
     )
 
 
+def schedule_worker_view_flags_sync(main_window) -> None:
+    """worker 可視フラグ同期を短い間隔へ間引いて予約する。"""
+    timer = getattr(main_window, "_view_flags_sync_timer", None)
+    if timer is None:
+        sync_worker_view_flags(main_window)
+        return
+    # タブ切替やドラッグ中の連続通知は、最初の通知から一定時間後の1回へまとめる。
+    if not timer.isActive():
+        timer.start()
+
+
 def begin_layout_interaction_pause(main_window, reason: str = "layout") -> None:
     """レイアウト操作中の解析一時停止を開始する。"""
     reasons = getattr(main_window, "_layout_interaction_pause_reasons", None)
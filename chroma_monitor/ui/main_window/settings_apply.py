@@ -5,6 +5,7 @@ from ...util.qt_helpers import (
     blocked_signals,
     set_enabled_if,
     set_visible_if,
+    updates_suspended,
 )
 from .settings_values import (
     selected_analysis_max_dim,
@@ -20,6 +21,7 @@ from .settings_values import (
     selected_focus_peak_sensitivity,
     selected_focus_peak_thickness,
     selected_focus_peak_color,
+    selected_interval,
     selected_mirror_mode,
     selected_mode,
     selected_rgb_hist_mode,
@@ -86,6 +88,15 @@ def sync_analysis_resolution_rows(main_window):
     set_visible_if(getattr(main_window, "_hint_analysis_max_dim_settings", None), custom_mode)
 
 
+def sync_all_mode_rows(main_window):
+    """モード依存の入力行表示をまとめて同期する。"""
+    # 設定ダイアログ上の行切り替えを1回の再描画へまとめる。
+    with updates_suspended(getattr(main_window, "_settings_window", None)):
+        sync_analysis_resolution_rows(main_window)
+        sync_mode_dependent_rows(main_window)
+        sync_squint_mode_rows(main_window)
+
+
 def sync_scatter_filter_controls(main_window):
     """散布図フィルターUIの有効/無効と表示値を同期する。"""
     enabled = selected_scatter_hue_filter_enabled(main_window)
@@ -154,6 +165,12 @@ def _apply_vectorscope_view_state(
     update_vectorscope_warning_label(main_window)
 
 
+def apply_interval_settings(main_window, *_, save: bool = True):
+    """更新間隔設定をワーカーへ反映する。"""
+    main_window.worker.set_interval(selected_interval(main_window))
+    _request_save_if(main_window, save=save)
+
+
 def apply_sample_points_settings(main_window, *_, save: bool = True):
     """サンプル点数設定をワーカーへ反映する。"""
     main_window.worker.set_sample_points(selected_sample_points(main_window))
@@ -187,10 +204,27 @@ def apply_analysis_resolution_settings(main_window, *_args, save: bool = True):
     _request_save_if(main_window, save=save)
 
 
+def cached_wheel_sat_threshold(main_window) -> int:
+    """色相環用彩度しきい値を、入力が変わるまで読み直さずに返す。"""
+    cached = getattr(main_window, "_wheel_sat_threshold_cache", None)
+    if cached is None:
+        cached = selected_wheel_sat_threshold(main_window)
+        main_window._wheel_sat_threshold_cache = cached
+    return cached
+
+
+def invalidate_wheel_sat_threshold(main_window, *_args) -> None:
+    """色相環用彩度しきい値のキャッシュを破棄する。"""
+    main_window._wheel_sat_threshold_cache = None
+
+
 def apply_wheel_settings(main_window, *_, save: bool = True, sync_color_band: bool = True):
     """色相環設定をビューとワーカーへ反映する。"""
     main_window.wheel.set_mode(selected_wheel_mode(main_window))
-    main_window.worker.set_wheel_sat_threshold(selected_wheel_sat_threshold(main_window))
+    # 設定ロードはシグナル抑止で値を入れるため、反映のたびにキャッシュも読み直した値へ揃える。
+    wheel_sat_threshold = selected_wheel_sat_threshold(main_window)
+    main_window._wheel_sat_threshold_cache = wheel_sat_threshold
+    main_window.worker.set_wheel_sat_threshold(wheel_sat_threshold)
     guide_enabled = selected_wheel_harmony_guide_enabled(main_window)
     set_enabled_if(main_window.combo_wheel_harmony_guide, guide_enabled)
     main_window.wheel.set_harmony_guide_enabled(guide_enabled)
@@ -280,10 +314,13 @@ def apply_squint_settings(main_window, *_, save: bool = True):
 
 def update_vectorscope_warning_label(main_window):
     """ベクトルスコープ警告ラベルの文言と色を更新する。"""
-    from ...util.theme import refresh_widget_style
-
     ratio = float(main_window.vectorscope_view.high_saturation_ratio())
     threshold = int(main_window.spin_vectorscope_warn_threshold.value())
+    # 毎フレームの描画後と設定反映時に呼ばれるため、文言を決める2値が前回と同じなら何もしない。
+    key = (ratio, threshold)
+    if key == getattr(main_window, "_vectorscope_warning_key", None):
+        return
+    main_window._vectorscope_warning_key = key
     if ratio <= 0.001:
         text = "高彩度警告: なし"
         level = "muted"
@@ -293,6 +330,8 @@ def update_vectorscope_warning_label(main_window):
     if main_window.lbl_vectorscope_warning.text() != text:
         main_window.lbl_vectorscope_warning.setText(text)
     if main_window.lbl_vectorscope_warning.property("chromaWarnLevel") != level:
+        from ...util.theme import refresh_widget_style
+
         main_window.lbl_vectorscope_warning.setProperty("chromaWarnLevel", level)
         refresh_widget_style(main_window.lbl_vectorscope_warning)
 
@@ -307,11 +346,39 @@ def apply_vectorscope_settings(main_window, *_, save: bool = True):
     _request_save_if(main_window, save=save)
 
 
-def apply_mode_settings(main_window, *_args, save: bool = True):
+def apply_mode_settings(main_window, *, save: bool = True):
     """更新モード設定をワーカーとUIへ反映する。"""
-    mode = selected_mode(main_window)
-    main_window.worker.set_mode(mode)
-    main_window.worker.set_diff_threshold(selected_diff_threshold(main_window))
-    main_window.worker.set_stable_frames(selected_stable_frames(main_window))
-    sync_mode_dependent_rows(main_window)
+    # 位置引数を受けないため、Qt は combo/spin の値を渡さずにスロットを呼ぶ。
+    main_window.worker.configure(
+        mode=selected_mode(main_window),
+        diff_threshold=selected_diff_threshold(main_window),
+        stable_frames=selected_stable_frames(main_window),
+    )
+    # 間隔/差分/安定フレーム行とヒントの表示切替を、設定ダイアログの再描画1回で済ませる。
+    with updates_suspended(getattr(main_window, "_settings_window", None)):
+        sync_mode_dependent_rows(main_window)
     _request_save_if(main_window, save=save)
+
+
+def queue_settings_apply(main_window, handler_attr: str, *_args) -> None:
+    """操作由来の apply_* 呼び出しを次のイベントループまで畳み込んで予約する。"""
+    if main_window._settings_load_in_progress:
+        # 設定ロード中は保存抑止フラグが有効な間に即時反映し、従来の順序を保つ。
+        getattr(main_window, handler_attr)()
+        return
+    # dict を順序付き集合として使い、同じハンドラは1回だけ・最初の要求順で実行する。
+    main_window._pending_settings_applies[handler_attr] = None
+    # 再始動すると押しっぱなし中に反映が止まるため、待機中のタイマーはそのまま満了させる。
+    if not main_window._settings_apply_timer.isActive():
+        main_window._settings_apply_timer.start()
+
+
+def flush_settings_applies(main_window) -> None:
+    """予約済みの apply_* をハンドラごとに1回ずつ実行する。"""
+    pending = main_window._pending_settings_applies
+    if not pending:
+        return
+    handler_attrs = tuple(pending)
+    pending.clear()
+    for handler_attr in handler_attrs:
+        getattr(main_window, handler_attr)()
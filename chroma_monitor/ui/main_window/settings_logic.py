@@ -7,6 +7,7 @@ from .settings_apply import (
     apply_composition_guide_settings,
     apply_edge_settings,
     apply_focus_peaking_settings,
+    apply_interval_settings,
     apply_mirror_settings,
     apply_mode_settings,
     apply_rgb_hist_settings,
@@ -18,7 +19,12 @@ from .settings_apply import (
     apply_ternary_settings,
     apply_vectorscope_settings,
     apply_wheel_settings,
+    cached_wheel_sat_threshold,
+    flush_settings_applies,
+    invalidate_wheel_sat_threshold,
     on_wheel_harmony_rotation_changed,
+    queue_settings_apply,
+    sync_all_mode_rows,
     sync_analysis_resolution_rows,
     sync_color_band_controls,
     sync_mode_dependent_rows,
@@ -39,6 +45,7 @@ __all__ = [
     "apply_composition_guide_settings",
     "apply_edge_settings",
     "apply_focus_peaking_settings",
+    "apply_interval_settings",
     "apply_mirror_settings",
     "apply_mode_settings",
     "apply_rgb_hist_settings",
@@ -50,11 +57,16 @@ __all__ = [
     "apply_ternary_settings",
     "apply_vectorscope_settings",
     "apply_wheel_settings",
+    "cached_wheel_sat_threshold",
+    "flush_settings_applies",
+    "invalidate_wheel_sat_threshold",
     "load_settings",
     "on_wheel_harmony_rotation_changed",
+    "queue_settings_apply",
     "save_settings",
     "selected_effective_color_band_sat_threshold",
     "selected_wheel_sat_threshold",
+    "sync_all_mode_rows",
     "sync_analysis_resolution_rows",
     "sync_color_band_controls",
     "sync_mode_dependent_rows",
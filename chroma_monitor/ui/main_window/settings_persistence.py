@@ -10,6 +10,7 @@ from .settings_apply import (
     apply_composition_guide_settings,
     apply_edge_settings,
     apply_focus_peaking_settings,
+    apply_interval_settings,
     apply_mirror_settings,
     apply_mode_settings,
     apply_rgb_hist_settings,
@@ -23,7 +24,6 @@ from .settings_apply import (
     apply_wheel_settings,
 )
 from .settings_payload import collect_settings_payload
-from .settings_selected_values import selected_interval
 from .settings_value_common import cfg_float
 from .settings_value_specs import (
     ALWAYS_ON_TOP_SPEC,
@@ -128,7 +128,7 @@ def _load_theme_settings(main_window, cfg: dict) -> None:
 def _load_interval_and_analysis_settings(main_window, cfg: dict) -> None:
     """更新間隔・解析解像度関連設定を読み込む。"""
     load_settings_from_specs(main_window, cfg, _INTERVAL_ANALYSIS_LOAD_SPECS)
-    main_window.worker.set_interval(selected_interval(main_window))
+    apply_interval_settings(main_window, save=False)
     apply_sample_points_settings(main_window, save=False)
     apply_analysis_resolution_settings(main_window, save=False)
 
@@ -1,6 +1,7 @@
 """ウィンドウ配置とドッキング挙動の補助処理。"""
 
 import time
+from functools import partial
 
 from PySide6.QtCore import QRect, QSize, Qt, QTimer
 from PySide6.QtGui import QCursor, QGuiApplication
@@ -61,11 +62,22 @@ _FLOATING_MOVE_DRAG_GUARD_RETRY_MS = 120
 _DOCKABILITY_SYNC_DEBOUNCE_MS = 56
 
 
-def _dock_debug_name(main_window, dock: QDockWidget) -> str:
-    """デバッグログ向けドック識別子を返す。"""
+def _registered_dock_name(main_window, dock) -> str | None:
+    """ドックオブジェクトから登録名を引く。逆引き辞書が無い場合だけ線形走査する。"""
+    dock_name_map = getattr(main_window, "_dock_name_by_object", None)
+    if isinstance(dock_name_map, dict):
+        return dock_name_map.get(dock)
     for name, mapped in getattr(main_window, "_dock_map", {}).items():
         if mapped is dock:
-            return str(name)
+            return name
+    return None
+
+
+def _dock_debug_name(main_window, dock: QDockWidget) -> str:
+    """デバッグログ向けドック識別子を返す。"""
+    name = _registered_dock_name(main_window, dock)
+    if name is not None:
+        return str(name)
     try:
         obj_name = str(dock.objectName())
     except Exception:
@@ -847,6 +859,22 @@ def sync_all_floating_dock_dockability(main_window) -> None:
     sync_tabbed_dock_title_bars(main_window)
 
 
+def has_floating_dock(main_window) -> bool:
+    """フローティング中のドックが1つでもあれば True を返す。"""
+    return any(
+        dock is not None and dock.isFloating()
+        for dock in getattr(main_window, "_dock_map", {}).values()
+    )
+
+
+def schedule_floating_dock_dockability_sync_if_floating(main_window) -> None:
+    """フローティングドックがある時だけドッカビリティ同期を予約する。"""
+    # メインの移動/リサイズ中は大量に呼ばれるため、全ドックがドッキング済みなら何もしない。
+    # ドック側の移動/リサイズは各ドックのイベントから別途同期される。
+    if has_floating_dock(main_window):
+        schedule_floating_dock_dockability_sync(main_window)
+
+
 def _ensure_dockability_sync_timer(main_window) -> QTimer:
     """ドッカビリティ同期用デバウンスタイマーを取得する。"""
     timer = getattr(main_window, "_dockability_sync_timer", None)
@@ -889,6 +917,28 @@ def on_dock_top_level_changed(main_window, dock: QDockWidget, floating: bool):
     main_window._schedule_layout_autosave()
 
 
+def schedule_dock_top_level_changed(main_window, dock: QDockWidget, floating: bool) -> None:
+    """ドックのフローティング切替をドック単位で最新状態だけ保持し、まとめて反映する。"""
+    pending = getattr(main_window, "_pending_dock_top_level", None)
+    timer = getattr(main_window, "_dock_top_level_timer", None)
+    if pending is None or timer is None:
+        on_dock_top_level_changed(main_window, dock, floating)
+        return
+    pending[dock] = bool(floating)
+    timer.start()
+
+
+def flush_dock_top_level_changes(main_window) -> None:
+    """保留中のフローティング切替をドックごとに1回だけ反映する。"""
+    pending = getattr(main_window, "_pending_dock_top_level", None)
+    if not pending:
+        return
+    changes = list(pending.items())
+    pending.clear()
+    for dock, floating in changes:
+        on_dock_top_level_changed(main_window, dock, floating)
+
+
 def track_floating_dock_size(
     main_window,
     dock: QDockWidget,
@@ -935,12 +985,53 @@ def track_floating_dock_size(
     )
 
 
+def invalidate_desktop_available_geometry(main_window, *_args) -> None:
+    """画面構成/作業領域の変化時に、利用可能デスクトップ領域のキャッシュを破棄する。"""
+    main_window._desktop_available_geometry = None
+
+
+def _watch_screen_available_geometry(main_window, screen) -> None:
+    """スクリーンの作業領域変化でキャッシュを破棄するよう接続する。"""
+    screen.availableGeometryChanged.connect(
+        partial(invalidate_desktop_available_geometry, main_window)
+    )
+
+
+def _on_screen_added(main_window, screen) -> None:
+    """追加されたスクリーンも監視対象へ加え、キャッシュを破棄する。"""
+    _watch_screen_available_geometry(main_window, screen)
+    invalidate_desktop_available_geometry(main_window)
+
+
+def _watch_desktop_geometry_changes(main_window) -> None:
+    """利用可能デスクトップ領域が変わり得る通知を1回だけ接続する。"""
+    if getattr(main_window, "_desktop_geometry_watched", False):
+        return
+    app = QGuiApplication.instance()
+    if app is None:
+        return
+    main_window._desktop_geometry_watched = True
+    app.screenAdded.connect(partial(_on_screen_added, main_window))
+    app.screenRemoved.connect(partial(invalidate_desktop_available_geometry, main_window))
+    for screen in QGuiApplication.screens():
+        _watch_screen_available_geometry(main_window, screen)
+
+
 def desktop_available_geometry(main_window) -> QRect:
     """メインウィンドウ基準の利用可能デスクトップ領域を返す。"""
+    # LayoutRequest/WindowStateChange ごとの位置補正で全画面を走査し直さないよう、
+    # 画面構成か作業領域が変わるまでは前回の Union を使い回す。
+    cached = getattr(main_window, "_desktop_available_geometry", None)
+    if cached is not None:
+        return QRect(cached)
     # 複数画面をまたぐ配置を不意に片側へ寄せないため、全画面Unionを使う。
     rect = screen_union_geometry(available=True)
-    if rect.isValid() and rect.width() > 0 and rect.height() > 0:
+    if not (rect.isValid() and rect.width() > 0 and rect.height() > 0):
+        # 起動直後や画面構成の切替中に得た空の領域は保持せず、次回に取り直す。
         return rect
+    _watch_desktop_geometry_changes(main_window)
+    if getattr(main_window, "_desktop_geometry_watched", False):
+        main_window._desktop_available_geometry = QRect(rect)
     return rect
 
 
@@ -980,8 +1071,7 @@ def _compact_main_window_min_size(main_window) -> tuple[int, int]:
     """ドック0件時に必要となる最小クライアントサイズを返す。"""
     toolbar = main_window.findChild(QToolBar, "controlToolbar")
     toolbar_hint = toolbar.sizeHint() if toolbar is not None else QSize()
-    menubar = main_window.menuBar() if hasattr(main_window, "menuBar") else None
-    menubar_h = int(menubar.sizeHint().height()) if menubar is not None else 0
+    menubar_h = int(main_window.menuBar().sizeHint().height())
     min_w = max(
         _MAIN_WINDOW_COMPACT_MIN_W_FLOOR,
         int(toolbar_hint.width()) + 12,
@@ -1368,7 +1458,6 @@ def apply_ui_style(main_window):
     """アプリ全体スタイルとドック内スタイルを適用する。"""
     # アプリ全体とドック内ウィジェットでスタイルを分けて適用する。
     from ...util import theme as ui_theme
-    from .. import settings_dialog as settings_dialog_ui
 
     theme = ui_theme.get_ui_theme(getattr(main_window, "_ui_theme_name", None))
     main_window._ui_theme = theme
@@ -1379,7 +1468,11 @@ def apply_ui_style(main_window):
         app.setPalette(ui_theme.build_palette(theme))
         app.setStyleSheet(ui_theme.build_app_stylesheet(theme))
 
-    settings_dialog_ui.refresh_settings_nav_style(main_window)
+    if hasattr(main_window, "_settings_nav"):
+        # 設定ダイアログを開いた後だけ読み込み済みモジュールでナビを再同期する。
+        from .. import settings_dialog as settings_dialog_ui
+
+        settings_dialog_ui.refresh_settings_nav_style(main_window)
 
     themed_widgets = (
         getattr(main_window, "preview_window", None),
@@ -1428,18 +1521,32 @@ def sync_window_menu_checks(main_window, *_):
         act = main_window._dock_actions.get(name)
         if act is None:
             continue
+        visible = dock.isVisible()
+        if act.isChecked() == visible:
+            continue
         with blocked_signals(act):
-            act.setChecked(dock.isVisible())
+            act.setChecked(visible)
+
+
+def schedule_window_menu_checks_sync(main_window) -> None:
+    """ウィンドウメニューのチェック同期をイベントループ1周につき1回へまとめる。"""
+    # レイアウト復元ではドック数ぶん visibilityChanged が続くため、最後に1回だけ同期する。
+    main_window._window_menu_sync_timer.start()
+
+
+def schedule_placeholder_update(main_window) -> None:
+    """ドック表示通知による中央プレースホルダ更新をイベントループ1周につき1回へまとめる。"""
+    # 各通知で全ドックを走査すると、復元やタブ切替で O(ドック数^2) になるため最後に1回だけ判定する。
+    main_window._placeholder_update_timer.start()
 
 
 def _default_area_for_dock(main_window, dock: QDockWidget):
     """ドックの既定エリアを返す。"""
     area = Qt.RightDockWidgetArea
-    for name, mapped in getattr(main_window, "_dock_map", {}).items():
-        if mapped is dock:
-            area = getattr(main_window, "_dock_default_areas", {}).get(name, area)
-            break
-    return area
+    name = _registered_dock_name(main_window, dock)
+    if name is None:
+        return area
+    return getattr(main_window, "_dock_default_areas", {}).get(name, area)
 
 
 def _visible_docks_in_area(main_window, area):
@@ -1596,12 +1703,8 @@ def update_placeholder(main_window):
         for dock in main_window._dock_map.values()
     )
     _apply_main_window_minimum(main_window, any_visible)
-    main_window.central_container.setMaximumSize(16777215, 16777215)
-    main_window.central_container.setMinimumSize(0, 0)
-    if any_visible:
-        main_window.placeholder.hide()
-        main_window.central_container.hide()
-    else:
+    should_show_placeholder = False
+    if not any_visible:
         # ドックがないときは中央に案内文を表示する。
         # ウィンドウを最小まで縮めた場合は中央領域が潰れて見えなくなってもよい。
         central_size = main_window.central_container.size()
@@ -1609,6 +1712,17 @@ def update_placeholder(main_window):
             int(central_size.width()) >= _PLACEHOLDER_SHOW_MIN_W
             and int(central_size.height()) >= _PLACEHOLDER_SHOW_MIN_H
         )
+    # resizeEvent や連続した toggle_dock から何度も呼ばれるため、表示結果が同じなら何もしない。
+    state = (any_visible, should_show_placeholder)
+    if state == getattr(main_window, "_placeholder_state", None):
+        return
+    main_window._placeholder_state = state
+    main_window.central_container.setMaximumSize(16777215, 16777215)
+    main_window.central_container.setMinimumSize(0, 0)
+    if any_visible:
+        main_window.placeholder.hide()
+        main_window.central_container.hide()
+    else:
         if should_show_placeholder:
             main_window.placeholder.show()
         else:
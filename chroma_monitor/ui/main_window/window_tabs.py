@@ -124,16 +124,13 @@ def _sync_dock_tab_close_button(main_window, bar: QTabBar, titles: set[str] | No
 
     btn = QToolButton(bar)
     btn._chroma_dock_tab_close_button = True
+    # 見た目はアプリ共通 stylesheet の objectName セレクタで当て、ボタン単位の再計算を避ける。
+    btn.setObjectName("dockTabCloseButton")
     btn.setText("x")
     btn.setToolTip("このタブを閉じる")
     btn.setAutoRaise(True)
     btn.setCursor(Qt.PointingHandCursor)
     btn.setFixedSize(16, 16)
-    btn.setStyleSheet(
-        "QToolButton { border:none; color:#6b7280; padding:0; font-size:13px; font-weight:700; }"
-        "QToolButton:hover { color:#dc2626; }"
-        "QToolButton:pressed { color:#b91c1c; }"
-    )
     btn.clicked.connect(lambda _=False, mw=main_window, b=bar: _close_current_dock_tab(mw, b))
     bar.setTabButton(current, QTabBar.RightSide, btn)
 
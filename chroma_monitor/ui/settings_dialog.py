@@ -150,9 +150,7 @@ def show_settings_window(main_window, page_index: int | None = None):
     _select_requested_settings_page(main_window, page_index)
 
     main_window._sync_capture_source_ui()
-    main_window._sync_analysis_resolution_rows()
-    main_window._sync_mode_dependent_rows()
-    main_window._sync_squint_mode_rows()
+    main_window._sync_all_mode_rows()
     if hasattr(main_window, "_sync_color_band_controls"):
         main_window._sync_color_band_controls()
     if created:
@@ -1,5 +1,7 @@
 """ビュー用ドックの構築処理。"""
 
+from functools import partial
+
 from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
@@ -29,6 +31,7 @@ from ..views.saliency_view import SaliencyView
 from ..views.squint_view import SquintView
 from ..views.tonal_views import BinaryView, GrayscaleView, TernaryView
 from ..views.vectorscope_view import VectorScopeView
+from .main_window.result_color_band import TopColorBarWidget
 
 _H_COLOR = QColor(220, 90, 90)
 _S_COLOR = QColor(90, 170, 90)
@@ -119,8 +122,8 @@ def _configure_view_dock(main_window, dock: QDockWidget) -> None:
     dock.setAllowedAreas(Qt.AllDockWidgetAreas)
     dock.setMinimumSize(C.VIEW_MIN_WIDTH, C.VIEW_MIN_HEIGHT)
 
-    dock.visibilityChanged.connect(main_window.update_placeholder)
-    dock.visibilityChanged.connect(main_window.sync_window_menu_checks)
+    dock.visibilityChanged.connect(main_window._schedule_placeholder_update)
+    dock.visibilityChanged.connect(main_window._schedule_window_menu_checks_sync)
     dock.visibilityChanged.connect(main_window._sync_tabbed_dock_title_bars)
 
     def _on_visibility_changed(visible: bool, *, mw=main_window, d=dock) -> None:
@@ -140,7 +143,8 @@ def _configure_view_dock(main_window, dock: QDockWidget) -> None:
 
     for signal in (dock.topLevelChanged, dock.dockLocationChanged):
         # 配置が変わったときだけ自動保存を予約する。
-        signal.connect(lambda *_args, mw=main_window: mw._schedule_layout_autosave())
+        # 引数を受けないメソッドなので、Qt はシグナル値を渡さずに呼び出す。
+        signal.connect(main_window._schedule_layout_autosave)
         signal.connect(main_window._sync_tabbed_dock_title_bars)
 
 
@@ -153,11 +157,16 @@ def _register_docks(
     main_window._dock_map = {}
     main_window._dock_default_areas = {}
     main_window._dock_name_by_object = {}
+    main_window._toggle_actions = {}
     for name, dock, default_area in dock_specs:
         setattr(main_window, name, dock)
         main_window._dock_map[name] = dock
         main_window._dock_default_areas[name] = default_area
         main_window._dock_name_by_object[dock] = name
+        # メニュー操作はドック名から直接この呼び出しへ進み、ドック参照の引き直しを省く。
+        main_window._toggle_actions[name] = partial(main_window.toggle_dock, dock)
+    # 登録後は増減しないため、頻繁な走査用に並び順を固定したタプルも保持する。
+    main_window._dock_list = tuple(main_window._dock_map.values())
 
 
 def _build_dock_actions(main_window) -> dict[str, object]:
@@ -225,13 +234,12 @@ def setup_view_docks(main_window) -> None:
     main_window._color_detail_has_selection = False
     main_window._color_detail_merge_complement = False
     main_window._color_detail_show_info = True
-    main_window.top_colors_bar = QLabel()
+    main_window.top_colors_bar = TopColorBarWidget()
     # バーは常に見えるよう、固定高さ + 横方向のみ伸縮にする。
     main_window.top_colors_bar.setMinimumHeight(C.TOP_COLOR_BAR_HEIGHT)
     main_window.top_colors_bar.setMaximumHeight(C.TOP_COLOR_BAR_HEIGHT)
     main_window.top_colors_bar.setMinimumWidth(0)
     main_window.top_colors_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-    main_window.top_colors_bar.setScaledContents(False)
 
     main_window.lbl_warmcool = QLabel("暖色: -   寒色: -   その他: -")
     main_window.lbl_warmcool.setProperty("chromaRole", "detailText")
@@ -526,7 +534,7 @@ def setup_view_docks(main_window) -> None:
     ]
     main_window._image_update_targets = image_update_targets
 
-    for d in main_window._dock_map.values():
+    for d in main_window._dock_list:
         _configure_view_dock(main_window, d)
 
     # 初期配置: 左にカラー、右側にビュー群、下にヒストグラム。
@@ -54,6 +54,8 @@ DEFAULT_CONFIG = {
 }
 #: 設定ファイルパスの探索結果キャッシュ。
 _CONFIG_PATH_CACHE: Path | None = None
+#: 直近に読み書きした設定ファイル本文と、その時点の (パス, mtime_ns, サイズ)。
+_CONFIG_TEXT_CACHE: tuple[tuple[str, int, int], str] | None = None
 
 
 def _legacy_user_config_dir() -> Path:
@@ -133,15 +135,37 @@ def config_path() -> Path:
     return _CONFIG_PATH_CACHE
 
 
+def _config_file_key(path: Path) -> tuple[str, int, int] | None:
+    """設定ファイルの変更検知キーを返す。存在しなければ None を返す。"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (str(path), int(stat.st_mtime_ns), int(stat.st_size))
+
+
+def _read_config_text(path: Path, key: tuple[str, int, int]) -> str:
+    """ファイルが前回から変わっていなければ、読み直さずに保持済み本文を返す。"""
+    global _CONFIG_TEXT_CACHE
+    cached = _CONFIG_TEXT_CACHE
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    text = path.read_text(encoding="utf-8")
+    _CONFIG_TEXT_CACHE = (key, text)
+    return text
+
+
 def load_config() -> dict[str, Any]:
     """設定ファイルを読み込み、既定値を補完して返す。"""
     path = config_path()
     # layout_current/layout_presets などの可変値参照を共有しない。
     defaults = copy.deepcopy(DEFAULT_CONFIG)
-    if not path.exists():
+    key = _config_file_key(path)
+    if key is None:
         return defaults
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # 本文は保持しても、毎回 JSON から組み直して呼び出し側ごとに独立した dict を返す。
+        data = json.loads(_read_config_text(path, key))
         if not isinstance(data, dict):
             return defaults
         cfg = defaults
@@ -159,13 +183,24 @@ def load_config() -> dict[str, Any]:
 
 def save_config(cfg: dict[str, Any]) -> None:
     """設定辞書をJSONとして保存する。"""
+    global _CONFIG_TEXT_CACHE
     path = config_path()
     temp_path = path.with_name(f"{path.name}.tmp")
     try:
-        path.parent.mkdir(parents=True, exist_ok=True)
         payload = json.dumps(cfg, ensure_ascii=False, indent=2)
-        temp_path.write_text(payload, encoding="utf-8")
+        current_key = _config_file_key(path)
+        cached = _CONFIG_TEXT_CACHE
+        if cached is not None and cached[1] == payload and cached[0] == current_key:
+            # 同じ内容がそのまま残っているなら書き込みを省く。
+            return
+        if current_key is None:
+            # 既存ファイルがあれば保存先ディレクトリも存在するので mkdir を省く。
+            path.parent.mkdir(parents=True, exist_ok=True)
+        # 本文は1回だけエンコードし、一時ファイルへ1回で書いてから置き換える。
+        temp_path.write_bytes(payload.encode("utf-8"))
         temp_path.replace(path)
+        key = _config_file_key(path)
+        _CONFIG_TEXT_CACHE = None if key is None else (key, payload)
     except Exception:
         try:
             if temp_path.exists():
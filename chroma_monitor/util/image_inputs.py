@@ -1,6 +1,8 @@
 """画像入力の共通 helper。"""
 
+import threading
 from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 import cv2
@@ -12,6 +14,9 @@ from . import constants as C
 
 _SUPPORTED_IMAGE_SUFFIXES = tuple(str(suffix).lower() for suffix in C.IMAGE_INPUT_SUFFIXES)
 _QIMAGE_FORMAT_RGBA8888 = getattr(QImage, "Format_RGBA8888", None)
+_JPEG_SIGNATURE = b"\xff\xd8\xff"
+# TurboJPEG のハンドルはスレッド間で共有できないため decode を直列化する。
+_TURBO_JPEG_LOCK = threading.Lock()
 
 
 def _strip_wrapping_quotes(text: str) -> str:
@@ -80,8 +85,44 @@ def supported_image_paths_from_text(text: str) -> list[str]:
     return _unique_existing_paths(candidates)
 
 
+@lru_cache(maxsize=1)
+def _turbo_jpeg_decoder():
+    """PyTurboJPEG が使える環境ならデコーダを1度だけ生成して返す。"""
+    try:
+        from turbojpeg import TJPF_BGR, TurboJPEG  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return TurboJPEG(), TJPF_BGR
+    except (OSError, RuntimeError):
+        # ライブラリ本体(libturbojpeg)が見つからない環境では OpenCV へ戻す。
+        return None
+
+
+def _decode_jpeg_with_turbo(buf: np.ndarray) -> np.ndarray | None:
+    """8bit JPEG を libjpeg-turbo で BGR へ直接デコードする。"""
+    if buf.size < len(_JPEG_SIGNATURE) or bytes(buf[:3]) != _JPEG_SIGNATURE:
+        return None
+    decoder = _turbo_jpeg_decoder()
+    if decoder is None:
+        return None
+    turbo, pixel_format = decoder
+    try:
+        with _TURBO_JPEG_LOCK:
+            img = turbo.decode(buf.tobytes(), pixel_format=pixel_format)
+    except (OSError, RuntimeError, ValueError):
+        # CMYK など TurboJPEG 側で扱えない JPEG は cv2.imdecode に任せる。
+        return None
+    if img is None or img.ndim != 3 or img.size == 0:
+        return None
+    return img
+
+
 def decode_image_buffer_to_bgr(buf: np.ndarray) -> np.ndarray | None:
     """エンコード済み画像バッファを BGR 3ch へ正規化する。"""
+    img = _decode_jpeg_with_turbo(buf)
+    if img is not None:
+        return img
     img = cv2.imdecode(buf, cv2.IMREAD_UNCHANGED)
     if img is None or img.size == 0:
         return None
@@ -1,6 +1,7 @@
 """画像処理系の共通関数。"""
 
 import math
+import threading
 import weakref
 from collections import OrderedDict
 
@@ -10,13 +11,27 @@ import numpy as np
 _MAX_RENDER_EDGE = 2048
 _MAX_RENDER_AREA = _MAX_RENDER_EDGE * _MAX_RENDER_EDGE
 _RESIZE_CACHE_MAX_ENTRIES = 12
-_resize_cache: "OrderedDict[tuple, tuple[weakref.ReferenceType[np.ndarray], np.ndarray]]" = (
+_CacheEntry = tuple["weakref.ReferenceType[np.ndarray]", np.ndarray, int]
+_resize_cache: "OrderedDict[tuple, _CacheEntry]" = (
     OrderedDict()
 )
 _CVT_COLOR_CACHE_MAX_ENTRIES = 16
-_cvt_color_cache: "OrderedDict[tuple, tuple[weakref.ReferenceType[np.ndarray], np.ndarray]]" = (
+# 解析スレッドと UI スレッドの両方から使うため、キャッシュ辞書の操作だけをこのロックで守る。
+_cache_lock = threading.Lock()
+_cvt_color_cache: "OrderedDict[tuple, _CacheEntry]" = (
     OrderedDict()
 )
+# 登録順の通し番号。UI が解析スレッドを先に再開させても、再開後に積まれた次フレーム分を消さずに済む。
+_cache_seq = 0
+# フレームごとに作り直すと大きな確保/解放が続く作業配列を、スレッド単位で使い回す。
+_scratch_local = threading.local()
+
+
+def _next_cache_seq() -> int:
+    """キャッシュ登録用の通し番号を進めて返す。`_cache_lock` 保持中に呼ぶ。"""
+    global _cache_seq
+    _cache_seq += 1
+    return _cache_seq
 
 
 def _array_identity_key(src: np.ndarray) -> tuple:
@@ -51,13 +66,14 @@ def resize_by_long_edge(
         int(max_dim),
         int(interpolation),
     )
-    cached = _resize_cache.get(key)
-    if cached is not None:
-        src_ref, out = cached
-        if src_ref() is src:
-            _resize_cache.move_to_end(key, last=True)
-            return out
-        _resize_cache.pop(key, None)
+    with _cache_lock:
+        cached = _resize_cache.get(key)
+        if cached is not None:
+            src_ref, out, _seq = cached
+            if src_ref() is src:
+                _resize_cache.move_to_end(key, last=True)
+                return out
+            _resize_cache.pop(key, None)
 
     out = cv2.resize(src, (new_w, new_h), interpolation=interpolation)
     try:
@@ -65,10 +81,11 @@ def resize_by_long_edge(
     except TypeError:
         return out
 
-    _resize_cache[key] = (src_ref, out)
-    _resize_cache.move_to_end(key, last=True)
-    if len(_resize_cache) > _RESIZE_CACHE_MAX_ENTRIES:
-        _resize_cache.popitem(last=False)
+    with _cache_lock:
+        _resize_cache[key] = (src_ref, out, _next_cache_seq())
+        _resize_cache.move_to_end(key, last=True)
+        if len(_resize_cache) > _RESIZE_CACHE_MAX_ENTRIES:
+            _resize_cache.popitem(last=False)
     return out
 
 
@@ -81,13 +98,14 @@ def cvt_color_cached(img: np.ndarray, code: int) -> np.ndarray:
         _array_identity_key(src),
         int(code),
     )
-    cached = _cvt_color_cache.get(key)
-    if cached is not None:
-        src_ref, out = cached
-        if src_ref() is src:
-            _cvt_color_cache.move_to_end(key, last=True)
-            return out
-        _cvt_color_cache.pop(key, None)
+    with _cache_lock:
+        cached = _cvt_color_cache.get(key)
+        if cached is not None:
+            src_ref, out, _seq = cached
+            if src_ref() is src:
+                _cvt_color_cache.move_to_end(key, last=True)
+                return out
+            _cvt_color_cache.pop(key, None)
 
     out = cv2.cvtColor(src, int(code))
     try:
@@ -95,21 +113,76 @@ def cvt_color_cached(img: np.ndarray, code: int) -> np.ndarray:
     except TypeError:
         return out
 
-    _cvt_color_cache[key] = (src_ref, out)
-    _cvt_color_cache.move_to_end(key, last=True)
-    if len(_cvt_color_cache) > _CVT_COLOR_CACHE_MAX_ENTRIES:
-        _cvt_color_cache.popitem(last=False)
+    with _cache_lock:
+        _cvt_color_cache[key] = (src_ref, out, _next_cache_seq())
+        _cvt_color_cache.move_to_end(key, last=True)
+        if len(_cvt_color_cache) > _CVT_COLOR_CACHE_MAX_ENTRIES:
+            _cvt_color_cache.popitem(last=False)
     return out
 
 
-def clear_cvt_color_cache() -> None:
-    """`cvt_color_cached` の同一フレーム内キャッシュを破棄する。"""
-    _cvt_color_cache.clear()
-
-
-def clear_resize_cache() -> None:
-    """`resize_by_long_edge` の同一フレーム内キャッシュを破棄する。"""
-    _resize_cache.clear()
+def thread_scratch_buffer(name: str, shape: tuple[int, ...], dtype) -> np.ndarray:
+    """現在スレッド専用の作業配列を返す。名前/形状/型が同じ間は同じ配列を再利用する。
+
+    返す配列は次回呼び出しで上書きされるため、呼び出し元の処理外へ渡してはならない。
+    """
+    buffers = getattr(_scratch_local, "buffers", None)
+    if buffers is None:
+        buffers = {}
+        _scratch_local.buffers = buffers
+    shape_key = tuple(int(dim) for dim in shape)
+    dtype_key = np.dtype(dtype)
+    buf = buffers.get(name)
+    if buf is None or buf.shape != shape_key or buf.dtype != dtype_key:
+        buf = np.empty(shape_key, dtype=dtype_key)
+        buffers[name] = buf
+    return buf
+
+
+def image_cache_mark() -> int:
+    """現時点までに登録されたキャッシュ項目を表す目印を返す。"""
+    with _cache_lock:
+        return _cache_seq
+
+
+def _clear_cache_entries(cache: OrderedDict, upto: int | None) -> None:
+    """キャッシュ全体、または目印以前に登録された項目だけを破棄する。"""
+    with _cache_lock:
+        if upto is None:
+            cache.clear()
+            return
+        for key in [key for key, entry in cache.items() if entry[2] <= upto]:
+            del cache[key]
+
+
+def clear_cvt_color_cache(upto: int | None = None) -> None:
+    """`cvt_color_cached` の同一フレーム内キャッシュを破棄する。`upto` 指定時はその目印以前の分だけ。"""
+    _clear_cache_entries(_cvt_color_cache, upto)
+
+
+def clear_resize_cache(upto: int | None = None) -> None:
+    """`resize_by_long_edge` の同一フレーム内キャッシュを破棄する。`upto` 指定時はその目印以前の分だけ。"""
+    _clear_cache_entries(_resize_cache, upto)
+
+
+def interleaved_channel_source(
+    c0: np.ndarray,
+    c1: np.ndarray,
+    c2: np.ndarray,
+) -> np.ndarray | None:
+    """3枚の平面が同一 uint8 3ch 配列のチャネルビュー(0,1,2順)なら、その親配列を返す。"""
+    parent = c0.base
+    if not isinstance(parent, np.ndarray) or c1.base is not parent or c2.base is not parent:
+        return None
+    if parent.ndim != 3 or parent.shape[2] != 3 or parent.dtype != np.uint8:
+        return None
+    if parent.shape[:2] != c0.shape or c0.strides != parent.strides[:2]:
+        return None
+    base_ptr = int(parent.__array_interface__["data"][0])
+    offsets = tuple(int(ch.__array_interface__["data"][0]) - base_ptr for ch in (c0, c1, c2))
+    if offsets != (0, 1, 2):
+        return None
+    return parent
 
 
 def clamp_render_size(width: int, height: int) -> tuple[int, int]:
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any
 
 from PySide6.QtCore import QByteArray
@@ -17,6 +18,8 @@ _KEY_GEOMETRY_RECT = "geometry_rect"
 _KEY_DISPLAY_TOPOLOGY = "display_topology"
 #: 保存時のキー名: フローティングドック矩形群。
 _KEY_FLOATING_DOCK_GEOMETRY = "floating_dock_geometry"
+#: デコード済みレイアウト blob の保持数（現在配置 + プリセット数件分）。
+_DECODED_BLOB_CACHE_SIZE = 32
 
 
 def _encode_qbytearray(data: QByteArray) -> str:
@@ -24,11 +27,19 @@ def _encode_qbytearray(data: QByteArray) -> str:
     return bytes(data.toBase64()).decode("ascii")
 
 
+@lru_cache(maxsize=_DECODED_BLOB_CACHE_SIZE)
+def _decoded_blob(text: str) -> QByteArray:
+    """Base64文字列ごとに1度だけデコードした `QByteArray` を返す。"""
+    return QByteArray.fromBase64(text.encode("ascii"))
+
+
 def _decode_qbytearray(text: str) -> QByteArray:
     """Base64文字列を `QByteArray` へ復元する。"""
     if not text:
         return QByteArray()
-    return QByteArray.fromBase64(text.encode("ascii"))
+    # プリセット切替や geometry 再適用で同じ blob を繰り返し使うため、デコード結果を共有する。
+    # QByteArray は暗黙共有なので、呼び出し側ごとのコピーは参照カウントの増加だけで済む。
+    return QByteArray(_decoded_blob(text))
 
 
 def _restore_encoded_blob(window, encoded: Any, restore_fn) -> bool:
@@ -19,6 +19,20 @@ def blocked_signals(obj: QObject) -> Iterator[None]:
         del _blocker
 
 
+@contextmanager
+def updates_suspended(widget: QObject | None) -> Iterator[None]:
+    """`widget` の再描画を一時停止し、抜けるときにまとめて再開する。"""
+    # 既に停止中（入れ子呼び出し）なら外側の再開に任せる。
+    if widget is None or not widget.updatesEnabled():
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+
 def screen_union_geometry(available: bool = False) -> QRect:
     """全スクリーンを覆う矩形を返す。"""
     screens = QGuiApplication.screens()
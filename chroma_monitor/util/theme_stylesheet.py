@@ -472,6 +472,19 @@ def _build_container_styles(theme: UiTheme) -> str:
             background:{theme.tab_selected_bg};
             color:{theme.text_primary};
         }}
+        QToolButton#dockTabCloseButton {{
+            border:none;
+            color:#6b7280;
+            padding:0;
+            font-size:13px;
+            font-weight:700;
+        }}
+        QToolButton#dockTabCloseButton:hover {{
+            color:#dc2626;
+        }}
+        QToolButton#dockTabCloseButton:pressed {{
+            color:#b91c1c;
+        }}
         QSplitter::handle {{
             background:{theme.border};
         }}
@@ -40,6 +40,18 @@ from .color_scatter_math import (
 )
 
 _SCATTER_RESIZE_TRANSFORM_MODE = Qt.FastTransformation
+_EMPTY_SCATTER_BASE_PM: Optional[QPixmap] = None
+
+
+def _empty_scatter_base_pixmap() -> QPixmap:
+    """データ未入力時に使う空の散布図ベース画像を返す。"""
+    # 中身は常に透明な 256x256 なので、全インスタンスで1枚を共有する。
+    global _EMPTY_SCATTER_BASE_PM
+    if _EMPTY_SCATTER_BASE_PM is None:
+        pm = QPixmap(256, 256)
+        pm.fill(Qt.transparent)
+        _EMPTY_SCATTER_BASE_PM = pm
+    return _EMPTY_SCATTER_BASE_PM
 
 
 class ColorWheelWidget(QWidget):
@@ -540,8 +552,11 @@ class ScatterRasterWidget(QLabel):
     def _show_scatter_frame_only(self):
         """データ未入力時の空フレーム表示へ切り替える。"""
         # 入力データが無いときは枠だけ描画して待機状態を示す。
-        img = np.zeros((256, 256, 4), dtype=np.uint8)
-        if not self._cache_scatter_base_pixmap(img) or not self._present_scatter_from_base():
+        self._scatter_base_pm = _empty_scatter_base_pixmap()
+        if not self.isVisible():
+            # 起動時の既定値/設定反映やタブ裏のドックでは描かず、showEvent 後のレイアウト同期に任せる。
+            return
+        if not self._present_scatter_from_base():
             self.setText("散布図（S-V）")
 
     def _rerender_after_resize_idle(self):
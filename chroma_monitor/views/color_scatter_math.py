@@ -8,6 +8,10 @@ import numpy as np
 
 from ..util import constants as C
 
+# 最頻色ラスタのソートキー構成: 上位にセル番号(16bit)、下位に RGB(24bit)。
+_DOMINANT_COLOR_BITS = 24
+_DOMINANT_PAIR_BITS = 16 + _DOMINANT_COLOR_BITS
+
 
 @dataclass(frozen=True, slots=True)
 class ScatterRenderConfig:
@@ -243,36 +247,46 @@ def render_scatter_dominant(
         | (rgb_u8[:, 1].astype(np.uint32) << 8)
         | rgb_u8[:, 2].astype(np.uint32)
     )
-    color_key = np.tile(color_key_base, 4)
-    pair_key = (flat_idx.astype(np.uint64) << 24) | color_key.astype(np.uint64)
+    pair_key = flat_idx.astype(np.uint64) << _DOMINANT_COLOR_BITS
     if pair_key.size == 0:
         return out.reshape((256, 256, 4))
-
-    order = np.argsort(pair_key, kind="mergesort")
-    pair_sorted = pair_key[order]
+    # 4近傍ぶん tile せず、(4, n) の行ごとに色キーをブロードキャストで書き込む。
+    pair_key.reshape(4, -1)[...] |= color_key_base
+
+    # (セル, 色) キーの下位へ元位置を詰めて一意化し、安定 argsort ではなく値の sort 1回で
+    # 「同一キーの並び」と「各キーの最後の出現位置」をまとめて得る。
+    pos_bits = max(1, int(pair_key.size - 1).bit_length())
+    if pos_bits <= 64 - _DOMINANT_PAIR_BITS:
+        keyed = pair_key << np.uint64(pos_bits)
+        keyed |= np.arange(pair_key.size, dtype=np.uint64)
+        keyed.sort()
+        pair_sorted = keyed >> np.uint64(pos_bits)
+        pos_sorted = keyed & np.uint64((1 << pos_bits) - 1)
+    else:
+        pos_sorted = np.argsort(pair_key, kind="mergesort")
+        pair_sorted = pair_key[pos_sorted]
     run_start = np.concatenate(
         ([0], np.flatnonzero(np.diff(pair_sorted) != 0).astype(np.int64) + 1)
     )
     run_end = np.concatenate((run_start[1:], [pair_sorted.size]))
     pair_unique = pair_sorted[run_start]
-    run_counts = (run_end - run_start).astype(np.int32, copy=False)
-    run_last_pos = order[run_end - 1]
+    run_counts = (run_end - run_start).astype(np.uint64, copy=False)
+    run_last_pos = pos_sorted[run_end - 1].astype(np.uint64, copy=False)
 
-    pixel_idx = (pair_unique >> 24).astype(np.int32, copy=False)
-    color_unique = (pair_unique & 0xFFFFFF).astype(np.uint32, copy=False)
+    pixel_idx = (pair_unique >> np.uint64(_DOMINANT_COLOR_BITS)).astype(np.int32, copy=False)
+    color_unique = (pair_unique & np.uint64(0xFFFFFF)).astype(np.uint32, copy=False)
     if pixel_idx.size <= 0:
         return out.reshape((256, 256, 4))
 
-    candidate_order = np.lexsort((run_last_pos, run_counts, pixel_idx))
-    if candidate_order.size <= 0:
-        return out.reshape((256, 256, 4))
-
-    pixel_sorted = pixel_idx[candidate_order]
+    # run はセル順に並んでいるため、(件数, 最後の出現位置) を1つの整数へ詰めた得点の
+    # セル内最大を reduceat で取り、lexsort による全 run の並べ替えを省く。
+    score = (run_counts << np.uint64(pos_bits)) | run_last_pos
     group_start = np.concatenate(
-        ([0], np.flatnonzero(np.diff(pixel_sorted) != 0).astype(np.int64) + 1)
+        ([0], np.flatnonzero(np.diff(pixel_idx) != 0).astype(np.int64) + 1)
     )
-    group_end = np.concatenate((group_start[1:], [candidate_order.size]))
-    best_rows = candidate_order[group_end - 1]
+    group_sizes = np.diff(np.append(group_start, score.size))
+    group_best = np.maximum.reduceat(score, group_start)
+    best_rows = np.flatnonzero(score == np.repeat(group_best, group_sizes))
 
     best_pixels = pixel_idx[best_rows]
     best_colors = color_unique[best_rows]
@@ -70,6 +70,10 @@ class ChannelHistogram(QWidget):
         self._bucket = max(1, bucket)
         self._hist = np.zeros(bins, dtype=np.int64)
         self._idx = np.arange(bins, dtype=np.float64)
+        self._idx_sq = self._idx * self._idx
+        # バケット集約結果はヒストグラム更新時に1回だけ作り、max 取得と描画で共有する。
+        self._bucketed = _bucket_sum(self._hist, self._bucket)
+        self._bucketed_max = 0
         self._mean = 0.0
         self._std = 0.0
         self._total = 0
@@ -83,13 +87,11 @@ class ChannelHistogram(QWidget):
 
     def _bucketed_hist(self) -> np.ndarray:
         """描画用にバケット集約したヒストグラムを返す。"""
-        return _bucket_sum(self._hist, self._bucket)
+        return self._bucketed
 
     def bucketed_max(self) -> int:
         """バケット化後ヒストグラムの最大値を返す。"""
-        if self._hist.size <= 0:
-            return 0
-        return int(self._bucketed_hist().max())
+        return self._bucketed_max
 
     def set_shared_max_y(self, max_y: int | None):
         """共有Y上限を設定する。`None` で個別スケールへ戻す。"""
@@ -108,8 +110,9 @@ class ChannelHistogram(QWidget):
             self._std = 0.0
             return
         self._total = total
-        mean = float((self._idx * self._hist).sum() / total)
-        var = float((((self._idx - mean) ** 2) * self._hist).sum() / total)
+        # 一時配列を作らないよう、1次/2次モーメントを内積で求めて分散を得る。
+        mean = float(np.dot(self._idx, self._hist) / total)
+        var = float(np.dot(self._idx_sq, self._hist) / total) - mean * mean
         self._mean = mean
         self._std = math.sqrt(max(0.0, var))
 
@@ -131,6 +134,8 @@ class ChannelHistogram(QWidget):
         if self._hist.shape == arr.shape and np.array_equal(self._hist, arr):
             return
         self._hist = arr
+        self._bucketed = _bucket_sum(arr, self._bucket)
+        self._bucketed_max = int(self._bucketed.max()) if self._bucketed.size > 0 else 0
         self._update_stats()
         self.update()
 
@@ -9,6 +9,22 @@ from PySide6.QtWidgets import QLabel, QSizePolicy, QVBoxLayout, QWidget
 from ..util.theme import UiTheme, get_ui_theme
 from ..util.qt_image import bgr_to_qpixmap
 
+#: 内容比較の前段で見る画素の間引き幅。動く映像はこの粗い比較だけで差分が見つかる。
+_CONTENT_PROBE_STEP = 8
+
+
+def _same_frame_content(prev: np.ndarray, bgr: np.ndarray) -> bool:
+    """2枚のフレームが同じ画素内容かを返す。"""
+    if prev is bgr:
+        return True
+    if prev.shape != bgr.shape or prev.dtype != bgr.dtype:
+        return False
+    step = _CONTENT_PROBE_STEP
+    if not np.array_equal(prev[::step, ::step], bgr[::step, ::step]):
+        return False
+    # 全画素比較は静止画面のときだけ払う。縮小+QPixmap 変換よりは十分安い。
+    return np.array_equal(prev, bgr)
+
 
 class _PreviewImageLabel(QLabel):
     """領域プレビュー画像用ラベル。"""
@@ -34,7 +50,7 @@ class PreviewWindow(QWidget):
         self.resize(640, 420)
         self.setProperty("chromaRole", "previewWindow")
         self._last_bgr: Optional[np.ndarray] = None
-        self._last_render_key: Optional[tuple[int, int, int]] = None
+        self._last_render_size: Optional[tuple[int, int]] = None
         self._theme = get_ui_theme()
 
         self.lbl = _PreviewImageLabel("領域プレビュー")
@@ -55,20 +71,26 @@ class PreviewWindow(QWidget):
 
     def update_preview(self, bgr: np.ndarray):
         """現在のROI画像をラベルサイズに合わせて表示更新する。"""
+        prev = self._last_bgr
         self._last_bgr = bgr
         max_w = max(1, int(self.lbl.width() - 10))
         max_h = max(1, int(self.lbl.height() - 10))
-        render_key = (id(bgr), max_w, max_h)
-        if render_key == self._last_render_key:
+        render_size = (max_w, max_h)
+        # 静止した画面では毎フレーム別配列でも中身が同じなので、表示中の pixmap をそのまま使う。
+        if (
+            render_size == self._last_render_size
+            and prev is not None
+            and _same_frame_content(prev, bgr)
+        ):
             return
-        self._last_render_key = render_key
+        self._last_render_size = render_size
         pm = bgr_to_qpixmap(bgr, max_w=max_w, max_h=max_h)
         self.lbl.setPixmap(pm)
 
     def show_placeholder(self, text: str):
         """プレビュー画像をクリアし、案内テキストを表示する。"""
         self._last_bgr = None
-        self._last_render_key = None
+        self._last_render_size = None
         self.lbl.clear()
         self.lbl.setText(str(text or "領域プレビュー"))
 
@@ -82,7 +104,7 @@ class PreviewWindow(QWidget):
         super().resizeEvent(event)
         if event.size() == event.oldSize():
             return
-        self._last_render_key = None
+        self._last_render_size = None
         if self._last_bgr is not None:
             self.update_preview(self._last_bgr)
 
@@ -9,6 +9,9 @@ from PySide6.QtWidgets import QWidget
 from ..util.qt_helpers import screen_union_geometry
 
 _MIN_SELECTION_SIZE = 10
+# 選択枠(2px ペン + アンチエイリアス)と寸法ラベルの描画余白。
+_SELECTION_PAINT_MARGIN = 3
+_SELECTION_LABEL_OFFSET = 6
 
 
 class RoiSelector(QWidget):
@@ -57,6 +60,19 @@ class RoiSelector(QWidget):
         y = min(max(p.y(), r.top()), r.bottom())
         return QPoint(x, y)
 
+    def _selection_paint_rect(self) -> QRect:
+        """現在の選択枠と寸法ラベルを覆う再描画範囲を返す。"""
+        r = QRect(self._start_local, self._end_local).normalized()
+        fm = self.fontMetrics()
+        label = QRect(
+            r.left() + _SELECTION_LABEL_OFFSET,
+            r.top() - _SELECTION_LABEL_OFFSET - fm.ascent(),
+            fm.horizontalAdvance(f"{r.width()} x {r.height()}"),
+            fm.height(),
+        )
+        m = _SELECTION_PAINT_MARGIN
+        return r.united(label).adjusted(-m, -m, m, m)
+
     def _begin_selection(self, event) -> None:
         """ドラッグ選択の開始位置を記録する。"""
         self._dragging = True
@@ -69,8 +85,10 @@ class RoiSelector(QWidget):
         """ドラッグ中の終点を更新する。"""
         if not self._dragging:
             return False
+        # 移動ごとの全画面再描画を避け、旧枠と新枠を覆う範囲だけ描き直す。
+        dirty = self._selection_paint_rect()
         self._end_local = self._event_local_point(event)
-        self.update()
+        self.update(dirty.united(self._selection_paint_rect()))
         return True
 
     def _finish_selection(self, event) -> bool:
@@ -28,6 +28,8 @@ def _isolate_runtime_outputs_for_tests(monkeypatch):
     monkeypatch.setenv(C.DEBUG_UI_LOG_PATH_ENV, str(log_dir / C.DEBUG_UI_LOG_FILE))
 
     cm_config._CONFIG_PATH_CACHE = None
+    cm_config._CONFIG_TEXT_CACHE = None
     cm_debug_log._LOGGER_ANNOUNCED_PATHS.clear()
     yield
     cm_config._CONFIG_PATH_CACHE = None
+    cm_config._CONFIG_TEXT_CACHE = None
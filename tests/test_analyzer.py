@@ -1,12 +1,15 @@
 """AnalyzerWorker の snapshot/state 管理の回帰テスト。"""
 
-from dataclasses import FrozenInstanceError
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError, replace
+import threading
 
 import numpy as np
 import pytest
 from PySide6.QtCore import QRect
 
-from chroma_monitor.analyzer import AnalyzerWorker
+from chroma_monitor.analysis import live_graph_data
+from chroma_monitor.analyzer import AnalyzerGraphRequest, AnalyzerWorker
 from chroma_monitor.util import constants as C
 
 
@@ -41,6 +44,34 @@ def test_cfg_property_returns_frozen_replaced_snapshot() -> None:
     assert after.sample_points == C.ANALYZER_MIN_SAMPLE_POINTS
 
 
+def test_configure_applies_normalized_settings_in_one_replace() -> None:
+    worker = AnalyzerWorker()
+    before = worker.cfg
+    worker._prev_hsv = np.zeros((2, 2, 3), dtype=np.uint8)
+
+    worker.configure(
+        interval_sec=0.0,
+        sample_points=0,
+        max_dim=-1,
+        graph_every=0,
+        mode="unknown",
+        stable_frames=0,
+    )
+    after = worker.cfg
+
+    assert after.interval_sec > 0.0
+    assert after.sample_points == C.ANALYZER_MIN_SAMPLE_POINTS
+    assert after.max_dim == 0
+    assert after.graph_every >= 1
+    assert after.mode == C.DEFAULT_MODE
+    assert after.stable_frames == C.ANALYZER_MIN_STABLE_FRAMES
+    assert after.wheel_sat_threshold == before.wheel_sat_threshold
+    assert worker._prev_hsv is None
+
+    worker.configure()
+    assert worker.cfg is after
+
+
 def test_request_graph_refresh_once_forces_next_interval_graph_update_once() -> None:
     worker = AnalyzerWorker()
     frame = np.zeros((8, 8, 3), dtype=np.uint8)
@@ -73,3 +104,183 @@ def test_request_graph_refresh_once_forces_next_change_emit_once() -> None:
     assert forced.graph_update is True
     assert after.emit_now is False
     assert after.graph_update is False
+
+
+def test_set_view_flags_updates_only_requested_bits() -> None:
+    worker = AnalyzerWorker()
+    worker.set_view_flags(scatter=False, preview=True)
+    state = worker._loop_state()
+
+    flags = worker.cfg.view_flags
+    assert not flags & live_graph_data.VIEW_FLAG_SCATTER
+    assert flags & live_graph_data.VIEW_FLAG_PREVIEW
+    assert flags & live_graph_data.VIEW_FLAG_COLOR
+    assert state.graph_flags == flags & live_graph_data.VIEW_FLAGS_GRAPH
+    assert state.need_graph_data is True
+    assert state.need_bgr_emit is True
+
+
+def test_mark_result_consumed_wakes_inflight_wait() -> None:
+    worker = AnalyzerWorker()
+    worker._emit_result_if_possible({}, cfg=worker.cfg)
+    assert worker._result_inflight.is_set()
+    assert not worker._result_consumed.is_set()
+
+    worker.mark_result_consumed()
+
+    assert not worker._result_inflight.is_set()
+    assert worker._result_consumed.wait(0.0)
+
+
+def test_wait_joins_both_loop_threads_after_stop() -> None:
+    worker = AnalyzerWorker()
+    assert worker.wait(0.0)
+
+    worker._capture_thread = threading.Thread(target=worker._stop.wait, daemon=True)
+    worker._thread = threading.Thread(target=worker._stop.wait, daemon=True)
+    worker._capture_thread.start()
+    worker._thread.start()
+    assert not worker.wait(0.01)
+
+    worker.stop()
+
+    assert worker.wait(1.0)
+    assert not worker._capture_thread.is_alive()
+    assert not worker._thread.is_alive()
+
+
+def test_change_mode_reuses_detect_hsv_for_identical_capture() -> None:
+    worker = AnalyzerWorker()
+    worker.set_mode(C.UPDATE_MODE_CHANGE)
+    worker.set_stable_frames(C.ANALYZER_MIN_STABLE_FRAMES)
+    frame = np.full((16, 16, 3), 40, dtype=np.uint8)
+
+    worker._frame_decision_for_loop(worker.cfg, frame)
+    prev_hsv = worker._prev_hsv
+    decision = worker._frame_decision_for_loop(worker.cfg, frame.copy())
+
+    assert worker._prev_hsv is prev_hsv
+    assert worker._stable_frames == 1
+    assert decision.emit_now is True
+
+
+def test_capture_deadline_advances_by_interval_without_drift(monkeypatch) -> None:
+    worker = AnalyzerWorker()
+    worker.set_interval(0.25)
+    state = worker._loop_state()
+    clock = {"now": 10.0}
+    sleeps: list[float] = []
+    monkeypatch.setattr("chroma_monitor.analyzer.time.perf_counter", lambda: clock["now"])
+    monkeypatch.setattr("chroma_monitor.analyzer.time.sleep", sleeps.append)
+
+    worker._sleep_until_next_capture_deadline(state, 10.0)
+    clock["now"] = 10.26
+    worker._sleep_until_next_capture_deadline(state, 10.26)
+
+    assert worker._capture_deadline == pytest.approx(10.5)
+    assert sleeps == [pytest.approx(0.25), pytest.approx(0.24)]
+
+
+def test_capture_frame_skips_cloaked_window_without_capturing(monkeypatch) -> None:
+    worker = AnalyzerWorker()
+    worker.set_capture_selection(target_hwnd=123, roi_rel=None)
+    statuses: list[str] = []
+    worker.status.connect(statuses.append)
+    monkeypatch.setattr("chroma_monitor.analyzer.HAS_WIN32", True)
+    monkeypatch.setattr("chroma_monitor.analyzer.time.sleep", lambda _sec: None)
+    monkeypatch.setattr(worker, "_is_window_minimized", lambda _hwnd: False)
+    monkeypatch.setattr(worker, "_is_window_cloaked", lambda _hwnd: True)
+
+    def _fail_capture(_capture):
+        raise AssertionError("cloaked window must not be captured")
+
+    monkeypatch.setattr(worker, "_capture_target_window_region", _fail_capture)
+
+    bgr, cap = worker._capture_frame_for_loop(None, worker.capture_selection())
+
+    assert bgr is None and cap is None
+    assert len(statuses) == 1
+
+
+def test_graph_data_is_reused_only_for_the_same_frame_array(monkeypatch) -> None:
+    worker = AnalyzerWorker()
+    calls: list[np.ndarray] = []
+
+    def _collect(bgr, cfg, *, view_flags):
+        calls.append(bgr)
+        return {"hist": np.zeros(4)}
+
+    monkeypatch.setattr(live_graph_data, "collect_graph_data", _collect)
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)
+    request = AnalyzerGraphRequest(
+        can_emit_now=True,
+        graph_update=True,
+        need_graph_data=True,
+        bgr=frame,
+        cfg=worker.cfg,
+        graph_flags=live_graph_data.VIEW_FLAGS_GRAPH,
+    )
+
+    first = worker._graph_data_for_frame(request)
+    again = worker._graph_data_for_frame(request)
+    worker._graph_data_for_frame(replace(request, bgr=frame.copy()))
+    worker._graph_data_for_frame(replace(request, cfg=replace(worker.cfg, sample_points=1)))
+
+    assert again is first
+    assert len(calls) == 3
+
+
+def test_graph_data_is_reused_for_the_same_roi_of_an_unchanged_frame(monkeypatch) -> None:
+    worker = AnalyzerWorker()
+    calls: list[np.ndarray] = []
+
+    def _collect(bgr, cfg, *, view_flags):
+        calls.append(bgr)
+        return {"hist": np.zeros(4)}
+
+    monkeypatch.setattr(live_graph_data, "collect_graph_data", _collect)
+    full = np.zeros((16, 16, 3), dtype=np.uint8)
+
+    def _request(frame: np.ndarray, x: int, y: int) -> AnalyzerGraphRequest:
+        # ウィンドウ ROI は毎 tick 新しい切り出しビューになり、縮小結果も新しい配列になる。
+        crop = frame[y : y + 8, x : x + 8]
+        return AnalyzerGraphRequest(
+            can_emit_now=True,
+            graph_update=True,
+            need_graph_data=True,
+            bgr=crop.copy(),
+            cfg=worker.cfg,
+            graph_flags=live_graph_data.VIEW_FLAGS_GRAPH,
+            source_bgr=crop,
+        )
+
+    first = worker._graph_data_for_frame(_request(full, 2, 3))
+    again = worker._graph_data_for_frame(_request(full, 2, 3))
+    worker._graph_data_for_frame(_request(full, 4, 3))
+    worker._graph_data_for_frame(_request(full.copy(), 4, 3))
+
+    assert again is first
+    assert len(calls) == 3
+
+
+def test_collect_graph_data_matches_between_pooled_and_inline_runs(monkeypatch) -> None:
+    rng = np.random.default_rng(5)
+    bgr = rng.integers(0, 256, size=(24, 32, 3), dtype=np.uint8)
+    cfg = live_graph_data.GraphDataConfig(
+        sample_points=10_000,
+        max_dim=0,
+        wheel_sat_threshold=20,
+        color_band_sat_threshold=20,
+    )
+    flags = live_graph_data.VIEW_FLAGS_GRAPH
+
+    monkeypatch.setattr(live_graph_data, "_graph_pool", lambda: None)
+    inline = live_graph_data.collect_graph_data(bgr, cfg, view_flags=flags)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        monkeypatch.setattr(live_graph_data, "_graph_pool", lambda: pool)
+        pooled = live_graph_data.collect_graph_data(bgr, cfg, view_flags=flags)
+
+    for key in ("hist", "sv", "rgb", "h_hist", "s_hist", "v_hist"):
+        np.testing.assert_array_equal(pooled[key], inline[key])
+    assert pooled["top_colors"] == inline["top_colors"]
+    assert pooled["warm_ratio"] == inline["warm_ratio"]
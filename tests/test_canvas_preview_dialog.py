@@ -38,12 +38,11 @@ def _app() -> QApplication:
     return app
 
 
-def test_canvas_preview_dialog_init_completes_and_logs_steps(monkeypatch) -> None:
+def test_canvas_preview_dialog_init_completes_and_logs_steps(monkeypatch, tmp_path) -> None:
     """ダイアログ初期化が完了し、主要初期化ログが残ることを確認する。"""
     # 起動回帰として、初期状態とログ出力の両方をまとめて固定する。
-    log_dir = os.path.join(os.getcwd(), ".tmp_canvas_preview_tests")
-    os.makedirs(log_dir, exist_ok=True)
-    log_path = os.path.join(log_dir, "canvas_preview_ui_debug.log")
+    # 実行ごとに追記され続けないよう、ログは pytest の一時ディレクトリへ書く。
+    log_path = tmp_path / "canvas_preview_ui_debug.log"
     monkeypatch.setenv(C.DEBUG_UI_LOG_ENV, "1")
     monkeypatch.setenv(C.DEBUG_UI_LOG_PATH_ENV, str(log_path))
     monkeypatch.setattr(
@@ -0,0 +1,36 @@
+"""ScatterRasterWidget の遅延描画回帰テスト。"""
+
+from __future__ import annotations
+
+import os
+
+from PySide6.QtWidgets import QApplication
+
+from chroma_monitor.views import color_scatter
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _app() -> QApplication:
+    """offscreen テスト用の `QApplication` を返す。"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_scatter_frame_is_drawn_only_after_the_widget_is_shown() -> None:
+    _app()
+    first = color_scatter.ScatterRasterWidget()
+    second = color_scatter.ScatterRasterWidget()
+
+    assert first.pixmap().isNull()
+    assert first._scatter_base_pm is second._scatter_base_pm
+
+    first.resize(200, 200)
+    first.show()
+    first._sync_after_layout_change()
+
+    assert not first.pixmap().isNull()
+    first.deleteLater()
+    second.deleteLater()
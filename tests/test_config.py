@@ -68,3 +68,74 @@ def test_save_config_writes_json(tmp_path, monkeypatch) -> None:
     saved = json.loads(settings_path.read_text(encoding="utf-8"))
     assert saved[C.CFG_INTERVAL] == 3.0
     assert saved[C.CFG_LAYOUT_CURRENT] == {"x": 10}
+
+
+def test_load_config_rereads_file_only_after_it_changes(tmp_path, monkeypatch) -> None:
+    # 未変更の設定ファイルは読み直さず、外部更新は stat の変化で検知することを確認する。
+    settings_path = tmp_path / "settings.json"
+    monkeypatch.setattr(config, "config_path", lambda: settings_path)
+    settings_path.write_text(json.dumps({C.CFG_INTERVAL: 1.5}), encoding="utf-8")
+    reads: list[str] = []
+    original_read_text = type(settings_path).read_text
+
+    def _counting_read_text(self, *args, **kwargs):
+        reads.append(str(self))
+        return original_read_text(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(settings_path), "read_text", _counting_read_text)
+
+    first = config.load_config()
+    first[C.CFG_LAYOUT_CURRENT]["edited"] = 1
+    second = config.load_config()
+    settings_path.write_text(json.dumps({C.CFG_INTERVAL: 2.25}), encoding="utf-8")
+    third = config.load_config()
+
+    assert len(reads) == 2
+    assert second[C.CFG_INTERVAL] == 1.5
+    assert second[C.CFG_LAYOUT_CURRENT] == {}
+    assert third[C.CFG_INTERVAL] == 2.25
+
+
+def test_save_config_skips_rewriting_identical_payload(tmp_path, monkeypatch) -> None:
+    # 直前に書いた内容と同じなら実ファイルへの書き込みを省くことを確認する。
+    settings_path = tmp_path / "settings.json"
+    monkeypatch.setattr(config, "config_path", lambda: settings_path)
+    payload = {C.CFG_INTERVAL: 3.0}
+
+    config.save_config(payload)
+    before = settings_path.stat().st_mtime_ns
+    writes: list[str] = []
+    original_write_bytes = type(settings_path).write_bytes
+
+    def _counting_write_bytes(self, *args, **kwargs):
+        writes.append(str(self))
+        return original_write_bytes(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(settings_path), "write_bytes", _counting_write_bytes)
+    config.save_config(dict(payload))
+    config.save_config({C.CFG_INTERVAL: 4.0})
+
+    assert len(writes) == 1
+    assert settings_path.stat().st_mtime_ns >= before
+    assert json.loads(settings_path.read_text(encoding="utf-8"))[C.CFG_INTERVAL] == 4.0
+
+
+def test_save_config_creates_missing_directory_only_for_new_file(tmp_path, monkeypatch) -> None:
+    # 初回保存では親ディレクトリを作り、既存ファイルの上書きでは mkdir を呼ばないことを確認する。
+    settings_path = tmp_path / "nested" / "settings.json"
+    monkeypatch.setattr(config, "config_path", lambda: settings_path)
+    config.save_config({C.CFG_INTERVAL: 1.0})
+    assert settings_path.exists()
+
+    mkdirs: list[str] = []
+    original_mkdir = type(settings_path).mkdir
+
+    def _counting_mkdir(self, *args, **kwargs):
+        mkdirs.append(str(self))
+        return original_mkdir(self, *args, **kwargs)
+
+    monkeypatch.setattr(type(settings_path), "mkdir", _counting_mkdir)
+    config.save_config({C.CFG_INTERVAL: 2.0})
+
+    assert mkdirs == []
+    assert json.loads(settings_path.read_text(encoding="utf-8"))[C.CFG_INTERVAL] == 2.0
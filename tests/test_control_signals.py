@@ -0,0 +1,153 @@
+"""control_signals の配線テーブル回帰テスト。"""
+
+from __future__ import annotations
+
+from functools import partial
+from types import SimpleNamespace
+
+from chroma_monitor.ui.main_window import control_signals, settings_apply
+
+
+class _FakeSignal:
+    def __init__(self) -> None:
+        self.slots: list = []
+
+    def connect(self, slot) -> None:
+        self.slots.append(slot)
+
+
+def test_connect_analysis_control_signals_wires_every_binding_once() -> None:
+    main_window = SimpleNamespace()
+    for widget_attr, signal_name, slot_attr in control_signals._ANALYSIS_CONTROL_BINDINGS:
+        widget = getattr(main_window, widget_attr, None)
+        if widget is None:
+            widget = SimpleNamespace()
+            setattr(main_window, widget_attr, widget)
+        if not hasattr(widget, signal_name):
+            setattr(widget, signal_name, _FakeSignal())
+        setattr(main_window, slot_attr, slot_attr)
+
+    def queue(*_args) -> None:
+        return None
+
+    main_window._queue_settings_apply = queue
+
+    control_signals.connect_analysis_control_signals(main_window)
+
+    remaining: dict[int, list] = {}
+    for widget_attr, signal_name, _slot_attr in control_signals._ANALYSIS_CONTROL_BINDINGS:
+        signal = getattr(getattr(main_window, widget_attr), signal_name)
+        remaining.setdefault(id(signal), list(signal.slots))
+    for widget_attr, signal_name, slot_attr in control_signals._ANALYSIS_CONTROL_BINDINGS:
+        signal = getattr(getattr(main_window, widget_attr), signal_name)
+        # 同じシグナルへの複数行はテーブル順に接続される。
+        slot = remaining[id(signal)].pop(0)
+        if slot_attr.startswith("apply_"):
+            assert isinstance(slot, partial)
+            assert slot.func is queue
+            assert slot.args == (slot_attr,)
+        else:
+            assert slot == slot_attr
+    assert all(not slots for slots in remaining.values())
+
+
+def test_connect_layout_preset_signals_wires_table_handlers_directly() -> None:
+    main_window = SimpleNamespace()
+    for widget_attr, signal_name, slot_attr in control_signals._LAYOUT_PRESET_BINDINGS:
+        setattr(main_window, widget_attr, SimpleNamespace(**{signal_name: _FakeSignal()}))
+        setattr(main_window, slot_attr, slot_attr)
+
+    control_signals.connect_layout_preset_signals(main_window)
+
+    assert [
+        getattr(getattr(main_window, widget_attr), signal_name).slots
+        for widget_attr, signal_name, _slot_attr in control_signals._LAYOUT_PRESET_BINDINGS
+    ] == [
+        ["save_layout_preset"],
+        ["load_selected_layout_preset"],
+        ["delete_selected_layout_preset"],
+    ]
+
+
+class _FakeTimer:
+    def __init__(self) -> None:
+        self.starts = 0
+        self.active = False
+
+    def isActive(self) -> bool:
+        return self.active
+
+    def start(self) -> None:
+        self.starts += 1
+        self.active = True
+
+
+def _settings_apply_window(*, loading: bool = False):
+    calls: list[str] = []
+    main_window = SimpleNamespace(
+        _settings_load_in_progress=loading,
+        _pending_settings_applies={},
+        _settings_apply_timer=_FakeTimer(),
+        apply_wheel_settings=lambda: calls.append("wheel"),
+        apply_edge_settings=lambda: calls.append("edge"),
+    )
+    return main_window, calls
+
+
+def test_queue_settings_apply_runs_each_handler_once_per_flush() -> None:
+    main_window, calls = _settings_apply_window()
+
+    for value in range(5):
+        settings_apply.queue_settings_apply(main_window, "apply_wheel_settings", value)
+    settings_apply.queue_settings_apply(main_window, "apply_edge_settings", True)
+    settings_apply.queue_settings_apply(main_window, "apply_wheel_settings", 9)
+    assert calls == []
+
+    settings_apply.flush_settings_applies(main_window)
+    settings_apply.flush_settings_applies(main_window)
+
+    assert calls == ["wheel", "edge"]
+    assert main_window._pending_settings_applies == {}
+
+
+def test_queue_settings_apply_does_not_restart_a_pending_flush() -> None:
+    main_window, calls = _settings_apply_window()
+
+    for value in range(10):
+        settings_apply.queue_settings_apply(main_window, "apply_wheel_settings", value)
+    assert main_window._settings_apply_timer.starts == 1
+
+    main_window._settings_apply_timer.active = False
+    settings_apply.flush_settings_applies(main_window)
+    settings_apply.queue_settings_apply(main_window, "apply_wheel_settings", 11)
+
+    assert calls == ["wheel"]
+    assert main_window._settings_apply_timer.starts == 2
+
+
+def test_queue_settings_apply_runs_immediately_while_loading_settings() -> None:
+    main_window, calls = _settings_apply_window(loading=True)
+
+    settings_apply.queue_settings_apply(main_window, "apply_edge_settings", 3)
+
+    assert calls == ["edge"]
+    assert main_window._settings_apply_timer.starts == 0
+
+
+def test_wheel_sat_threshold_cache_is_reused_until_invalidated(monkeypatch) -> None:
+    reads: list[int] = []
+    values = iter((40, 55))
+
+    def _selected(_main_window) -> int:
+        value = next(values)
+        reads.append(value)
+        return value
+
+    monkeypatch.setattr(settings_apply, "selected_wheel_sat_threshold", _selected)
+    main_window = SimpleNamespace(_wheel_sat_threshold_cache=None)
+
+    assert settings_apply.cached_wheel_sat_threshold(main_window) == 40
+    assert settings_apply.cached_wheel_sat_threshold(main_window) == 40
+    settings_apply.invalidate_wheel_sat_threshold(main_window, 55)
+    assert settings_apply.cached_wheel_sat_threshold(main_window) == 55
+    assert reads == [40, 55]
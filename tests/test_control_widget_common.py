@@ -0,0 +1,29 @@
+"""control_widget_common の回帰テスト。"""
+
+from __future__ import annotations
+
+from PySide6.QtWidgets import QApplication, QComboBox
+
+from chroma_monitor.ui.main_window.control_widget_common import populate_data_combo
+
+
+def _app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_populate_data_combo_replaces_items_with_labels_and_data() -> None:
+    _app()
+    combo = QComboBox()
+    combo.addItem("old", "stale")
+    changes: list[int] = []
+    combo.currentIndexChanged.connect(changes.append)
+
+    populate_data_combo(combo, ((label, index * 10) for index, label in enumerate("abc")))
+
+    assert [combo.itemText(i) for i in range(combo.count())] == ["a", "b", "c"]
+    assert [combo.itemData(i) for i in range(combo.count())] == [0, 10, 20]
+    assert combo.currentData() == 0
+    assert changes == []
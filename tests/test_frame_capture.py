@@ -0,0 +1,76 @@
+"""frame_capture の ROI 切り出し回帰テスト。"""
+
+from __future__ import annotations
+
+import numpy as np
+from PySide6.QtCore import QRect
+
+from chroma_monitor.capture import frame_capture
+
+
+def _window_frame(width: int, height: int) -> np.ndarray:
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    frame[:, :, 0] = np.arange(width, dtype=np.uint8)[None, :]
+    frame[:, :, 1] = np.arange(height, dtype=np.uint8)[:, None]
+    return frame
+
+
+def test_window_roi_maps_through_dwm_frame_bounds() -> None:
+    # GetWindowRect は左右下に 7px の不可視境界を含み、WGC フレームは可視枠だけを持つ。
+    window_rect = QRect(100, 50, 214, 157)
+    frame_bounds = QRect(107, 50, 200, 150)
+    full = _window_frame(200, 150)
+
+    crop, cap = frame_capture.capture_target_window_region(
+        target_hwnd=1,
+        roi_rel=QRect(17, 20, 30, 40),
+        get_window_rect_fn=lambda _hwnd: window_rect,
+        capture_window_frame_fn=lambda _hwnd: (full, frame_bounds),
+    )
+
+    assert crop is not None
+    assert crop.shape[:2] == (40, 30)
+    assert int(crop[0, 0, 0]) == 10
+    assert int(crop[0, 0, 1]) == 20
+    assert cap == QRect(117, 70, 30, 40)
+
+
+def test_window_roi_uses_window_rect_when_frame_bounds_are_unknown() -> None:
+    window_rect = QRect(0, 0, 100, 80)
+    full = _window_frame(200, 160)
+
+    crop, _cap = frame_capture.capture_target_window_region(
+        target_hwnd=1,
+        roi_rel=QRect(10, 5, 20, 10),
+        get_window_rect_fn=lambda _hwnd: window_rect,
+        capture_window_frame_fn=lambda _hwnd: (full, None),
+    )
+
+    assert crop is not None
+    assert crop.shape[:2] == (20, 40)
+    assert int(crop[0, 0, 0]) == 20
+    assert int(crop[0, 0, 1]) == 10
+
+
+class _MutatingScreenGrabber:
+    monitors = [{"left": 0, "top": 0, "width": 1920, "height": 1080}]
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, int]] = []
+
+    def grab(self, monitor: dict[str, int]) -> np.ndarray:
+        self.requests.append(dict(monitor))
+        # 呼び出し先が monitor 辞書を書き換えても、次回のキャプチャ範囲へ影響しないこと。
+        monitor["left"] += 500
+        return np.zeros((int(monitor["height"]), int(monitor["width"]), 4), dtype=np.uint8)
+
+
+def test_screen_region_builds_fresh_monitor_dict_per_grab() -> None:
+    sct = _MutatingScreenGrabber()
+    cap = QRect(-10, 20, 100, 50)
+
+    first = frame_capture.capture_screen_region(sct, cap)
+    second = frame_capture.capture_screen_region(sct, cap)
+
+    assert sct.requests == [{"left": 0, "top": 20, "width": 90, "height": 50}] * 2
+    assert first[1] == second[1] == QRect(0, 20, 90, 50)
@@ -0,0 +1,29 @@
+"""help_actions の回帰テスト。"""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject
+
+from chroma_monitor.ui.main_window import help_actions
+
+
+class _FakeMainWindow(QObject):
+    def __init__(self) -> None:
+        super().__init__()
+        self._update_network = None
+        self.finished_replies = []
+
+    def _on_release_check_finished(self, reply) -> None:
+        self.finished_replies.append(reply)
+
+
+def test_release_check_network_is_created_lazily_once() -> None:
+    main_window = _FakeMainWindow()
+    assert main_window._update_network is None
+
+    first = help_actions._release_check_network(main_window)
+    second = help_actions._release_check_network(main_window)
+
+    assert first is second
+    assert main_window._update_network is first
+    assert first.parent() is main_window
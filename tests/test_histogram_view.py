@@ -0,0 +1,45 @@
+"""ChannelHistogram の集計キャッシュ回帰テスト。"""
+
+from __future__ import annotations
+
+import math
+import os
+
+import numpy as np
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QApplication
+
+from chroma_monitor.views import histogram
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _app() -> QApplication:
+    """offscreen テスト用の `QApplication` を返す。"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_channel_histogram_caches_bucketed_hist_and_stats(monkeypatch) -> None:
+    _app()
+    view = histogram.ChannelHistogram("S", 256, 255, QColor(0, 0, 0), bucket=4)
+    assert view.bucketed_max() == 0
+
+    rng = np.random.default_rng(7)
+    hist = rng.integers(0, 500, size=256)
+    view.update_from_hist(hist)
+
+    idx = np.arange(256, dtype=np.float64)
+    mean = float((idx * hist).sum() / hist.sum())
+    std = math.sqrt(float((((idx - mean) ** 2) * hist).sum() / hist.sum()))
+    assert math.isclose(view._mean, mean, rel_tol=1e-12)
+    assert math.isclose(view._std, std, rel_tol=1e-9)
+
+    def _fail_bucket_sum(_hist, _bucket):
+        raise AssertionError("bucketed histogram must be reused until the data changes")
+
+    monkeypatch.setattr(histogram, "_bucket_sum", _fail_bucket_sum)
+    assert view.bucketed_max() == int(hist.reshape(-1, 4).sum(axis=1).max())
+    view.deleteLater()
@@ -61,6 +61,60 @@ def test_load_image_path_to_bgr_decodes_common_image(tmp_path) -> None:
     assert loaded[0, 0].tolist() == [12, 34, 56]
 
 
+def test_decode_image_buffer_to_bgr_decodes_grayscale_jpeg_to_three_channels() -> None:
+    gray = np.full((8, 8), 128, dtype=np.uint8)
+    ok, encoded = cv2.imencode(".jpg", gray)
+    assert ok is True
+
+    decoded = image_inputs.decode_image_buffer_to_bgr(encoded.reshape(-1))
+
+    assert decoded is not None
+    assert decoded.shape == (8, 8, 3)
+    assert decoded.dtype == np.uint8
+    assert abs(int(decoded[4, 4, 0]) - 128) <= 2
+
+
+class _FakeTurboJpeg:
+    def __init__(self, result: np.ndarray | None = None, error: Exception | None = None) -> None:
+        self.result = result
+        self.error = error
+        self.calls: list[tuple[bytes, object, bool]] = []
+
+    def decode(self, data: bytes, *, pixel_format):
+        self.calls.append((data, pixel_format, image_inputs._TURBO_JPEG_LOCK.locked()))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _encoded_jpeg() -> np.ndarray:
+    ok, encoded = cv2.imencode(".jpg", np.full((4, 6, 3), 90, dtype=np.uint8))
+    assert ok is True
+    return encoded.reshape(-1)
+
+
+def test_decode_image_buffer_to_bgr_uses_turbo_jpeg_decoder_under_lock(monkeypatch) -> None:
+    decoded = np.full((4, 6, 3), 7, dtype=np.uint8)
+    turbo = _FakeTurboJpeg(result=decoded)
+    monkeypatch.setattr(image_inputs, "_turbo_jpeg_decoder", lambda: (turbo, "bgr"))
+    buf = _encoded_jpeg()
+
+    assert image_inputs.decode_image_buffer_to_bgr(buf) is decoded
+    assert turbo.calls == [(buf.tobytes(), "bgr", True)]
+
+
+def test_decode_image_buffer_to_bgr_falls_back_to_opencv_when_turbo_fails(monkeypatch) -> None:
+    turbo = _FakeTurboJpeg(error=OSError("unsupported JPEG"))
+    monkeypatch.setattr(image_inputs, "_turbo_jpeg_decoder", lambda: (turbo, "bgr"))
+
+    decoded = image_inputs.decode_image_buffer_to_bgr(_encoded_jpeg())
+
+    assert len(turbo.calls) == 1
+    assert decoded is not None
+    assert decoded.shape == (4, 6, 3)
+    assert not image_inputs._TURBO_JPEG_LOCK.locked()
+
+
 def test_qimage_to_bgr_handles_alpha_channel() -> None:
     image_format = getattr(QImage, "Format_RGBA8888", QImage.Format_ARGB32)
     image = QImage(1, 1, image_format)
@@ -1,12 +1,17 @@
 """画像正規化ロジックの退化を防ぐテスト。"""
 
+import cv2
 import numpy as np
 
+from chroma_monitor.analysis import live_graph_data
 from chroma_monitor.analysis.frame_analysis import (
+    compute_hsv_histograms,
     compute_top_bars_chromatic_medoid_from_hs,
+    prepare_hsv8_and_bgr8,
     sample_sv_and_rgb,
 )
 from chroma_monitor.util import constants as C
+from chroma_monitor.util.color_utils import HUE_NAME_12
 from chroma_monitor.util.image_math import normalize_map
 from chroma_monitor.views.color_scatter_math import (
     ScatterRenderConfig,
@@ -15,6 +20,7 @@ from chroma_monitor.views.color_scatter_math import (
     guide_points,
     normalize_rotation_deg,
     point_angle_deg,
+    render_scatter_dominant,
     scatter_render_mode_needs_rgb,
 )
 
@@ -120,6 +126,18 @@ def test_sample_sv_and_rgb_respects_requested_count() -> None:
     assert rgb.dtype == np.uint8
 
 
+def test_sample_sv_and_rgb_returns_empty_arrays_for_empty_frame() -> None:
+    # 空フレームでも cvtColor を通さず (0, 3) の uint8 配列を返す。
+    h = np.empty((0, 0), dtype=np.uint8)
+    bgr = np.empty((0, 0, 3), dtype=np.uint8)
+
+    sv, rgb = sample_sv_and_rgb(h, h, h, bgr, sample_points=16)
+
+    assert sv.shape == (0, 3)
+    assert rgb.shape == (0, 3)
+    assert rgb.dtype == np.uint8
+
+
 def test_compute_top_bars_chromatic_medoid_from_hs_returns_dominant_hue_label() -> None:
     # 準備済み H/S を使う経路でも代表色とラベルが返ることを確認する。
     bgr = np.array(
@@ -143,3 +161,84 @@ def test_compute_top_bars_chromatic_medoid_from_hs_returns_dominant_hue_label()
     assert len(bars) >= 1
     assert bars[0][0] == "赤"
     assert bars[0][1] > 0.5
+
+
+def test_compute_top_bars_keeps_only_top_count_segments_by_descending_ratio() -> None:
+    # 上位 K 区分だけを比率の降順で返すことを確認する。
+    hues = [0] * 7 + [60] * 5 + [120] * 3 + [30] * 1
+    hsv = np.zeros((1, len(hues), 3), dtype=np.uint8)
+    hsv[0, :, 0] = hues
+    hsv[0, :, 1:] = 255
+    bgr = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+
+    bars = compute_top_bars_chromatic_medoid_from_hs(
+        bgr,
+        hsv[:, :, 0],
+        hsv[:, :, 1],
+        sat_threshold=1,
+        top_count=3,
+    )
+
+    assert [bar[0] for bar in bars] == [HUE_NAME_12[0], HUE_NAME_12[4], HUE_NAME_12[8]]
+    assert [bar[1] for bar in bars] == [7 / 16, 5 / 16, 3 / 16]
+
+
+def test_compute_hsv_histograms_matches_for_channel_views_and_planes() -> None:
+    rng = np.random.default_rng(7)
+    bgr = rng.integers(0, 256, size=(24, 32, 3), dtype=np.uint8)
+    _bgr_u8, h, s, v = prepare_hsv8_and_bgr8(bgr)
+
+    from_views = compute_hsv_histograms(h, s, v)
+    from_planes = compute_hsv_histograms(h.copy(), s.copy(), v.copy())
+
+    for view_hist, plane_hist in zip(from_views, from_planes):
+        assert np.array_equal(view_hist, plane_hist)
+    assert int(from_views[1].sum()) == h.size
+
+
+def test_sample_sv_and_rgb_gathers_channel_views_like_separate_planes() -> None:
+    rng = np.random.default_rng(3)
+    bgr = rng.integers(0, 256, size=(12, 10, 3), dtype=np.uint8)
+    _, h, s, v = prepare_hsv8_and_bgr8(bgr)
+    planes = tuple(np.ascontiguousarray(ch) for ch in (h, s, v))
+
+    full_views, _ = sample_sv_and_rgb(h, s, v, bgr, sample_points=10_000)
+    full_planes, _ = sample_sv_and_rgb(*planes, bgr, sample_points=10_000)
+    sampled, rgb = sample_sv_and_rgb(h, s, v, bgr, sample_points=25)
+
+    np.testing.assert_array_equal(full_views, full_planes)
+    assert sampled.shape == (25, 3)
+    pixels = np.concatenate([full_planes, bgr.reshape(-1, 3)[:, ::-1]], axis=1)
+    lookup = {tuple(px) for px in pixels.tolist()}
+    for row in np.concatenate([sampled, rgb], axis=1).tolist():
+        assert tuple(row) in lookup
+
+
+def test_render_scatter_dominant_prefers_majority_then_latest_color() -> None:
+    # 同一セルでは件数の多い色、同数なら後から現れた色を採用することを確認する。
+    x = np.array([10, 10, 10, 40, 40], dtype=np.int32)
+    y = np.array([10, 10, 10, 40, 40], dtype=np.int32)
+    rgb = np.array(
+        [[200, 0, 0], [0, 200, 0], [200, 0, 0], [0, 0, 200], [0, 200, 0]],
+        dtype=np.uint8,
+    )
+
+    out = render_scatter_dominant(x, y, rgb, triangle_mode=False)
+
+    np.testing.assert_array_equal(out[10, 10], (200, 0, 0, 255))
+    np.testing.assert_array_equal(out[11, 11], (200, 0, 0, 255))
+    np.testing.assert_array_equal(out[40, 40], (0, 200, 0, 255))
+    assert int(out[:, :, 3].astype(bool).sum()) == 8
+
+
+def test_extract_hsv_channels_returns_contiguous_planes() -> None:
+    # グラフ集計には HSV を連続平面で渡し、値は HSV 変換結果と一致することを確認する。
+    rng = np.random.default_rng(11)
+    bgr = rng.integers(0, 256, size=(9, 7, 3), dtype=np.uint8)
+    hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+
+    planes = live_graph_data.extract_hsv_channels(bgr, enabled=True)
+
+    for ch, plane in enumerate(planes):
+        assert plane.flags.c_contiguous
+        np.testing.assert_array_equal(plane, hsv[:, :, ch])
@@ -1,5 +1,7 @@
 """画像変換キャッシュとリサイズの挙動を守るテスト。"""
 
+import threading
+
 import cv2
 import numpy as np
 
@@ -7,7 +9,9 @@ from chroma_monitor.util.image_ops import (
     clear_cvt_color_cache,
     clear_resize_cache,
     cvt_color_cached,
+    image_cache_mark,
     resize_by_long_edge,
+    thread_scratch_buffer,
 )
 
 
@@ -42,3 +46,39 @@ def test_cvt_color_cached_reuse_and_clear() -> None:
     clear_cvt_color_cache()
     out3 = cvt_color_cached(src, cv2.COLOR_BGR2HSV)
     assert out3 is not out1
+
+
+def test_clear_caches_up_to_mark_keeps_later_entries() -> None:
+    # 目印以前の項目だけを破棄し、後から積まれた次フレーム分は残ることを確認する。
+    clear_resize_cache()
+    clear_cvt_color_cache()
+    current = np.zeros((200, 300, 3), dtype=np.uint8)
+    current_small = resize_by_long_edge(current, 100)
+    current_hsv = cvt_color_cached(current, cv2.COLOR_BGR2HSV)
+    mark = image_cache_mark()
+    following = np.ones((200, 300, 3), dtype=np.uint8)
+    following_small = resize_by_long_edge(following, 100)
+    following_hsv = cvt_color_cached(following, cv2.COLOR_BGR2HSV)
+
+    clear_resize_cache(mark)
+    clear_cvt_color_cache(mark)
+
+    assert resize_by_long_edge(following, 100) is following_small
+    assert cvt_color_cached(following, cv2.COLOR_BGR2HSV) is following_hsv
+    assert resize_by_long_edge(current, 100) is not current_small
+    assert cvt_color_cached(current, cv2.COLOR_BGR2HSV) is not current_hsv
+
+
+def test_thread_scratch_buffer_reuses_per_thread_and_shape() -> None:
+    # 同一スレッド・同一形状では再利用し、形状変更や別スレッドでは別配列になることを確認する。
+    first = thread_scratch_buffer("test_scratch", (4, 5), np.uint8)
+    assert thread_scratch_buffer("test_scratch", (4, 5), np.uint8) is first
+    assert thread_scratch_buffer("test_scratch", (4, 6), np.uint8).shape == (4, 6)
+
+    other: list[np.ndarray] = []
+    worker = threading.Thread(
+        target=lambda: other.append(thread_scratch_buffer("test_scratch", (4, 6), np.uint8))
+    )
+    worker.start()
+    worker.join()
+    assert other[0] is not thread_scratch_buffer("test_scratch", (4, 6), np.uint8)
@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QMenu, QPushButton
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtGui import QFocusEvent
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QAbstractSpinBox, QApplication, QMenu, QPushButton
 
-from chroma_monitor.ui.input_widgets import SplitMenuToolButton
+from chroma_monitor.ui.input_widgets import (
+    SelectAllLineEdit,
+    SelectAllSpinBox,
+    SplitMenuToolButton,
+    configure_numeric_input,
+    make_checkable_action,
+)
 from chroma_monitor.util.theme import get_ui_theme
 from chroma_monitor.util.theme_stylesheet import build_app_stylesheet
 
@@ -49,3 +57,76 @@ def test_split_button_stylesheet_has_named_selector_and_menu_separator() -> None
     assert "QToolButton#fileLoadSplitButton:open" in dark
     assert "QToolButton#fileLoadSplitButton:open:focus" in dark
     assert "border-left:1px solid" in dark
+
+
+def test_select_all_spinbox_selects_value_on_keyboard_focus_via_shared_timer() -> None:
+    app = _app()
+    spin = SelectAllSpinBox()
+    spin.setRange(0, 999)
+    spin.setValue(123)
+    spin.setSuffix(" px")
+    timer = spin._select_value_timer
+
+    spin.focusInEvent(QFocusEvent(QFocusEvent.FocusIn, Qt.TabFocusReason))
+    assert timer.isActive()
+    app.processEvents()
+
+    assert spin._select_value_timer is timer
+    assert spin.lineEdit().selectedText() == "123"
+
+
+def test_select_all_spinbox_selects_value_between_prefix_and_suffix() -> None:
+    _app()
+    spin = SelectAllSpinBox()
+    spin.setRange(0, 9999)
+    spin.setPrefix("x ")
+    spin.setSuffix(" ms")
+    spin.setValue(4500)
+
+    spin._select_value_text()
+
+    editor = spin.lineEdit()
+    assert editor.selectedText() == "4500"
+    assert editor.selectionStart() == len("x ")
+
+
+def test_select_all_line_edit_double_click_places_cursor_without_selection() -> None:
+    _app()
+    edit = SelectAllLineEdit()
+    edit.setText("window title")
+    edit.resize(200, 24)
+    edit.selectAll()
+
+    QTest.mouseDClick(edit, Qt.LeftButton, Qt.NoModifier, QPoint(2, 12))
+
+    assert not edit.hasSelectedText()
+    assert edit.cursorPosition() == edit.cursorPositionAt(QPoint(2, 12))
+
+
+def test_make_checkable_action_is_not_added_until_requested() -> None:
+    _app()
+    menu = QMenu()
+    toggled: list[bool] = []
+
+    action = make_checkable_action(menu, "Scatter", True, toggled.append)
+    assert menu.actions() == []
+
+    menu.addActions([action])
+    action.setChecked(False)
+
+    assert menu.actions() == [action]
+    assert action.parent() is menu
+    assert action.isCheckable()
+    assert toggled == [False]
+
+
+def test_configure_numeric_input_keeps_default_arrows_and_sets_minimum_size() -> None:
+    _app()
+    spin = SelectAllSpinBox()
+    spin.setRange(5, 250)
+
+    configure_numeric_input(spin, min_width=84, min_height=30)
+
+    assert spin.buttonSymbols() == QAbstractSpinBox.UpDownArrows
+    assert (spin.minimumWidth(), spin.minimumHeight()) == (84, 30)
+    assert spin.toolTip() == "範囲: 5 ～ 250"
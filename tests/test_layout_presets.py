@@ -0,0 +1,195 @@
+"""layout_presets / layout_state のプリセット適用回帰テスト。"""
+
+from __future__ import annotations
+
+from contextlib import nullcontext
+from types import SimpleNamespace
+
+from PySide6.QtCore import QByteArray
+
+from chroma_monitor.ui import layout_presets
+from chroma_monitor.util import layout_state
+
+
+def test_apply_layout_preset_uses_cached_presets_without_reloading(monkeypatch) -> None:
+    applied: list[dict] = []
+    statuses: list[str] = []
+    preset = {"state": ""}
+
+    def _fail_load():
+        raise AssertionError("cached presets must not reload the config")
+
+    monkeypatch.setattr(layout_presets, "load_config", _fail_load)
+    monkeypatch.setattr(
+        layout_presets,
+        "_apply_layout_or_default",
+        lambda _mw, layout: applied.append(layout) or True,
+    )
+    main_window = SimpleNamespace(
+        _layout_presets_cache={"work": preset},
+        on_status=statuses.append,
+    )
+
+    layout_presets.apply_layout_preset(main_window, "work")
+    layout_presets.apply_layout_preset(main_window, "missing")
+
+    assert applied == [preset]
+    assert len(statuses) == 1
+
+
+def test_decode_qbytearray_reuses_decoded_blob_for_same_text() -> None:
+    encoded = layout_state._encode_qbytearray(QByteArray(b"dock-state"))
+
+    first = layout_state._decode_qbytearray(encoded)
+    second = layout_state._decode_qbytearray(encoded)
+    first.append(b"!")
+
+    assert bytes(second) == b"dock-state"
+    assert bytes(layout_state._decode_qbytearray(encoded)) == b"dock-state"
+    assert layout_state._decoded_blob.cache_info().hits >= 2
+
+
+def test_silent_layout_save_skips_unchanged_layout(monkeypatch) -> None:
+    layouts = [{"state": "a"}, {"state": "a"}, {"state": "b"}]
+    saved: list[dict] = []
+    monkeypatch.setattr(
+        layout_presets,
+        "_capture_layout_with_debug",
+        lambda _mw, *, event: layouts.pop(0),
+    )
+    monkeypatch.setattr(layout_presets, "load_config", lambda: {})
+    monkeypatch.setattr(layout_presets, "save_config", lambda cfg: saved.append(cfg))
+    main_window = SimpleNamespace(_last_saved_layout=None)
+
+    for _ in range(3):
+        layout_presets.save_current_layout_to_config(main_window, silent=True)
+
+    assert [cfg[layout_presets.C.CFG_LAYOUT_CURRENT] for cfg in saved] == [
+        {"state": "a"},
+        {"state": "b"},
+    ]
+    assert main_window._last_saved_layout == {"state": "b"}
+
+
+def test_layout_restore_suppresses_autosave_until_apply_finishes(monkeypatch) -> None:
+    starts: list[bool] = []
+    after_calls: list[dict] = []
+    main_window = SimpleNamespace(
+        _dock_map={},
+        _layout_autosave_enabled=True,
+        _layout_restore_in_progress=False,
+        _layout_save_timer=SimpleNamespace(start=lambda: starts.append(True)),
+        isMinimized=lambda: False,
+        isVisible=lambda: False,
+    )
+
+    def _restore(mw, _docks, _layout):
+        # 復元中に届くドック通知相当の自動保存予約は無視される。
+        layout_presets.schedule_layout_autosave(mw)
+        return mw._layout_restore_in_progress
+
+    monkeypatch.setattr(layout_presets, "apply_layout_state", _restore)
+    monkeypatch.setattr(
+        layout_presets,
+        "_after_layout_apply",
+        lambda mw, *, applied_layout: after_calls.append(applied_layout),
+    )
+    layout = {"state": ""}
+
+    assert layout_presets._apply_layout_or_default(main_window, layout) is True
+    assert starts == []
+    assert after_calls == [layout]
+    assert main_window._layout_restore_in_progress is False
+
+    layout_presets.schedule_layout_autosave(main_window)
+    assert starts == [True]
+
+
+class _FakePresetCombo:
+    def __init__(self) -> None:
+        self.items: list[str] = []
+        self.rebuilds = 0
+
+    def currentText(self) -> str:
+        return ""
+
+    def clear(self) -> None:
+        self.rebuilds += 1
+        self.items = []
+
+    def addItems(self, names: list[str]) -> None:
+        self.items.extend(names)
+
+
+class _FakePresetMenu:
+    def __init__(self) -> None:
+        self.actions: list[object] = []
+
+    def clear(self) -> None:
+        self.actions = []
+
+    def addAction(self, text: str):
+        action = SimpleNamespace(
+            text=text,
+            setEnabled=lambda _enabled: None,
+            triggered=SimpleNamespace(connect=lambda _fn: None),
+        )
+        self.actions.append(action)
+        return action
+
+
+def test_refresh_layout_preset_views_rebuilds_only_when_names_change(monkeypatch) -> None:
+    presets = {"b": {}, "a": {}}
+    monkeypatch.setattr(layout_presets, "_load_cfg_with_presets", lambda: ({}, dict(presets)))
+    monkeypatch.setattr(layout_presets, "blocked_signals", lambda _obj: nullcontext())
+    combo = _FakePresetCombo()
+    main_window = SimpleNamespace(combo_layout_presets=combo, presets_menu=_FakePresetMenu())
+
+    layout_presets.refresh_layout_preset_views(main_window)
+    presets["a"] = {"state": "overwritten"}
+    layout_presets.refresh_layout_preset_views(main_window)
+
+    assert combo.rebuilds == 1
+    assert combo.items == ["a", "b"]
+    assert main_window._layout_presets_cache["a"] == {"state": "overwritten"}
+
+    presets["c"] = {}
+    layout_presets.refresh_layout_preset_views(main_window)
+
+    assert combo.rebuilds == 2
+    assert combo.items == ["a", "b", "c"]
+    assert [act.text for act in main_window.presets_menu.actions] == ["a", "b", "c"]
+
+
+class _FakeVisibleWindow:
+    def __init__(self) -> None:
+        self._updates_enabled = True
+        self.updates_log: list[bool] = []
+        self._dock_map = {}
+        self._layout_restore_in_progress = False
+
+    def isVisible(self) -> bool:
+        return True
+
+    def updatesEnabled(self) -> bool:
+        return self._updates_enabled
+
+    def setUpdatesEnabled(self, enabled: bool) -> None:
+        self._updates_enabled = bool(enabled)
+        self.updates_log.append(bool(enabled))
+
+
+def test_visible_layout_restore_suspends_repaints_once(monkeypatch) -> None:
+    main_window = _FakeVisibleWindow()
+    seen: list[bool] = []
+
+    def _restore(mw, _docks, _layout):
+        seen.append(mw.updatesEnabled())
+        return True
+
+    monkeypatch.setattr(layout_presets, "apply_layout_state", _restore)
+    monkeypatch.setattr(layout_presets, "_after_layout_apply", lambda mw, *, applied_layout: None)
+
+    assert layout_presets._apply_layout_or_default(main_window, {"state": ""}) is True
+    assert seen == [False]
+    assert main_window.updates_log == [False, True]
@@ -0,0 +1,120 @@
+"""MainWindow のレイアウト追従要求をドラッグ終了まで保留する回帰テスト。"""
+
+from __future__ import annotations
+
+import os
+from types import MethodType, SimpleNamespace
+
+from PySide6.QtCore import QEvent, QObject, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication
+
+from chroma_monitor import main_window as mw_module
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class _CountingTimer:
+    def __init__(self) -> None:
+        self.starts: list[int] = []
+        self._active = False
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def start(self, msec: int) -> None:
+        self.starts.append(int(msec))
+        self._active = True
+
+
+def _left_release_event(event_type=QEvent.MouseButtonRelease) -> QMouseEvent:
+    return QMouseEvent(
+        event_type,
+        QPointF(1.0, 1.0),
+        QPointF(1.0, 1.0),
+        Qt.LeftButton,
+        Qt.NoButton,
+        Qt.NoModifier,
+    )
+
+
+def _layout_dirty_window(scheduled: list[str]) -> SimpleNamespace:
+    main_window = SimpleNamespace(
+        _layout_dirty=mw_module._LAYOUT_DIRTY_AUTOSAVE | mw_module._LAYOUT_DIRTY_REBALANCE,
+        _layout_dirty_timer=_CountingTimer(),
+        _schedule_layout_autosave=lambda: scheduled.append("autosave"),
+        _schedule_dock_rebalance=lambda: scheduled.append("rebalance"),
+        _schedule_window_fit=lambda: scheduled.append("fit"),
+    )
+    main_window._layout_dirty_release_watcher = mw_module._MouseReleaseWatcher(
+        MethodType(mw_module.MainWindow._mark_layout_released, main_window)
+    )
+    return main_window
+
+
+def test_layout_dirty_bits_wait_for_left_button_release(monkeypatch) -> None:
+    app = _app()
+    buttons = [Qt.LeftButton]
+    monkeypatch.setattr(mw_module.QApplication, "mouseButtons", staticmethod(lambda: buttons[0]))
+    scheduled: list[str] = []
+    main_window = _layout_dirty_window(scheduled)
+    watcher = main_window._layout_dirty_release_watcher
+    target = QObject()
+
+    # ボタン押下中は要求ビットを保持し、解放待ちフィルタと再確認タイマーを仕掛ける。
+    mw_module.MainWindow._process_layout_dirty(main_window)
+    mw_module.MainWindow._process_layout_dirty(main_window)
+    assert scheduled == []
+    poll_ms = mw_module._LAYOUT_DIRTY_RELEASE_POLL_MS
+    assert main_window._layout_dirty_timer.starts == [poll_ms, poll_ms]
+    assert main_window._layout_dirty == (
+        mw_module._LAYOUT_DIRTY_AUTOSAVE | mw_module._LAYOUT_DIRTY_REBALANCE
+    )
+    assert watcher._installed is True
+
+    buttons[0] = Qt.NoButton
+    app.sendEvent(target, _left_release_event())
+    # 解放で1回だけフィルタを外し、再確認待ちのタイマーを即時実行へ張り替える。
+    assert watcher._installed is False
+    assert main_window._layout_dirty_timer.starts == [poll_ms, poll_ms, 0]
+
+    # 外れたフィルタは以降の解放イベントを受け取らない。
+    main_window._layout_dirty_timer._active = False
+    app.sendEvent(target, _left_release_event())
+    assert len(main_window._layout_dirty_timer.starts) == 3
+
+    mw_module.MainWindow._process_layout_dirty(main_window)
+    assert scheduled == ["autosave", "rebalance"]
+    assert main_window._layout_dirty == 0
+
+
+def test_layout_dirty_bits_flush_on_title_bar_release_or_poll(monkeypatch) -> None:
+    app = _app()
+    buttons = [Qt.LeftButton]
+    monkeypatch.setattr(mw_module.QApplication, "mouseButtons", staticmethod(lambda: buttons[0]))
+    scheduled: list[str] = []
+    main_window = _layout_dirty_window(scheduled)
+    watcher = main_window._layout_dirty_release_watcher
+    target = QObject()
+
+    # フローティングドックのタイトルバー移動は非クライアント領域の解放で終わる。
+    mw_module.MainWindow._process_layout_dirty(main_window)
+    app.sendEvent(target, _left_release_event(QEvent.NonClientAreaMouseButtonRelease))
+    assert watcher._installed is False
+    assert main_window._layout_dirty_timer.starts[-1] == 0
+
+    # 解放イベントが届かなくても、再確認の tick でボタン解放を検出して処理する。
+    mw_module.MainWindow._process_layout_dirty(main_window)
+    assert watcher._installed is True
+    buttons[0] = Qt.NoButton
+    mw_module.MainWindow._process_layout_dirty(main_window)
+    assert watcher._installed is False
+    assert scheduled == ["autosave", "rebalance"]
+    assert main_window._layout_dirty == 0
@@ -27,6 +27,7 @@ def test_apply_additional_theme_updates_only_non_dock_widgets(monkeypatch) -> No
         _ui_theme=None,
         preview_window=preview,
         _canvas_preview_window=canvas_preview,
+        _settings_nav=object(),
     )
 
     non_dock_theme.apply_additional_theme(main_window, "dark")
@@ -36,3 +37,17 @@ def test_apply_additional_theme_updates_only_non_dock_widgets(monkeypatch) -> No
     assert nav_calls == ["nav"]
     assert preview.calls == ["dark"]
     assert canvas_preview.calls == ["dark"]
+
+
+def test_apply_additional_theme_skips_settings_nav_before_dialog_is_built(monkeypatch) -> None:
+    nav_calls = []
+    monkeypatch.setattr(
+        "chroma_monitor.ui.settings_dialog.refresh_settings_nav_style",
+        lambda _mw: nav_calls.append("nav"),
+    )
+    main_window = SimpleNamespace(_ui_theme_name="light", _ui_theme=None)
+
+    non_dock_theme.apply_additional_theme(main_window, "dark")
+
+    assert main_window._ui_theme_name == "dark"
+    assert nav_calls == []
@@ -0,0 +1,56 @@
+"""PreviewWindow の再描画スキップ回帰テスト。"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from chroma_monitor.views import preview
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _app() -> QApplication:
+    """offscreen テスト用の `QApplication` を返す。"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+def test_update_preview_skips_render_for_identical_frame_content(monkeypatch) -> None:
+    _app()
+    renders: list[tuple[int, int]] = []
+
+    def _fake_render(bgr, *, max_w, max_h):
+        renders.append((max_w, max_h))
+        return QPixmap(4, 4)
+
+    monkeypatch.setattr(preview, "bgr_to_qpixmap", _fake_render)
+    window = preview.PreviewWindow()
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+
+    window.update_preview(frame)
+    window.update_preview(frame.copy())
+    assert len(renders) == 1
+
+    changed = frame.copy()
+    changed[1, 1] = (0, 0, 255)
+    window.update_preview(changed)
+    assert len(renders) == 2
+
+    window.show_placeholder("waiting")
+    window.update_preview(changed.copy())
+    assert len(renders) == 3
+    window.deleteLater()
+
+
+def test_same_frame_content_rejects_shape_and_dtype_mismatch() -> None:
+    frame = np.zeros((8, 8, 3), dtype=np.uint8)
+
+    assert preview._same_frame_content(frame, frame.copy()) is True
+    assert preview._same_frame_content(frame, np.zeros((8, 9, 3), dtype=np.uint8)) is False
+    assert preview._same_frame_content(frame, frame.astype(np.float32)) is False
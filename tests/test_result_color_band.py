@@ -1,10 +1,20 @@
 """配色比率詳細の純粋計算ロジックの回帰テスト。"""
 
+import os
+from types import SimpleNamespace
+
+from PySide6.QtWidgets import QApplication
+
 from chroma_monitor.ui.main_window.result_color_band import (
+    TopColorBarWidget,
     compute_color_band_compact_visibility,
     compute_color_band_detail_state,
+    refresh_top_color_bar,
 )
 from chroma_monitor.util import constants as C
+from chroma_monitor.util.theme import get_ui_theme
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 
 def test_compute_color_band_detail_state_for_empty_selection() -> None:
@@ -75,3 +85,28 @@ def test_compute_color_band_compact_visibility_uses_detail_state() -> None:
     assert visibility.show_harmony is True
     assert visibility.show_complement is True
     assert visibility.show_color_models is True
+
+
+def test_top_color_bar_paints_segments_at_the_current_width() -> None:
+    if QApplication.instance() is None:
+        QApplication([])
+    bar = TopColorBarWidget()
+    bar.resize(200, C.TOP_COLOR_BAR_HEIGHT)
+    main_window = SimpleNamespace(
+        top_colors_bar=bar,
+        _last_top_bars=[(0.5, (255, 0, 0)), (0.5, (0, 0, 255))],
+        _last_top_bars_key=None,
+        _ui_theme=get_ui_theme(),
+    )
+
+    refresh_top_color_bar(main_window)
+    first_bars = bar._bars
+    refresh_top_color_bar(main_window)
+    assert bar._bars is first_bars
+
+    bar.resize(400, C.TOP_COLOR_BAR_HEIGHT)
+    image = bar.grab().toImage()
+    mid_y = image.height() // 2
+    assert image.pixelColor(100, mid_y).red() == 255
+    assert image.pixelColor(300, mid_y).blue() == 255
+    bar.deleteLater()
@@ -7,7 +7,9 @@ from types import SimpleNamespace
 import numpy as np
 import pytest
 
+from chroma_monitor.analysis.result_payloads import AnalyzerResult
 from chroma_monitor.ui.main_window import result_snapshot
+from chroma_monitor.util.image_ops import resize_by_long_edge
 
 
 class _FakeThread:
@@ -193,3 +195,139 @@ def test_restore_dock_from_snapshot_immediately_renders_from_cached_bgr(
         assert main_window.hist_h.hist is not None
         assert main_window.hist_s.hist is not None
         assert main_window.hist_v.hist is not None
+
+
+@pytest.mark.parametrize(
+    "dock_name",
+    ("dock_color", "dock_scatter", "dock_hist"),
+)
+def test_restore_dock_from_snapshot_captures_once_while_worker_stopped(
+    monkeypatch: pytest.MonkeyPatch,
+    dock_name: str,
+) -> None:
+    main_window = _build_main_window(worker_running=False)
+    main_window._latest_result_snapshot["bgr_preview"] = None
+    bgr = _sample_bgr_preview()
+    monkeypatch.setattr(result_snapshot, "is_widget_renderable", lambda _widget: True)
+
+    def _capture_once():
+        main_window.worker.capture_once_calls += 1
+        return bgr, (0, 0, 8, 8), None
+
+    main_window.worker.capture_once = _capture_once
+
+    result_snapshot.restore_dock_from_snapshot(
+        main_window,
+        main_window._dock_map[dock_name],
+        force=True,
+    )
+
+    snapshot = main_window._latest_result_snapshot
+    assert main_window.worker.capture_once_calls == 1
+    assert snapshot["bgr_preview"] is bgr
+    assert snapshot["cap"] == (0, 0, 8, 8)
+    if dock_name == "dock_color":
+        assert main_window.wheel.hist is not None
+    elif dock_name == "dock_scatter":
+        assert main_window.scatter.sv is not None
+    else:
+        assert main_window.hist_h.hist is not None
+
+
+def test_store_result_snapshot_keeps_previous_dt_when_result_has_no_timing() -> None:
+    main_window = SimpleNamespace()
+    hist = np.ones(180, dtype=np.float32)
+    result_snapshot._store_result_snapshot(
+        main_window,
+        AnalyzerResult(hist=hist, dt_ms=4.5, cap=(0, 0, 8, 8), graph_update=True),
+    )
+
+    snap, version = result_snapshot._store_result_snapshot(
+        main_window,
+        AnalyzerResult.from_payload({"sv": np.zeros((1, 2))}, graph_update=True),
+        update_bgr=False,
+    )
+
+    assert version == 2
+    assert snap["dt_ms"] == 4.5
+    assert snap["cap"] == (0, 0, 8, 8)
+    assert snap["hist"] is hist
+    assert snap["sv"] is not None
+
+
+def test_store_result_snapshot_updates_latest_snapshot_in_place() -> None:
+    main_window = SimpleNamespace()
+    first, _ = result_snapshot._store_result_snapshot(main_window, AnalyzerResult(dt_ms=1.0))
+    second, version = result_snapshot._store_result_snapshot(main_window, AnalyzerResult(dt_ms=2.0))
+
+    assert second is first
+    assert main_window._latest_result_snapshot is first
+    assert version == 2
+    assert first["dt_ms"] == 2.0
+
+
+class _ConsumeCountingWorker:
+    def __init__(self) -> None:
+        self.consumed_calls = 0
+
+    def mark_result_consumed(self) -> None:
+        self.consumed_calls += 1
+
+
+class _RaisingPreview:
+    def isVisible(self) -> bool:
+        raise RuntimeError("render failed")
+
+
+def test_on_result_releases_worker_once_before_rendering() -> None:
+    worker = _ConsumeCountingWorker()
+    main_window = SimpleNamespace(worker=worker, preview_window=_RaisingPreview())
+
+    with pytest.raises(RuntimeError):
+        result_snapshot.on_result(main_window, AnalyzerResult(dt_ms=1.0))
+
+    # 描画中の例外でも解放は1回だけで、後続フレームの未消費フラグを消さない。
+    assert worker.consumed_calls == 1
+    assert main_window._latest_result_version == 1
+
+
+def test_on_result_keeps_cache_entries_added_after_worker_release(monkeypatch) -> None:
+    next_frame = np.zeros((200, 300, 3), dtype=np.uint8)
+    cached: list[np.ndarray] = []
+
+    class _ResumingWorker:
+        def mark_result_consumed(self) -> None:
+            # 解放直後に解析スレッドが次フレームを縮小してキャッシュへ積んだ状態を再現する。
+            cached.append(resize_by_long_edge(next_frame, 100))
+
+    monkeypatch.setattr(result_snapshot, "update_image_docks_from_frame", lambda _mw, _bgr: set())
+    main_window = SimpleNamespace(
+        worker=_ResumingWorker(),
+        preview_window=SimpleNamespace(isVisible=lambda: False),
+    )
+
+    result_snapshot.on_result(main_window, AnalyzerResult(dt_ms=1.0))
+
+    assert resize_by_long_edge(next_frame, 100) is cached[0]
+
+
+def test_enqueue_result_coalesces_to_latest_with_single_flush(monkeypatch) -> None:
+    starts: list[bool] = []
+    handled: list[AnalyzerResult] = []
+    monkeypatch.setattr(result_snapshot, "on_result", lambda _mw, res: handled.append(res))
+    main_window = SimpleNamespace(
+        _pending_result=None,
+        _result_flush_scheduled=False,
+        _result_flush_timer=SimpleNamespace(start=lambda: starts.append(True)),
+    )
+    older = AnalyzerResult(dt_ms=1.0)
+    latest = AnalyzerResult(dt_ms=2.0)
+
+    result_snapshot.enqueue_result(main_window, older)
+    result_snapshot.enqueue_result(main_window, latest)
+    assert len(starts) == 1
+
+    result_snapshot.drain_pending_result(main_window)
+    assert handled == [latest]
+    assert main_window._pending_result is None
+    assert main_window._result_flush_scheduled is False
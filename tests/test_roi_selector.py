@@ -0,0 +1,47 @@
+"""RoiSelector のドラッグ中再描画範囲の回帰テスト。"""
+
+from __future__ import annotations
+
+import os
+
+from PySide6.QtCore import QPoint, QPointF, QRect
+from PySide6.QtWidgets import QApplication
+
+from chroma_monitor.views.roi_selector import RoiSelector
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+def _app() -> QApplication:
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+class _FakeMoveEvent:
+    def __init__(self, x: int, y: int) -> None:
+        self._pos = QPointF(x, y)
+
+    def position(self) -> QPointF:
+        return self._pos
+
+
+def test_drag_update_repaints_only_old_and_new_selection_area(monkeypatch) -> None:
+    _app()
+    selector = RoiSelector(bounds=QRect(0, 0, 800, 600))
+    selector._dragging = True
+    selector._start_local = QPoint(100, 100)
+    selector._end_local = QPoint(150, 140)
+    old_area = selector._selection_paint_rect()
+    updates: list = []
+    monkeypatch.setattr(selector, "update", lambda *args: updates.append(args))
+
+    assert selector._update_selection(_FakeMoveEvent(220, 180)) is True
+
+    assert len(updates) == 1
+    (dirty,) = updates[0]
+    assert dirty.contains(old_area)
+    assert dirty.contains(QRect(QPoint(100, 100), QPoint(220, 180)))
+    assert not dirty.contains(selector.rect())
+    selector.deleteLater()
@@ -59,6 +59,12 @@ class FakeCombo:
     def addItem(self, title: str, data: int | None) -> None:
         self._items.append((str(title), data))
 
+    def addItems(self, titles: list[str]) -> None:
+        self._items.extend((str(title), None) for title in titles)
+
+    def setItemData(self, index: int, data: int | None) -> None:
+        self._items[int(index)] = (self._items[int(index)][0], data)
+
     def itemData(self, index: int):
         if 0 <= int(index) < len(self._items):
             return self._items[int(index)][1]
@@ -288,3 +294,39 @@ def test_capture_preflight_result_returns_not_ready_for_screen_without_roi() ->
 
     assert result.ready is False
     assert result.message == "キャプチャ領域を選択してください"
+
+
+def test_rebuilt_window_items_resolve_text_through_casefold_index(monkeypatch) -> None:
+    combo = FakeCombo()
+    runtime_capture._rebuild_window_combo_items(combo, [(11, "Renderer"), (22, "Scope View")])
+    assert combo._chroma_casefold_titles == ("renderer", "scope view")
+
+    def _fail_item_text(_index: int) -> str:
+        raise AssertionError("indexed lookup must not read item texts")
+
+    monkeypatch.setattr(combo, "itemText", _fail_item_text)
+
+    assert runtime_capture._find_combo_index_for_text(combo, "SCOPE VIEW", allow_partial=False) == 1
+    assert runtime_capture._find_combo_index_for_text(combo, "scope", allow_partial=True) == 1
+    assert runtime_capture._find_combo_index_for_text(combo, "e", allow_partial=True) == -1
+
+
+def test_refresh_windows_skips_rebuild_when_window_list_is_unchanged(monkeypatch) -> None:
+    combo = FakeCombo()
+    main_window = SimpleNamespace(combo_win=combo)
+    _patch_refresh_dependencies(
+        monkeypatch,
+        list_windows_result=[(11, "Renderer"), (22, "Scope")],
+        window_source=True,
+    )
+    runtime_capture.refresh_windows(main_window, announce=False, force=True)
+    assert combo.count() == 2
+
+    def _fail_clear() -> None:
+        raise AssertionError("unchanged window list must not rebuild the combo")
+
+    monkeypatch.setattr(combo, "clear", _fail_clear)
+    runtime_capture.refresh_windows(main_window, announce=False, force=True)
+
+    assert combo.count() == 2
+    assert combo._chroma_window_items == ((11, "Renderer"), (22, "Scope"))
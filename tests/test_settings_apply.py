@@ -0,0 +1,128 @@
+"""settings_apply の行同期まとめ処理の回帰テスト。"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from chroma_monitor.ui.main_window import settings_apply
+
+
+class _FakeSettingsWindow:
+    def __init__(self) -> None:
+        self._enabled = True
+        self.toggles: list[bool] = []
+
+    def updatesEnabled(self) -> bool:
+        return self._enabled
+
+    def setUpdatesEnabled(self, enabled: bool) -> None:
+        self._enabled = bool(enabled)
+        self.toggles.append(self._enabled)
+
+
+def test_sync_all_mode_rows_runs_row_syncs_with_updates_suspended_once(monkeypatch) -> None:
+    window = _FakeSettingsWindow()
+    main_window = SimpleNamespace(_settings_window=window)
+    calls: list[tuple[str, bool]] = []
+    for name in (
+        "sync_analysis_resolution_rows",
+        "sync_mode_dependent_rows",
+        "sync_squint_mode_rows",
+    ):
+        monkeypatch.setattr(
+            settings_apply,
+            name,
+            lambda _mw, n=name: calls.append((n, window.updatesEnabled())),
+        )
+
+    settings_apply.sync_all_mode_rows(main_window)
+
+    assert [name for name, _enabled in calls] == [
+        "sync_analysis_resolution_rows",
+        "sync_mode_dependent_rows",
+        "sync_squint_mode_rows",
+    ]
+    assert all(enabled is False for _name, enabled in calls)
+    assert window.toggles == [False, True]
+
+
+def test_sync_all_mode_rows_works_before_settings_window_exists(monkeypatch) -> None:
+    calls: list[str] = []
+    for name, tag in (
+        ("sync_analysis_resolution_rows", "res"),
+        ("sync_mode_dependent_rows", "mode"),
+        ("sync_squint_mode_rows", "squint"),
+    ):
+        monkeypatch.setattr(settings_apply, name, lambda _mw, t=tag: calls.append(t))
+
+    settings_apply.sync_all_mode_rows(SimpleNamespace())
+
+    assert calls == ["res", "mode", "squint"]
+
+
+def test_apply_mode_settings_syncs_rows_in_one_suspended_repaint(monkeypatch) -> None:
+    window = _FakeSettingsWindow()
+    configured: list[dict] = []
+    saves: list[bool] = []
+    main_window = SimpleNamespace(
+        _settings_window=window,
+        worker=SimpleNamespace(configure=lambda **kw: configured.append(kw)),
+        _request_save_settings=lambda: saves.append(True),
+    )
+    synced: list[bool] = []
+    monkeypatch.setattr(settings_apply, "selected_mode", lambda _mw: "change")
+    monkeypatch.setattr(settings_apply, "selected_diff_threshold", lambda _mw: 3.0)
+    monkeypatch.setattr(settings_apply, "selected_stable_frames", lambda _mw: 2)
+    monkeypatch.setattr(
+        settings_apply,
+        "sync_mode_dependent_rows",
+        lambda _mw: synced.append(window.updatesEnabled()),
+    )
+
+    settings_apply.apply_mode_settings(main_window)
+    settings_apply.apply_mode_settings(main_window, save=False)
+
+    assert configured[0] == {"mode": "change", "diff_threshold": 3.0, "stable_frames": 2}
+    assert synced == [False, False]
+    assert window.toggles == [False, True, False, True]
+    assert saves == [True]
+
+
+class _FakeWarningLabel:
+    def __init__(self) -> None:
+        self._text = ""
+        self._level = "muted"
+        self.reads = 0
+
+    def text(self) -> str:
+        self.reads += 1
+        return self._text
+
+    def setText(self, text: str) -> None:
+        self._text = text
+
+    def property(self, _name: str):
+        return self._level
+
+    def setProperty(self, _name: str, value) -> None:
+        self._level = value
+
+
+def test_vectorscope_warning_label_skips_unchanged_ratio_and_threshold(monkeypatch) -> None:
+    ratios = [0.0, 0.0, 2.5]
+    label = _FakeWarningLabel()
+    main_window = SimpleNamespace(
+        vectorscope_view=SimpleNamespace(high_saturation_ratio=lambda: ratios.pop(0)),
+        spin_vectorscope_warn_threshold=SimpleNamespace(value=lambda: 80),
+        lbl_vectorscope_warning=label,
+    )
+    monkeypatch.setattr("chroma_monitor.util.theme.refresh_widget_style", lambda _w: None)
+
+    settings_apply.update_vectorscope_warning_label(main_window)
+    settings_apply.update_vectorscope_warning_label(main_window)
+    assert label.reads == 1
+    assert label.text() == "高彩度警告: なし"
+
+    settings_apply.update_vectorscope_warning_label(main_window)
+    assert label._text == "高彩度警告: しきい値(80%)超え 2.5%"
+    assert label._level == "warn"
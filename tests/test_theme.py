@@ -94,3 +94,10 @@ def test_build_app_stylesheet_includes_dark_theme_selectors() -> None:
     assert "border-top-left-radius:4px;" not in dark
     assert "border-top-right-radius:4px;" not in dark
     assert dark != light
+
+
+def test_app_stylesheet_styles_dock_tab_close_button_by_object_name() -> None:
+    stylesheet = build_app_stylesheet(get_ui_theme(None))
+
+    assert "QToolButton#dockTabCloseButton {" in stylesheet
+    assert "QToolButton#dockTabCloseButton:hover {" in stylesheet
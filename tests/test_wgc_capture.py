@@ -0,0 +1,89 @@
+"""WGC キャプチャ補助の純粋ロジックテスト。"""
+
+import numpy as np
+
+from chroma_monitor.capture import wgc_capture
+
+
+def test_bgra_plane_to_bgr_honors_offset_stride_and_content_size() -> None:
+    height, width, stride, offset = 3, 2, 16, 4
+    raw = np.zeros(offset + stride * height, dtype=np.uint8)
+    rows = raw[offset:].reshape(height, stride)
+    for y in range(height):
+        for x in range(width):
+            rows[y, x * 4 : x * 4 + 4] = (10 * y + x, 100 + y, 200 + x, 255)
+    rows[:, width * 4 :] = 77
+
+    bgr = wgc_capture._bgra_plane_to_bgr(
+        raw, offset=offset, stride=stride, width=width, height=height
+    )
+
+    assert bgr is not None
+    assert bgr.shape == (height, width, 3)
+    assert bgr.flags.c_contiguous
+    np.testing.assert_array_equal(bgr[2, 1], (21, 102, 201))
+    assert wgc_capture._bgra_plane_to_bgr(
+        raw, offset=offset, stride=4, width=width, height=height
+    ) is None
+
+
+def test_capture_window_bgr_returns_none_without_winrt(monkeypatch) -> None:
+    monkeypatch.setattr(wgc_capture, "_winrt_api", lambda: None)
+
+    assert wgc_capture.capture_window_bgr(1234) is None
+
+
+class _FakeSession:
+    created: list[int] = []
+
+    def __init__(self, _api, hwnd: int) -> None:
+        self.hwnd = int(hwnd)
+        self.closed = False
+        _FakeSession.created.append(self.hwnd)
+
+    def grab(self):
+        raise RuntimeError("window destroyed")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _patch_fake_api(monkeypatch, session_cls) -> list[float]:
+    clock = [100.0]
+    monkeypatch.setattr(wgc_capture, "_winrt_api", lambda: object())
+    monkeypatch.setattr(wgc_capture, "_WgcWindowSession", session_cls)
+    monkeypatch.setattr(wgc_capture, "_active_session", None)
+    monkeypatch.setattr(wgc_capture, "_failed_hwnds", {})
+    monkeypatch.setattr(wgc_capture.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_failed_session_falls_back_and_retries_after_interval(monkeypatch) -> None:
+    attempts: list[int] = []
+
+    def _failing_session(_api, hwnd: int):
+        attempts.append(int(hwnd))
+        raise OSError("capture item unavailable")
+
+    clock = _patch_fake_api(monkeypatch, _failing_session)
+
+    assert wgc_capture.capture_window_bgr(42) is None
+    assert wgc_capture.capture_window_bgr(42) is None
+    assert attempts == [42]
+
+    clock[0] += wgc_capture._WGC_RETRY_AFTER_SEC
+    assert wgc_capture.capture_window_bgr(42) is None
+    assert attempts == [42, 42]
+
+
+def test_grab_error_closes_session_and_uses_fallback(monkeypatch) -> None:
+    _FakeSession.created = []
+    _patch_fake_api(monkeypatch, _FakeSession)
+
+    assert wgc_capture.capture_window_bgr(7) is None
+    assert wgc_capture._active_session is None
+    assert wgc_capture.capture_window_bgr(7) is None
+    assert _FakeSession.created == [7]
+
+    wgc_capture.close_capture_sessions()
+    assert wgc_capture._failed_hwnds == {}
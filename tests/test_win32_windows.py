@@ -0,0 +1,54 @@
+"""win32_windows のウィンドウ列挙キャッシュ回帰テスト。"""
+
+from __future__ import annotations
+
+import threading
+
+from chroma_monitor.capture import win32_windows
+
+
+def _patch_enumeration(monkeypatch, result: list[tuple[int, str]]) -> list[str]:
+    threads: list[str] = []
+
+    def _enumerate() -> list[tuple[int, str]]:
+        threads.append(threading.current_thread().name)
+        return list(result)
+
+    monkeypatch.setattr(win32_windows, "HAS_WIN32", True)
+    monkeypatch.setattr(win32_windows, "_enumerate_windows_sorted", _enumerate)
+    monkeypatch.setattr(win32_windows, "_list_windows_cache", None)
+    monkeypatch.setattr(win32_windows, "_list_windows_prefetch", None)
+    return threads
+
+
+def test_list_windows_uses_prefetched_result_from_background_thread(monkeypatch) -> None:
+    threads = _patch_enumeration(monkeypatch, [(11, "Renderer")])
+
+    win32_windows.prefetch_list_windows()
+    win32_windows.prefetch_list_windows()
+
+    assert win32_windows.list_windows() == [(11, "Renderer")]
+    assert threads == ["list-windows-prefetch"]
+    assert win32_windows._list_windows_prefetch is None
+
+
+def test_explicit_refresh_during_startup_still_uses_prefetch(monkeypatch) -> None:
+    threads = _patch_enumeration(monkeypatch, [(22, "Scope")])
+
+    win32_windows.prefetch_list_windows()
+    # 起動時の復元は announce 付きの再取得でキャッシュを捨ててから列挙する。
+    win32_windows.clear_list_windows_cache()
+
+    assert win32_windows.list_windows() == [(22, "Scope")]
+    assert threads == ["list-windows-prefetch"]
+
+
+def test_discarded_prefetch_falls_back_to_fresh_enumeration(monkeypatch) -> None:
+    threads = _patch_enumeration(monkeypatch, [(33, "Editor")])
+
+    win32_windows.prefetch_list_windows()
+    win32_windows.discard_list_windows_prefetch()
+
+    assert win32_windows.list_windows() == [(33, "Editor")]
+    assert threads.count(threading.current_thread().name) == 1
+    assert win32_windows._list_windows_prefetch is None
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import os
+from types import SimpleNamespace
 
-from PySide6.QtCore import QRect
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QRect, Qt, QTimer
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QApplication, QDockWidget, QMainWindow
 
+from chroma_monitor.ui import view_docks
 from chroma_monitor.ui.main_window import window_layout
 from chroma_monitor.ui.main_window.window_layout import (
     _DOCK_OPTIONS_BASE,
@@ -124,3 +127,170 @@ def test_sync_dock_options_ignores_hidden_floating_drag_transition(monkeypatch)
 
     assert main_window.dockOptions() == _DOCK_OPTIONS_BASE
     assert main_window._set_options_calls == []
+
+
+class _FakeStartTimer:
+    def __init__(self) -> None:
+        self.start_calls = 0
+
+    def start(self) -> None:
+        self.start_calls += 1
+
+
+def test_dock_top_level_changes_apply_last_state_once_per_dock(monkeypatch) -> None:
+    applied: list[tuple[object, bool]] = []
+    monkeypatch.setattr(
+        window_layout,
+        "on_dock_top_level_changed",
+        lambda _mw, dock, floating: applied.append((dock, floating)),
+    )
+    main_window = type("MW", (), {})()
+    main_window._pending_dock_top_level = {}
+    main_window._dock_top_level_timer = _FakeStartTimer()
+    first = object()
+    second = object()
+
+    window_layout.schedule_dock_top_level_changed(main_window, first, True)
+    window_layout.schedule_dock_top_level_changed(main_window, second, True)
+    window_layout.schedule_dock_top_level_changed(main_window, first, False)
+    assert applied == []
+
+    window_layout.flush_dock_top_level_changes(main_window)
+    assert applied == [(first, False), (second, True)]
+    assert main_window._pending_dock_top_level == {}
+
+
+def test_dockability_sync_is_scheduled_only_with_floating_docks(monkeypatch) -> None:
+    scheduled: list[object] = []
+    monkeypatch.setattr(
+        window_layout,
+        "schedule_floating_dock_dockability_sync",
+        lambda mw: scheduled.append(mw),
+    )
+    docked = _FakeMainWindow(_FakeDock(floating=False), _FakeDock(floating=False))
+    floating = _FakeMainWindow(_FakeDock(floating=False), _FakeDock(visible=False))
+
+    window_layout.schedule_floating_dock_dockability_sync_if_floating(docked)
+    window_layout.schedule_floating_dock_dockability_sync_if_floating(floating)
+
+    assert scheduled == [floating]
+
+
+def test_default_area_for_dock_uses_registered_name_lookup() -> None:
+    known = _FakeDock()
+    main_window = _FakeMainWindow(known)
+    main_window._dock_name_by_object = {known: "dock_0"}
+    main_window._dock_default_areas = {"dock_0": Qt.BottomDockWidgetArea}
+    # 逆引き辞書がある場合は _dock_map を走査しない。
+    main_window._dock_map = {}
+
+    assert window_layout._default_area_for_dock(main_window, known) == Qt.BottomDockWidgetArea
+    assert window_layout._default_area_for_dock(main_window, _FakeDock()) == Qt.RightDockWidgetArea
+
+
+def test_update_placeholder_skips_widget_updates_when_state_is_unchanged(monkeypatch) -> None:
+    class _FakeWidget:
+        def __init__(self) -> None:
+            self.calls: list[str] = []
+
+        def __getattr__(self, name):
+            return lambda *_args: self.calls.append(name)
+
+    dock = _FakeDock(visible=True, floating=False)
+    main_window = _FakeMainWindow(dock)
+    main_window.placeholder = _FakeWidget()
+    main_window.central_container = _FakeWidget()
+    main_window.dockWidgetArea = lambda _dock: Qt.RightDockWidgetArea
+    monkeypatch.setattr(window_layout, "_apply_main_window_minimum", lambda _mw, _visible: None)
+
+    window_layout.update_placeholder(main_window)
+    first_calls = list(main_window.central_container.calls)
+    window_layout.update_placeholder(main_window)
+
+    assert "hide" in first_calls
+    assert main_window.central_container.calls == first_calls
+    assert main_window._placeholder_state == (True, False)
+
+
+class _PlaceholderWindow(QMainWindow):
+    _schedule_placeholder_update = window_layout.schedule_placeholder_update
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.placeholder_updates = 0
+        self._placeholder_update_timer = QTimer(self)
+        self._placeholder_update_timer.setSingleShot(True)
+        self._placeholder_update_timer.setInterval(0)
+        self._placeholder_update_timer.timeout.connect(self.update_placeholder)
+
+    def update_placeholder(self) -> None:
+        self.placeholder_updates += 1
+
+    def _schedule_window_menu_checks_sync(self) -> None:
+        pass
+
+    def _sync_tabbed_dock_title_bars(self) -> None:
+        pass
+
+    def _schedule_layout_autosave(self) -> None:
+        pass
+
+    def _restore_dock_from_snapshot(self, _dock) -> None:
+        pass
+
+
+def test_placeholder_update_from_dock_visibility_runs_once_per_event_loop_turn() -> None:
+    app = _app()
+    main_window = _PlaceholderWindow()
+    docks = [QDockWidget(f"dock {idx}", main_window) for idx in range(3)]
+    for dock in docks:
+        view_docks._configure_view_dock(main_window, dock)
+
+    for visible in (True, False, True):
+        for dock in docks:
+            dock.visibilityChanged.emit(visible)
+    assert main_window.placeholder_updates == 0
+    app.processEvents()
+
+    assert main_window.placeholder_updates == 1
+
+
+def test_sync_window_menu_checks_matches_visibility_without_emitting() -> None:
+    _app()
+    shown = _FakeDock(visible=True, floating=False)
+    hidden = _FakeDock(visible=False, floating=False)
+    main_window = _FakeMainWindow(shown, hidden)
+    actions = {"dock_0": QAction("shown"), "dock_1": QAction("hidden")}
+    toggled: list[str] = []
+    for name, act in actions.items():
+        act.setCheckable(True)
+        act.setChecked(True)
+        act.changed.connect(lambda n=name: toggled.append(n))
+    main_window._dock_actions = actions
+
+    window_layout.sync_window_menu_checks(main_window)
+
+    assert actions["dock_0"].isChecked() is True
+    assert actions["dock_1"].isChecked() is False
+    assert toggled == []
+
+
+def test_register_docks_builds_per_dock_toggle_actions() -> None:
+    toggles: list[tuple[object, bool]] = []
+    main_window = SimpleNamespace(
+        toggle_dock=lambda dock, visible: toggles.append((dock, visible)),
+    )
+    wheel, scatter = object(), object()
+
+    view_docks._register_docks(
+        main_window,
+        [
+            ("dock_wheel", wheel, Qt.RightDockWidgetArea),
+            ("dock_scatter", scatter, Qt.LeftDockWidgetArea),
+        ],
+    )
+    main_window._toggle_actions["dock_scatter"](True)
+    main_window._toggle_actions["dock_wheel"](False)
+
+    assert toggles == [(scatter, True), (wheel, False)]
+    assert main_window._dock_name_by_object[scatter] == "dock_scatter"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 from PySide6.QtCore import QRect, QSize, Qt
 
 from chroma_monitor.ui.main_window import window_layout
@@ -180,3 +182,37 @@ def test_fit_top_level_widget_to_desktop_uses_hidden_geometry_without_frame_geom
     assert widget.geometry() == QRect(340, 220, 420, 320)
 
 
+def _watch_without_connecting(main_window) -> None:
+    # 実アプリの QGuiApplication シグナルへ部分適用スロットを残さないよう、接続を省く。
+    main_window._desktop_geometry_watched = True
+
+
+def test_desktop_available_geometry_is_cached_until_screens_change(monkeypatch) -> None:
+    calls: list[bool] = []
+    rects = [QRect(), QRect(0, 0, 1920, 1040)]
+    monkeypatch.setattr(
+        window_layout,
+        "screen_union_geometry",
+        lambda available=False: calls.append(available) or QRect(rects[0]),
+    )
+    monkeypatch.setattr(window_layout, "_watch_desktop_geometry_changes", _watch_without_connecting)
+    main_window = SimpleNamespace(_desktop_available_geometry=None, _desktop_geometry_watched=False)
+
+    # 画面構成の切替中などに得た空の領域はキャッシュしない。
+    assert window_layout.desktop_available_geometry(main_window).isEmpty()
+    assert main_window._desktop_available_geometry is None
+    rects.pop(0)
+    calls.clear()
+
+    first = window_layout.desktop_available_geometry(main_window)
+    first.setWidth(10)
+    second = window_layout.desktop_available_geometry(main_window)
+
+    assert calls == [True]
+    assert second == QRect(0, 0, 1920, 1040)
+    assert main_window._desktop_geometry_watched is True
+
+    window_layout.invalidate_desktop_available_geometry(main_window)
+    window_layout.desktop_available_geometry(main_window)
+
+    assert calls == [True, True]